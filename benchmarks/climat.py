@@ -0,0 +1,30 @@
+"""Benchmarks of the observations"""
+
+from __future__ import annotations
+
+import random
+
+from meteole.climat import sort_stations_by_distance
+
+
+class SortStations:
+    """Sort stations by distance to a point, from the stations of a departement to the whole network."""
+
+    params = [100, 5_000]
+    param_names = ["stations"]
+
+    def setup(self, stations: int) -> None:
+        """Scatter the stations over France."""
+        generator = random.Random(0)
+        self.stations = [
+            {"id": f"{index:08d}", "lat": generator.uniform(41.3, 51.1), "lon": generator.uniform(-5.1, 9.6)}
+            for index in range(stations)
+        ]
+
+    def time_sort_stations_by_distance(self, stations: int) -> None:
+        """Time `sort_stations_by_distance`."""
+        sort_stations_by_distance(48.85, 2.35, self.stations)
+
+    def peakmem_sort_stations_by_distance(self, stations: int) -> None:
+        """Peak memory of `sort_stations_by_distance`."""
+        sort_stations_by_distance(48.85, 2.35, self.stations)
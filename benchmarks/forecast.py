@@ -0,0 +1,183 @@
+"""Benchmarks of the forecasts: capabilities, GRIB decoding, formatting, merging and ensemble fan-out
+
+Every payload is synthetic, see `meteole.testing`: the benchmarks run offline.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from meteole import AromeForecast, AromePEForecast
+from meteole.clients import MeteoFranceClient
+from meteole.testing import Indicator, StandInPortal, make_grib
+
+RUN = dt.datetime(2026, 1, 1, 6)
+
+# Grids of the GRIB files: a few points around a city, and the whole of France at the resolution of AROME (0.025°)
+GRIDS: dict[str, tuple[int, int]] = {"city": (5, 5), "france": (717, 1121)}
+FRANCE_LATITUDES = (37.5, 55.4)
+FRANCE_LONGITUDES = (-12.0, 16.0)
+
+# Parameters of the indicators merged by `get_combined_coverage`, as GRIB (discipline, category, number)
+INDICATOR_PARAMETERS: list[tuple[int, int, int]] = [(0, 0, 0), (0, 1, 1), (0, 2, 1), (0, 2, 2), (0, 2, 3)]
+
+
+def capabilities_xml(coverages: int) -> str:
+    """Build a GetCapabilities document of `coverages` coverages, over the runs of the last days."""
+    summaries = []
+    for index in range(coverages):
+        indicator = f"INDICATOR_{index // 200}__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"
+        run = RUN - dt.timedelta(hours=3 * (index // 2 % 100))
+        interval = "_PT1H" if index % 2 else ""
+        coverage_id = f"{indicator}___{run:%Y-%m-%dT%H.%M.%SZ}{interval}"
+        summaries.append(
+            "<wcs:CoverageSummary>"
+            f"<wcs:CoverageId>{coverage_id}</wcs:CoverageId>"
+            f"<ows:Title>{indicator.replace('_', ' ').lower()}</ows:Title>"
+            "<ows:WGS84BoundingBox><ows:LowerCorner>-12 37.5</ows:LowerCorner>"
+            "<ows:UpperCorner>16 55.4</ows:UpperCorner></ows:WGS84BoundingBox>"
+            "<wcs:CoverageSubtype>ReferenceableGridCoverage</wcs:CoverageSubtype>"
+            "</wcs:CoverageSummary>"
+        )
+    return f"<wcs:Capabilities><wcs:Contents>{''.join(summaries)}</wcs:Contents></wcs:Capabilities>"
+
+
+def grib(grid: str, param: tuple[int, int, int] = (0, 0, 0)) -> bytes:
+    """Build a GRIB file of an indicator at 2 m above ground, from the north-west corner of France."""
+    return make_grib(
+        param=param, shape=GRIDS[grid], origin=(FRANCE_LATITUDES[1], FRANCE_LONGITUDES[0]), increment=0.025
+    )
+
+
+class Capabilities:
+    """Parse GetCapabilities documents, from a single model and run to the days of runs of all the indicators."""
+
+    params = [100, 2_000, 20_000]
+    param_names = ["coverages"]
+
+    def setup(self, coverages: int) -> None:
+        """Build the document and the forecast."""
+        self.xml = capabilities_xml(coverages)
+        self.forecast = AromeForecast(MeteoFranceClient(api_key="benchmark"))
+
+    def time_parse_capabilities(self, coverages: int) -> None:
+        """Time `_parse_capabilities`."""
+        self.forecast._parse_capabilities(self.xml)
+
+    def peakmem_parse_capabilities(self, coverages: int) -> None:
+        """Peak memory of `_parse_capabilities`."""
+        self.forecast._parse_capabilities(self.xml)
+
+
+class GribDecoding:
+    """Decode GetCoverage responses into DataFrames."""
+
+    params = list(GRIDS)
+    param_names = ["grid"]
+
+    def setup(self, grid: str) -> None:
+        """Build the GRIB file and the forecast."""
+        self.grib = grib(grid)
+        self.forecast = AromeForecast(MeteoFranceClient(api_key="benchmark"))
+
+    def time_grib_bytes_to_df(self, grid: str) -> None:
+        """Time `_grib_bytes_to_df`."""
+        self.forecast._grib_bytes_to_df(self.grib)
+
+    def peakmem_grib_bytes_to_df(self, grid: str) -> None:
+        """Peak memory of `_grib_bytes_to_df`."""
+        self.forecast._grib_bytes_to_df(self.grib)
+
+
+class Formatting:
+    """Filter, rename and drop the columns of decoded GRIB files, as `_get_data_single_forecast` does."""
+
+    params = list(GRIDS)
+    param_names = ["grid"]
+    # The columns are renamed in place: each call needs a new DataFrame, built by `setup`
+    number = 1
+    repeat = (10, 50, 20.0)
+    warmup_time = 0
+
+    def setup(self, grid: str) -> None:
+        """Decode the GRIB file."""
+        self.forecast = AromeForecast(MeteoFranceClient(api_key="benchmark"))
+        self.df = self.forecast._grib_bytes_to_df(grib(grid))
+
+    def time_format_single_forecast(self, grid: str) -> None:
+        """Time `_format_single_forecast`."""
+        self.forecast._format_single_forecast(
+            self.df, "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND", None, FRANCE_LATITUDES, FRANCE_LONGITUDES
+        )
+
+
+class Merging:
+    """Merge the coverages of several indicators over the whole of France, as `get_combined_coverage` does."""
+
+    params = [2, 5]
+    param_names = ["indicators"]
+    timeout = 120
+
+    def setup(self, indicators: int) -> None:
+        """Decode and format the coverage of each indicator."""
+        self.forecast = AromeForecast(MeteoFranceClient(api_key="benchmark"))
+        self.coverages = [
+            self.forecast._format_single_forecast(
+                self.forecast._grib_bytes_to_df(grib("france", param)),
+                f"INDICATOR_{index}__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+                None,
+                FRANCE_LATITUDES,
+                FRANCE_LONGITUDES,
+            )
+            for index, param in enumerate(INDICATOR_PARAMETERS[:indicators])
+        ]
+
+    def time_merge_coverages(self, indicators: int) -> None:
+        """Time `_merge_coverages`."""
+        self.forecast._merge_coverages([self.coverages])
+
+    def peakmem_merge_coverages(self, indicators: int) -> None:
+        """Peak memory of `_merge_coverages`."""
+        self.forecast._merge_coverages([self.coverages])
+
+
+class EnsembleFanOut:
+    """Fetch the members of an ensemble concurrently from a local stand-in of the portal."""
+
+    params = [5, 25]
+    param_names = ["members"]
+    timeout = 120
+
+    def setup(self, members: int) -> None:
+        """Start the stand-in, and fetch the capabilities and the description of the coverage."""
+        indicators = {"TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND": Indicator(levels=(2,))}
+        self.portal = StandInPortal(indicators=indicators, runs=[RUN], resolution=0.025).start()
+        self.forecast = AromePEForecast(self.portal.client())
+        self.forecast.get_coverage_description(
+            f"TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___{RUN:%Y-%m-%dT%H.%M.%SZ}"
+        )
+
+    def teardown(self, members: int) -> None:
+        """Stop the stand-in."""
+        self.portal.stop()
+
+    def _get_coverage(self, members: int) -> None:
+        """(Protected)
+        Fetch a region of 1° x 1° for each member.
+        """
+        self.forecast.get_coverage(
+            "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+            heights=[2],
+            ensemble_numbers=list(range(members)),
+            lat=(45.0, 46.0),
+            long=(2.0, 3.0),
+            max_workers=8,
+        )
+
+    def time_get_coverage(self, members: int) -> None:
+        """Time `get_coverage`."""
+        self._get_coverage(members)
+
+    def peakmem_get_coverage(self, members: int) -> None:
+        """Peak memory of `get_coverage`."""
+        self._get_coverage(members)
@@ -0,0 +1,18 @@
+"""Benchmarks of the import of meteole, each in a new interpreter"""
+
+from __future__ import annotations
+
+
+def timeraw_import_meteole() -> str:
+    """Time `import meteole`."""
+    return "import meteole"
+
+
+def timeraw_import_forecast() -> str:
+    """Time the import of a forecast model, and of its dependencies."""
+    return "from meteole import AromeForecast"
+
+
+def timeraw_import_vigilance() -> str:
+    """Time the import of the vigilance, and of its dependencies."""
+    return "from meteole import Vigilance"
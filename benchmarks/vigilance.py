@@ -0,0 +1,81 @@
+"""Benchmarks of the vigilance"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from meteole import Vigilance
+
+DEPARTEMENTS = [f"{code:02d}" for code in range(1, 96)]
+
+
+class _Response:
+    """A response of the vigilance map."""
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def json(self) -> dict[str, Any]:
+        """Return the map."""
+        return self._payload
+
+
+class _Client:
+    """A client answering every request with the vigilance map."""
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def get(self, path: str, **kwargs: Any) -> _Response:
+        """Return the map."""
+        return _Response(self._payload)
+
+
+def vigilance_map() -> dict[str, Any]:
+    """Build a vigilance map of every phenomenon, for every departement of metropolitan France."""
+    periods = [
+        {
+            "echeance": echeance,
+            "per_phenomenon_items": [
+                {
+                    "phenomenon_id": str(phenomenon_id),
+                    "any_color_count": len(DEPARTEMENTS),
+                    "phenomenon_counts": [
+                        {"color_id": color_id, "color_name": "", "count": 24} for color_id in range(1, 5)
+                    ],
+                }
+                for phenomenon_id in range(1, 10)
+            ],
+            "timelaps": {
+                "domain_ids": [
+                    {
+                        "domain_id": departement,
+                        "max_color_id": 1,
+                        "phenomenon_items": [
+                            {"phenomenon_id": str(phenomenon_id), "timelaps_items": [{"color_id": 1}]}
+                            for phenomenon_id in range(1, 10)
+                        ],
+                    }
+                    for departement in DEPARTEMENTS
+                ]
+            },
+        }
+        for echeance in ("J", "J1")
+    ]
+    return {"product": {"periods": periods}}
+
+
+class Phenomenon:
+    """Parse the vigilance map."""
+
+    def setup(self) -> None:
+        """Build the map."""
+        self.vigilance = Vigilance(_Client(vigilance_map()))
+
+    def time_get_phenomenon(self) -> None:
+        """Time `get_phenomenon`."""
+        self.vigilance.get_phenomenon()
+
+    def peakmem_get_phenomenon(self) -> None:
+        """Peak memory of `get_phenomenon`."""
+        self.vigilance.get_phenomenon()
@@ -1,12 +1,16 @@
-from importlib.metadata import version
+from __future__ import annotations
 
-from meteole._arome import AromeForecast
-from meteole._arome_ensemble import AromePEForecast
-from meteole._arome_instantane import AromePIForecast
-from meteole._arpege import ArpegeForecast
-from meteole._dpclim import DPClim
-from meteole._piaf import PiafForecast
-from meteole._vigilance import Vigilance
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from meteole._arome import AromeForecast
+    from meteole._arome_ensemble import AromePEForecast
+    from meteole._arome_instantane import AromePIForecast
+    from meteole._arpege import ArpegeForecast
+    from meteole._dpclim import DPClim
+    from meteole._piaf import PiafForecast
+    from meteole._vigilance import Vigilance
 
 __all__ = [
     "AromeForecast",
@@ -18,4 +22,60 @@ __all__ = [
     "DPClim",
 ]
 
-__version__ = version("meteole")
+# The models are imported on first access, so that using one of them doesn't import the dependencies of the others
+# (e.g. xarray and eccodes for the forecasts, matplotlib for the vigilance)
+_MODELS: dict[str, str] = {
+    "AromeForecast": "meteole._arome",
+    "AromePIForecast": "meteole._arome_instantane",
+    "ArpegeForecast": "meteole._arpege",
+    "PiafForecast": "meteole._piaf",
+    "Vigilance": "meteole._vigilance",
+    "AromePEForecast": "meteole._arome_ensemble",
+    "DPClim": "meteole._dpclim",
+}
+
+_SUBMODULES: frozenset[str] = frozenset(
+    {
+        "cache",
+        "circuitbreaker",
+        "clients",
+        "climat",
+        "deadline",
+        "errors",
+        "forecast",
+        "hedging",
+        "metrics",
+        "ratelimit",
+        "refresh",
+        "testing",
+        "tokens",
+        "tracing",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the models, the public submodules and the version on first access.
+
+    Raises:
+        AttributeError: If `name` is none of them.
+    """
+    if name in _MODELS:
+        value = getattr(importlib.import_module(_MODELS[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name == "__version__":
+        from importlib.metadata import version  # noqa: PLC0415
+
+        value = version("meteole")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Later accesses don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including the ones not imported yet."""
+    return sorted({*globals(), *_MODELS, *_SUBMODULES, "__version__"})
@@ -0,0 +1,227 @@
+"""Index of the capabilities of a forecast model"""
+
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from typing import Collection, Iterable
+from xml.parsers import expat
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+RUN_FORMAT: str = "%Y-%m-%dT%H.%M.%SZ"
+_MIN_RUN = dt.datetime.min.replace(tzinfo=dt.timezone.utc)
+
+# Fields of a `wcs:CoverageSummary` kept in the capabilities, by local name
+SUMMARY_FIELDS: dict[str, str] = {"CoverageId": "id", "Title": "title", "CoverageSubtype": "subtype"}
+
+
+class CapabilitiesIndex:
+    """The capabilities of a model, indexed by indicator, then run, for constant-time lookups.
+
+    Attributes:
+        source: The capabilities DataFrame the index was built from.
+        indicators: The indicators, in order of appearance in the capabilities.
+        instant_indicators: The indicators available without aggregation period, in order of appearance.
+        indicator_set: The indicators, as a set.
+        instant_indicator_set: The instant indicators, as a set.
+    """
+
+    def __init__(self, capabilities: pd.DataFrame) -> None:
+        """Build the index.
+
+        Args:
+            capabilities: The capabilities, with columns `indicator`, `run` and `interval`
+                (see `parse_capabilities`).
+        """
+        self.source = capabilities
+
+        runs: dict[str, dict[str, list[str]]] = {}
+        intervals: dict[str, dict[str, None]] = {}
+        instant_indicators: dict[str, None] = {}
+        run_times: dict[str, dt.datetime | None] = {}
+        for indicator, run, interval in zip(capabilities["indicator"], capabilities["run"], capabilities["interval"]):
+            run_intervals = runs.setdefault(indicator, {}).setdefault(run, [])
+            if interval not in run_intervals:
+                run_intervals.append(interval)
+            intervals.setdefault(indicator, {})[interval] = None
+            if interval == "":
+                instant_indicators[indicator] = None
+            if run not in run_times:
+                run_times[run] = _parse_run(run)
+
+        # Runs sorted by date (the malformed ones first)
+        self._runs: dict[str, dict[str, list[str]]] = {
+            indicator: dict(sorted(indicator_runs.items(), key=lambda item: (run_times[item[0]] or _MIN_RUN, item[0])))
+            for indicator, indicator_runs in runs.items()
+        }
+        self._intervals: dict[str, list[str]] = {indicator: list(values) for indicator, values in intervals.items()}
+        self._run_times = run_times
+
+        self.indicators: list[str] = list(runs)
+        self.instant_indicators: list[str] = list(instant_indicators)
+        self.indicator_set: frozenset[str] = frozenset(self.indicators)
+        self.instant_indicator_set: frozenset[str] = frozenset(self.instant_indicators)
+
+    def runs(self, indicator: str) -> list[str]:
+        """Return the runs of an indicator, from the oldest to the latest.
+
+        Raises:
+            KeyError: If the indicator is unknown.
+        """
+        return list(self._runs[indicator])
+
+    def has_run(self, indicator: str, run: str) -> bool:
+        """Return whether a run of an indicator is available."""
+        return run in self._runs.get(indicator, {})
+
+    def latest_run(self, indicator: str) -> str:
+        """Return the latest run of an indicator.
+
+        Raises:
+            KeyError: If the indicator is unknown.
+        """
+        return next(reversed(self._runs[indicator]))
+
+    def run_time(self, run: str) -> dt.datetime | None:
+        """Return the date of a run (UTC), None if it is malformed or unknown."""
+        return self._run_times.get(run)
+
+    def intervals(self, indicator: str, run: str | None = None) -> list[str]:
+        """Return the aggregation periods of an indicator ("" for instant values), in order of appearance.
+
+        Args:
+            indicator: The indicator.
+            run: A run of the indicator. If None, the periods of all its runs.
+
+        Raises:
+            KeyError: If the indicator (or the run) is unknown.
+        """
+        if run is None:
+            return list(self._intervals[indicator])
+        return list(self._runs[indicator][run])
+
+    def new_runs(self, previous: CapabilitiesIndex) -> dict[str, list[str]]:
+        """Return the runs that were not available in previous capabilities, for at least one indicator.
+
+        Args:
+            previous: The index of the previous capabilities.
+
+        Returns:
+            The new runs, from the oldest to the latest, with the indicators they are new for.
+        """
+        new_runs: dict[str, list[str]] = {}
+        for indicator, runs in self._runs.items():
+            previous_runs = previous._runs.get(indicator, {})
+            for run in runs:
+                if run not in previous_runs:
+                    new_runs.setdefault(run, []).append(indicator)
+        return dict(sorted(new_runs.items(), key=lambda item: (self._run_times[item[0]] or _MIN_RUN, item[0])))
+
+
+def _parse_run(run: str) -> dt.datetime | None:
+    """(Protected)
+    Parse a run, e.g. "2024-11-01T18.00.00Z". Returns None if it is malformed.
+    """
+    try:
+        return dt.datetime.strptime(run, RUN_FORMAT).replace(tzinfo=dt.timezone.utc)
+    except ValueError:
+        return None
+
+
+def parse_capabilities(
+    document: str | bytes | Iterable[bytes], indicators: Collection[str] | None = None
+) -> pd.DataFrame:
+    """Parse a GetCapabilities response, keeping only the fields meteole uses.
+
+    The document is parsed as a stream (it can be given in chunks) and no tree is built: only the id, title and
+    subtype of the coverage summaries are extracted.
+
+    Args:
+        document: The XML document, or its chunks.
+        indicators: If set, only the coverages of these indicators are kept.
+
+    Returns:
+        The capabilities, with columns `id`, `title`, `subtype`, `indicator`, `run` and `interval`.
+
+    Raises:
+        xml.parsers.expat.ExpatError: If the document is not well-formed.
+    """
+    columns: dict[str, list[str | None]] = {column: [] for column in SUMMARY_FIELDS.values()}
+    summary: dict[str, str] | None = None
+    field: str | None = None
+    text: list[str] = []
+
+    def start_element(name: str, attributes: dict[str, str]) -> None:
+        nonlocal summary, field
+        local_name = name.rpartition(":")[2]
+        if local_name == "CoverageSummary":
+            summary = {}
+        elif summary is not None and local_name in SUMMARY_FIELDS:
+            field = SUMMARY_FIELDS[local_name]
+            text.clear()
+
+    def end_element(name: str) -> None:
+        nonlocal summary, field
+        local_name = name.rpartition(":")[2]
+        if field is not None and summary is not None and SUMMARY_FIELDS.get(local_name) == field:
+            summary[field] = "".join(text).strip()
+            field = None
+            if indicators is not None and "id" in summary and summary["id"].split("___", 1)[0] not in indicators:
+                # Not materialized: the rest of the summary is skipped
+                summary = None
+        elif local_name == "CoverageSummary":
+            if summary is not None and "id" in summary:
+                for column, values in columns.items():
+                    values.append(summary.get(column))
+            summary = None
+
+    def character_data(data: str) -> None:
+        if field is not None:
+            text.append(data)
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+
+    if isinstance(document, (str, bytes)):
+        parser.Parse(document, True)
+    else:
+        for chunk in document:
+            parser.Parse(chunk, False)
+        parser.Parse(b"", True)
+
+    capabilities = pd.DataFrame(columns)
+    return pd.concat([capabilities, split_coverage_ids(capabilities["id"])], axis=1)
+
+
+def split_coverage_ids(coverage_ids: pd.Series) -> pd.DataFrame:
+    """Split coverage ids into their indicator, run and aggregation period, with vectorized string operations.
+
+    Example:
+        "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE___2024-11-01T18.00.00Z_PT1H" is split into
+        "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE", "2024-11-01T18.00.00Z" and "PT1H".
+
+    Args:
+        coverage_ids: The coverage ids.
+
+    Returns:
+        The columns `indicator`, `run` and `interval` ("" for instant indicators), with the index of `coverage_ids`.
+    """
+    if coverage_ids.empty:
+        return pd.DataFrame(columns=["indicator", "run", "interval"], index=coverage_ids.index)
+
+    parts = coverage_ids.astype(str).str.split("___", n=1, expand=True).reindex(columns=[0, 1])
+    suffixes = parts[1].fillna("").str.split("Z", n=2, expand=True).reindex(columns=[0, 1])
+    return pd.DataFrame(
+        {
+            "indicator": parts[0],
+            "run": suffixes[0].fillna("") + "Z",
+            "interval": suffixes[1].fillna("").str.strip("_"),
+        },
+        index=coverage_ids.index,
+    )
@@ -0,0 +1,401 @@
+"""Helpers to run the sub-requests of a coverage concurrently"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import queue
+import threading
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_EXCEPTION,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Awaitable, Callable, Generic, Hashable, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+P = TypeVar("P")
+
+ON_ERROR_POLICIES: tuple[str, ...] = ("raise", "collect")
+
+
+def submit_in_context(executor: Executor, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+    """Submit a call to an executor, run in a copy of the current context (e.g. with the active trace, see
+    `meteole.tracing`), like `asyncio.to_thread`. The calls sent to other processes don't get the context.
+
+    Args:
+        executor: The executor to submit the call to.
+        func: The function to call.
+        *args: Positional arguments of the call.
+        **kwargs: Keyword arguments of the call.
+
+    Returns:
+        The future of the call.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        return executor.submit(func, *args, **kwargs)
+    # A context can't be entered by two threads at once: one copy per call
+    return executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+
+def run_ordered(
+    func: Callable[..., T],
+    calls: Sequence[dict[str, Any]],
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    on_error: str = "raise",
+) -> tuple[list[T | None], list[tuple[int, BaseException]]]:
+    """Call `func` once per element of `calls`, possibly concurrently.
+
+    The results are returned in the order of `calls`, whatever the order of completion.
+
+    Args:
+        func: The function to call.
+        calls: Keyword arguments of each call.
+        max_workers: Maximum number of concurrent calls. If None (and no `executor` is given),
+            the calls are made sequentially in the current thread.
+        executor: An executor to submit the calls to. It is not shut down afterwards.
+            Takes precedence over `max_workers`.
+        on_error: "raise" to fail fast on the first error (pending calls are cancelled),
+            "collect" to make every call and return the errors alongside the results.
+
+    Returns:
+        Tuple of:
+            The results, in the order of `calls` (None for the calls that failed).
+            The errors, as a list of (index in `calls`, exception).
+
+    Raises:
+        ValueError: If `on_error` or `max_workers` is invalid.
+    """
+    if on_error not in ON_ERROR_POLICIES:
+        raise ValueError(f"Parameter `on_error` must be in {ON_ERROR_POLICIES}")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("Parameter `max_workers` must be a positive integer")
+
+    results: list[T | None] = [None] * len(calls)
+    errors: list[tuple[int, BaseException]] = []
+
+    if executor is None and max_workers is None:
+        for index, kwargs in enumerate(calls):
+            try:
+                results[index] = func(**kwargs)
+            except Exception as exc:
+                if on_error == "raise":
+                    raise
+                errors.append((index, exc))
+        return results, errors
+
+    pool: Executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="meteole")
+    try:
+        futures: dict[Future[T], int] = {
+            submit_in_context(pool, func, **kwargs): index for index, kwargs in enumerate(calls)
+        }
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION if on_error == "raise" else ALL_COMPLETED)
+
+        for future in sorted(done, key=futures.__getitem__):
+            error = future.exception()
+            if error is None:
+                results[futures[future]] = future.result()
+            elif on_error == "raise":
+                logger.debug(f"Cancelling {len(not_done)} pending sub-requests")
+                for pending in not_done:
+                    pending.cancel()
+                raise error
+            else:
+                errors.append((futures[future], error))
+    finally:
+        if executor is None:
+            pool.shutdown(wait=True)
+
+    return results, errors
+
+
+def run_pipeline(
+    fetch: Callable[..., P],
+    decode: Callable[[P, dict[str, Any]], T],
+    calls: Sequence[dict[str, Any]],
+    *,
+    fetch_workers: int | None = None,
+    decode_workers: int = 1,
+    queue_size: int = 1,
+    executor: Executor | None = None,
+    on_error: str = "raise",
+    release: Callable[[P], None] | None = None,
+) -> tuple[list[T | None], list[tuple[int, BaseException]]]:
+    """Call `fetch` once per element of `calls`, and `decode` on each of its results, in two stages running
+    concurrently.
+
+    The fetchers put their results in a bounded queue, consumed by the decoders: decoding overlaps the fetches,
+    and the fetchers wait when `queue_size` results are waiting to be decoded, bounding the memory they hold.
+    The results are returned in the order of `calls`, like `run_ordered`.
+
+    Args:
+        fetch: The function fetching a payload, called with the keyword arguments of a call.
+        decode: The function decoding a payload, called with the payload and the keyword arguments of its call.
+        calls: Keyword arguments of each call.
+        fetch_workers: Number of concurrent fetches. Defaults to 1, or with an `executor`, to as many fetches as
+            the executor runs concurrently.
+        decode_workers: Number of concurrent decodings.
+        queue_size: Maximum number of payloads waiting to be decoded.
+        executor: An executor to run the fetchers in, instead of a new pool of `fetch_workers` threads. It is not
+            shut down afterwards. The decoders always run in their own threads.
+        on_error: "raise" to fail fast on the first error (no new fetch is started), "collect" to make every call
+            and return the errors alongside the results.
+        release: A function called on the payloads that are dropped without being decoded, after an error. Its
+            own errors are logged and ignored.
+
+    Returns:
+        Tuple of:
+            The results, in the order of `calls` (None for the calls that failed).
+            The errors, as a list of (index in `calls`, exception).
+
+    Raises:
+        ValueError: If `on_error`, a number of workers or `queue_size` is invalid.
+    """
+    if on_error not in ON_ERROR_POLICIES:
+        raise ValueError(f"Parameter `on_error` must be in {ON_ERROR_POLICIES}")
+    if fetch_workers is None:
+        # A fetcher per call: the executor runs as many of them as it can, the others find no call left
+        fetch_workers = max(len(calls), 1) if executor is not None else 1
+    if fetch_workers < 1 or decode_workers < 1:
+        raise ValueError("Parameters `fetch_workers` and `decode_workers` must be positive integers")
+    if queue_size < 1:
+        raise ValueError("Parameter `queue_size` must be a positive integer")
+
+    results: list[T | None] = [None] * len(calls)
+    errors: list[tuple[int, BaseException]] = []
+    indices = iter(range(len(calls)))
+    fetched: queue.Queue[tuple[int, P] | None] = queue.Queue(maxsize=queue_size)
+    failed = threading.Event()
+    lock = threading.Lock()
+
+    def _fail(index: int, error: BaseException) -> None:
+        with lock:
+            errors.append((index, error))
+        if on_error == "raise":
+            failed.set()
+
+    def _fetcher() -> None:
+        while not failed.is_set():
+            with lock:
+                index = next(indices, None)
+            if index is None:
+                return
+            try:
+                payload = fetch(**calls[index])
+            except Exception as exc:
+                _fail(index, exc)
+                continue
+            # Blocks while the queue is full
+            fetched.put((index, payload))
+
+    def _decoder() -> None:
+        # Consume until the end of the fetches, even after an error, so that no fetcher stays blocked
+        while (item := fetched.get()) is not None:
+            index, payload = item
+            if failed.is_set():
+                if release is not None:
+                    try:
+                        release(payload)
+                    except Exception as exc:
+                        # The decoder must go on consuming, or the fetchers would stay blocked on the full queue
+                        logger.warning(f"Failed to release a dropped payload: {exc!r}")
+                continue
+            try:
+                results[index] = decode(payload, calls[index])
+            except Exception as exc:
+                _fail(index, exc)
+
+    fetch_pool: Executor = executor or ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="meteole")
+    decode_pool = ThreadPoolExecutor(max_workers=decode_workers, thread_name_prefix="meteole-decode")
+    decoders = [submit_in_context(decode_pool, _decoder) for _ in range(decode_workers)]
+    fetchers: list[Future[None]] = []
+    try:
+        fetchers = [submit_in_context(fetch_pool, _fetcher) for _ in range(fetch_workers)]
+        wait(fetchers)
+    except BaseException:
+        # Interrupted while waiting: the fetchers stop after their current call
+        failed.set()
+        raise
+    finally:
+        wait(fetchers)
+        for _ in decoders:
+            fetched.put(None)
+        wait(decoders)
+        decode_pool.shutdown()
+        if executor is None:
+            fetch_pool.shutdown()
+
+    if errors and on_error == "raise":
+        logger.debug(f"Stopped the pipeline after {len(errors)} errors")
+        raise errors[0][1]
+
+    errors.sort(key=lambda error: error[0])
+    return results, errors
+
+
+async def gather_ordered(
+    func: Callable[..., Awaitable[T]],
+    calls: Sequence[dict[str, Any]],
+    *,
+    semaphore: asyncio.Semaphore | None = None,
+    on_error: str = "raise",
+) -> tuple[list[T | None], list[tuple[int, BaseException]]]:
+    """Asynchronous counterpart of `run_ordered`: await `func` once per element of `calls`, concurrently.
+
+    Args:
+        func: The coroutine function to call.
+        calls: Keyword arguments of each call.
+        semaphore: A semaphore bounding the number of calls in flight. If None, there is no bound.
+        on_error: "raise" to fail fast on the first error (pending calls are cancelled),
+            "collect" to make every call and return the errors alongside the results.
+
+    Returns:
+        Tuple of:
+            The results, in the order of `calls` (None for the calls that failed).
+            The errors, as a list of (index in `calls`, exception).
+
+    Raises:
+        ValueError: If `on_error` is invalid.
+    """
+    if on_error not in ON_ERROR_POLICIES:
+        raise ValueError(f"Parameter `on_error` must be in {ON_ERROR_POLICIES}")
+
+    async def _call(kwargs: dict[str, Any]) -> T:
+        if semaphore is None:
+            return await func(**kwargs)
+        async with semaphore:
+            return await func(**kwargs)
+
+    results: list[T | None] = [None] * len(calls)
+    errors: list[tuple[int, BaseException]] = []
+    if not calls:
+        return results, errors
+
+    tasks: dict[asyncio.Future[T], int] = {
+        asyncio.ensure_future(_call(kwargs)): index for index, kwargs in enumerate(calls)
+    }
+    try:
+        done, pending = await asyncio.wait(
+            tasks, return_when=asyncio.FIRST_EXCEPTION if on_error == "raise" else asyncio.ALL_COMPLETED
+        )
+    finally:
+        # Cancelled while waiting
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    for task in sorted(done, key=tasks.__getitem__):
+        error = task.exception()
+        if error is None:
+            results[tasks[task]] = task.result()
+        else:
+            errors.append((tasks[task], error))
+
+    if errors and on_error == "raise":
+        logger.debug(f"Cancelling {len(pending)} pending sub-requests")
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise errors[0][1]
+
+    return results, errors
+
+
+class SingleFlight(Generic[T]):
+    """Collapse concurrent identical calls into one: the first caller of a key makes the call, and the callers arriving
+    while it is in flight wait for its outcome (result or exception) instead of making their own. Thread-safe.
+
+    Attributes:
+        coalesced: Number of calls that waited for another one instead of being made.
+    """
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self.coalesced = 0
+        self._calls: dict[Hashable, Future[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T], timeout: float | None = None) -> T:
+        """Call `func`, unless a call with the same key is in flight, and return its result.
+
+        Args:
+            key: The key identifying identical calls.
+            func: The function to call.
+            timeout: Maximum time to wait for a call in flight, in seconds (None to wait until it ends).
+
+        Raises:
+            concurrent.futures.TimeoutError: If the call in flight didn't end within `timeout`.
+        """
+        with self._lock:
+            in_flight = self._calls.get(key)
+            if in_flight is None:
+                call: Future[T] = Future()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if in_flight is not None:
+            return in_flight.result(timeout)
+
+        try:
+            result = func()
+        except BaseException as exc:
+            call.set_exception(exc)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight(Generic[T]):
+    """Asynchronous counterpart of `SingleFlight`, for the coroutines of an event loop.
+
+    The call runs in its own task: cancelling the caller that started it doesn't cancel it for the others.
+
+    Attributes:
+        coalesced: Number of calls that waited for another one instead of being made.
+    """
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self.coalesced = 0
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]], timeout: float | None = None) -> T:
+        """Await `func()`, unless a call with the same key is in flight, and return its result.
+
+        Args:
+            key: The key identifying identical calls.
+            func: The coroutine function to call.
+            timeout: Maximum time to wait for the call, in seconds (None to wait until it ends).
+
+        Raises:
+            asyncio.TimeoutError: If the call didn't end within `timeout`.
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+        else:
+            call = self._calls[key] = asyncio.ensure_future(func())
+            call.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.wait_for(asyncio.shield(call), timeout)
+
+    def _forget(self, key: Hashable, call: asyncio.Future[T]) -> None:
+        """(Protected)
+        Remove a call once done, retrieving its exception (it may have no waiter left).
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            call.exception()
@@ -0,0 +1,214 @@
+"""In-memory decoding of GRIB messages with eccodes"""
+
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import eccodes
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Grids whose points are the product of distinct latitudes and longitudes (as decoded by cfgrib)
+SUPPORTED_GRID_TYPES: tuple[str, ...] = ("regular_ll", "regular_gg")
+
+# Seconds per unit of the `stepUnits` code table (as cfgrib)
+_STEP_UNITS_TO_SECONDS: dict[int, int] = {
+    0: 60,
+    1: 3600,
+    2: 86400,
+    10: 10800,
+    11: 21600,
+    12: 43200,
+    13: 1,
+    14: 900,
+    15: 1800,
+}
+
+# Keys that make cfgrib add dimensions this decoder doesn't handle (wave spectra)
+_UNSUPPORTED_KEYS: tuple[str, ...] = ("directionNumber", "frequencyNumber")
+
+
+@dataclass
+class GribColumns:
+    """The content of a GRIB message on a regular grid, in a compact form (cheap to send between processes).
+
+    Attributes:
+        latitudes: The distinct latitudes of the grid.
+        longitudes: The distinct longitudes of the grid.
+        scalars: The columns that are constant over the grid, in order (`number`, `time`, `step`, level, ...).
+        variable: The name of the values (e.g. `t2m`).
+        values: The values, one per point of the grid (latitudes first).
+    """
+
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+    scalars: dict[str, Any]
+    variable: str
+    values: np.ndarray
+
+    def to_df(self) -> pd.DataFrame:
+        """Expand the columns into a DataFrame, with one row per point of the grid."""
+        size = len(self.values)
+        columns: dict[str, np.ndarray] = {
+            "latitude": np.repeat(self.latitudes, len(self.longitudes)),
+            "longitude": np.tile(self.longitudes, len(self.latitudes)),
+        }
+        for name, value in self.scalars.items():
+            columns[name] = np.full(size, value)
+        columns[self.variable] = self.values
+
+        return pd.DataFrame(columns)
+
+
+def grib_to_df(source: bytes | Path) -> pd.DataFrame | None:
+    """Decode a GRIB file made of a single message, without temporary or index file.
+
+    The DataFrame is the same as the one of `xr.open_dataset(..., engine="cfgrib").to_dataframe().reset_index()`:
+    columns `latitude`, `longitude`, then `number` (ensemble member, if any), `time`, `step`, the level (named after
+    its type, e.g. `heightAboveGround`), `valid_time`, and the values (named after the parameter, e.g. `t2m`).
+
+    Args:
+        source: The content of the GRIB file, or its path.
+
+    Returns:
+        The decoded data, or None if the file isn't supported (several messages, irregular grid, ...) and must be
+        decoded with cfgrib.
+    """
+    columns = grib_to_columns(source)
+    return columns.to_df() if columns is not None else None
+
+
+def grib_to_columns(source: bytes | Path) -> GribColumns | None:
+    """Decode a GRIB file made of a single message into compact columns, see `grib_to_df`.
+
+    Args:
+        source: The content of the GRIB file, or its path.
+
+    Returns:
+        The decoded data, or None if the file isn't supported and must be decoded with cfgrib.
+    """
+    try:
+        handle = _new_handle(source)
+    except eccodes.GribInternalError as exc:
+        logger.debug(f"Corrupted GRIB file ({exc}), decoding with cfgrib")
+        return None
+    if handle is None:
+        return None
+
+    try:
+        return _message_to_columns(handle)
+    except eccodes.GribInternalError as exc:
+        logger.debug(f"Corrupted GRIB message ({exc}), decoding with cfgrib")
+        return None
+    finally:
+        eccodes.codes_release(handle)
+
+
+def _new_handle(source: bytes | Path) -> int | None:
+    """(Protected)
+    Load the single message of a GRIB file.
+
+    Returns:
+        The eccodes handle of the message (to be released), or None if the file doesn't hold exactly one message.
+
+    Raises:
+        GribInternalError: If eccodes rejects the message (e.g. truncated).
+    """
+    if isinstance(source, Path):
+        with open(source, "rb") as file:
+            handle = eccodes.codes_grib_new_from_file(file)
+            if handle is None:
+                return None
+            try:
+                trailing = eccodes.codes_grib_new_from_file(file)
+            except eccodes.GribInternalError:
+                eccodes.codes_release(handle)
+                raise
+        if trailing is not None:
+            eccodes.codes_release(trailing)
+            eccodes.codes_release(handle)
+            logger.debug("Several GRIB messages, decoding with cfgrib")
+            return None
+        return handle
+
+    if not (source.startswith(b"GRIB") and source.endswith(b"7777")):
+        # Not a GRIB file (e.g. truncated), left to cfgrib to report
+        return None
+    handle = eccodes.codes_new_from_message(source)
+    try:
+        total_length = eccodes.codes_get(handle, "totalLength")
+    except eccodes.GribInternalError:
+        eccodes.codes_release(handle)
+        raise
+    if total_length != len(source):
+        eccodes.codes_release(handle)
+        logger.debug("Several GRIB messages, decoding with cfgrib")
+        return None
+    return handle
+
+
+def _message_to_columns(handle: int) -> GribColumns | None:
+    """(Protected)
+    Decode a GRIB message like cfgrib does.
+    """
+    grid_type = eccodes.codes_get(handle, "gridType")
+    step_units = eccodes.codes_get(handle, "stepUnits", int)
+    if (
+        grid_type not in SUPPORTED_GRID_TYPES
+        or step_units not in _STEP_UNITS_TO_SECONDS
+        or any(eccodes.codes_is_defined(handle, key) for key in _UNSUPPORTED_KEYS)
+    ):
+        logger.debug(f"Unsupported GRIB message (gridType={grid_type}), decoding with cfgrib")
+        return None
+
+    latitudes = eccodes.codes_get_array(handle, "distinctLatitudes")
+    longitudes = eccodes.codes_get_array(handle, "distinctLongitudes")
+    n_lat, n_long = eccodes.codes_get(handle, "Ny"), eccodes.codes_get(handle, "Nx")
+    if (len(latitudes), len(longitudes)) != (n_lat, n_long):
+        return None
+
+    raw_values = eccodes.codes_get_values(handle)
+    values = raw_values.astype(np.float32)
+    if eccodes.codes_get(handle, "bitmapPresent"):
+        values[raw_values == eccodes.codes_get_double(handle, "missingValue")] = np.nan
+
+    data_date = eccodes.codes_get(handle, "dataDate", int)
+    data_time = eccodes.codes_get(handle, "dataTime", int)
+    time = pd.Timestamp(
+        dt.datetime(data_date // 10000, data_date // 100 % 100, data_date % 100, data_time // 100, data_time % 100)
+    )
+    step = pd.Timedelta(seconds=eccodes.codes_get(handle, "endStep", int) * _STEP_UNITS_TO_SECONDS[step_units])
+
+    scalars: dict[str, Any] = {}
+    if eccodes.codes_is_defined(handle, "number"):
+        scalars["number"] = np.int64(eccodes.codes_get(handle, "number", int))
+    scalars["time"] = time.to_datetime64().astype("datetime64[ns]")
+    scalars["step"] = step.to_timedelta64().astype("timedelta64[ns]")
+    scalars[eccodes.codes_get(handle, "typeOfLevel")] = eccodes.codes_get_double(handle, "level")
+    scalars["valid_time"] = (time + step).to_datetime64().astype("datetime64[ns]")
+
+    return GribColumns(
+        latitudes=latitudes,
+        longitudes=longitudes,
+        scalars=scalars,
+        variable=_variable_name(handle),
+        values=values,
+    )
+
+
+def _variable_name(handle: int) -> str:
+    """(Protected)
+    Name the values of a message like cfgrib: `cfVarName`, or `shortName` if unknown.
+    """
+    cf_var_name = eccodes.codes_get(handle, "cfVarName") if eccodes.codes_is_defined(handle, "cfVarName") else None
+    if cf_var_name not in (None, "undef", "unknown"):
+        return str(cf_var_name)
+    if eccodes.codes_is_defined(handle, "shortName"):
+        return str(eccodes.codes_get(handle, "shortName"))
+    return f"paramId_{eccodes.codes_get(handle, 'paramId', int)}"
@@ -4,8 +4,6 @@ import logging
 from io import BytesIO
 from typing import Any, final
 
-import matplotlib.image as mpimg
-import matplotlib.pyplot as plt
 import pandas as pd
 from requests import Response
 
@@ -140,6 +138,10 @@ class Vigilance:
             with open(filename, "wb") as f:
                 f.write(resp.content)
 
+            # matplotlib is slow to import, and only needed here
+            import matplotlib.image as mpimg  # noqa: PLC0415
+            import matplotlib.pyplot as plt  # noqa: PLC0415
+
             img = mpimg.imread(BytesIO(resp.content), format="png")
             plt.imshow(img)
             plt.axis("off")
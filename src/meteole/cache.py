@@ -0,0 +1,564 @@
+"""Caches of the forecasts: metadata (GetCapabilities and DescribeCoverage responses), GRIB files and missing data"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import datetime as dt
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Generic, Hashable, Iterable, NamedTuple, TypeVar
+
+from meteole._storage import atomic_write, default_cache_dir, file_lock
+from meteole.errors import MissingDataError
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class MetadataCache:
+    """A metadata cache on disk, shared by the processes of the machine.
+
+    Forecasts given a cache (`metadata_cache=...`) read their capabilities and the descriptions of their coverages
+    from disk while they are fresh, instead of requesting them from the API. Entries are keyed by model, territory,
+    precision (i.e. the WCS entry point) and coverage id.
+
+    The lifetime of an entry follows the publication of the runs:
+    - the capabilities change whenever a run is published: they are kept until the next run is due
+      (`run_interval` seconds after the latest one), then `capabilities_ttl` seconds until it shows up;
+    - the description of a coverage of a recent run changes while the run is being published (new forecast
+      horizons), and is kept `recent_run_ttl` seconds;
+    - the description of a coverage of a run published for more than `publication_window` seconds no longer changes,
+      and is kept `published_run_ttl` seconds.
+
+    Example:
+        >>> cache = MetadataCache()
+        >>> arome = AromeForecast(api_key="...", metadata_cache=cache)
+
+    Attributes:
+        path: The directory of the cache.
+    """
+
+    CAPABILITIES_TTL_SEC: float = 10 * 60
+    RUN_INTERVAL_SEC: float = 3 * 3600
+    RECENT_RUN_TTL_SEC: float = 10 * 60
+    PUBLISHED_RUN_TTL_SEC: float = 7 * 24 * 3600
+    PUBLICATION_WINDOW_SEC: float = 12 * 3600
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        *,
+        capabilities_ttl: float = CAPABILITIES_TTL_SEC,
+        run_interval: float = RUN_INTERVAL_SEC,
+        recent_run_ttl: float = RECENT_RUN_TTL_SEC,
+        published_run_ttl: float = PUBLISHED_RUN_TTL_SEC,
+        publication_window: float = PUBLICATION_WINDOW_SEC,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            path: The directory of the cache. Defaults to `metadata` in the meteole cache directory
+                (`$XDG_CACHE_HOME/meteole`, or `~/.cache/meteole`).
+            capabilities_ttl: Lifetime of the capabilities once the next run is due, in seconds.
+            run_interval: Time between two runs of a model, in seconds. Defaults to the shortest one (AROME's).
+            recent_run_ttl: Lifetime of the description of a coverage of a run being published, in seconds.
+            published_run_ttl: Lifetime of the description of a coverage of a published run, in seconds.
+            publication_window: Time after which a run is considered fully published, in seconds.
+            clock: Wall clock, in seconds since the epoch.
+        """
+        self.path = Path(path) if path is not None else default_cache_dir() / "metadata"
+        self.capabilities_ttl = capabilities_ttl
+        self.run_interval = run_interval
+        self.recent_run_ttl = recent_run_ttl
+        self.published_run_ttl = published_run_ttl
+        self.publication_window = publication_window
+        self._clock = clock
+
+    def get(self, key: str) -> Any | None:
+        """Return a fresh entry of the cache.
+
+        Args:
+            key: The key of the entry, e.g. "arome/1.0/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS/GetCapabilities".
+
+        Returns:
+            The data of the entry, or None if it is missing or expired.
+        """
+        try:
+            entry = json.loads(self._entry_path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug(f"Ignoring the unreadable cache entry '{key}': {exc}")
+            return None
+
+        try:
+            expired = entry["expires_at"] <= self._clock()
+            data = entry["data"]
+        except (KeyError, TypeError) as exc:
+            logger.debug(f"Ignoring the malformed cache entry '{key}': {exc!r}")
+            return None
+
+        if expired:
+            logger.debug(f"Cache entry '{key}' expired")
+            return None
+        return data
+
+    def set(self, key: str, data: Any, ttl: float) -> None:
+        """Store an entry in the cache, atomically (concurrent readers never see a partial entry).
+
+        Args:
+            key: The key of the entry, see `get`.
+            data: The data of the entry, serializable to JSON.
+            ttl: Lifetime of the entry, in seconds.
+        """
+        now = self._clock()
+        entry = {"stored_at": now, "expires_at": now + ttl, "data": data}
+        try:
+            atomic_write(self._entry_path(key), json.dumps(entry).encode())
+        except OSError as exc:
+            # The cache is an optimization: a read-only or full disk mustn't break the requests
+            logger.warning(f"Could not write the cache entry '{key}': {exc}")
+
+    def clear(self) -> None:
+        """Remove every entry of the cache."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def capabilities_ttl_for(self, coverage_ids: Iterable[str]) -> float:
+        """Return the lifetime of the capabilities, according to the age of their latest run.
+
+        No run is published before it is due, so the capabilities are kept until the next one is.
+
+        Args:
+            coverage_ids: The ids of the coverages of the capabilities.
+        """
+        runs = [run for run in map(run_of_coverage, coverage_ids) if run is not None]
+        if not runs:
+            return self.capabilities_ttl
+        next_run_due = max(runs).timestamp() + self.run_interval
+        return max(self.capabilities_ttl, next_run_due - self._clock())
+
+    def description_ttl(self, coverage_id: str) -> float:
+        """Return the lifetime of the description of a coverage, according to the age of its run.
+
+        Args:
+            coverage_id: The id of the coverage, e.g. "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T18.00.00Z".
+        """
+        run = run_of_coverage(coverage_id)
+        if run is None or self._clock() - run.timestamp() < self.publication_window:
+            return self.recent_run_ttl
+        return self.published_run_ttl
+
+    def _entry_path(self, key: str) -> Path:
+        """(Protected)
+        Return the file of an entry: one directory per segment of the key, with unsafe characters replaced.
+        """
+        segments = [re.sub(r"[^\w.\-]", "_", segment) for segment in key.split("/") if segment.strip(".")]
+        path = self.path.joinpath(*segments)
+        return path.with_name(f"{path.name}.json")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `LRUCache`, like `functools.lru_cache`'s."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """A bounded in-memory cache, evicting the least recently used entries. Thread-safe.
+
+    Attributes:
+        maxsize: The maximum number of entries. 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """Initialize attributes.
+
+        Args:
+            maxsize: The maximum number of entries. 0 disables the cache.
+        """
+        if maxsize < 0:
+            raise ValueError("Parameter `maxsize` must be a non-negative integer")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """Return an entry, None if missing. Counted as a hit or a miss."""
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: K, value: V) -> None:
+        """Store an entry, evicting the least recently used one if the cache is full."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry. The statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+
+class GribStoreInfo(NamedTuple):
+    """Statistics of a `GribStore`. The hits and misses are the ones of the instance, the size is the one on disk."""
+
+    hits: int
+    misses: int
+    max_bytes: int
+    currbytes: int
+    files: int
+
+
+class GribStore:
+    """A store on disk of the GRIB files returned by GetCoverage, shared by the processes of the machine.
+
+    The runs never change once published: forecasts given a store (`grib_store=...`) read the files they already
+    downloaded from disk instead of requesting them again. Files are addressed by a hash of the request (model,
+    entry point, coverage id, ensemble member and subset), written atomically, and the least recently used ones are
+    evicted once the store exceeds `max_bytes`, down to `LOW_WATER_MARK` of it.
+
+    The size of the store is estimated from the files written since its last scan: the store is only scanned when
+    it may be full, or every `RESCAN_PUTS` writes to see the files written by the other processes.
+
+    Example:
+        >>> store = GribStore(max_bytes=2 * 1024**3)
+        >>> arome = AromeForecast(api_key="...", grib_store=store)
+
+    Attributes:
+        path: The directory of the store.
+        max_bytes: The maximum size of the store, in bytes.
+    """
+
+    MAX_BYTES: int = 5 * 1024**3
+    SUFFIX: str = ".grib"
+    LOW_WATER_MARK: float = 0.9
+    RESCAN_PUTS: int = 100
+
+    def __init__(self, path: Path | str | None = None, *, max_bytes: int = MAX_BYTES) -> None:
+        """Initialize attributes.
+
+        Args:
+            path: The directory of the store. Defaults to `grib` in the meteole cache directory
+                (`$XDG_CACHE_HOME/meteole`, or `~/.cache/meteole`).
+            max_bytes: The maximum size of the store, in bytes.
+        """
+        if max_bytes < 0:
+            raise ValueError("Parameter `max_bytes` must be a non-negative integer")
+
+        self.path = Path(path) if path is not None else default_cache_dir() / "grib"
+        self.max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        self._estimated_bytes: int | None = None
+        self._puts_since_scan = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, params: dict[str, Any]) -> str:
+        """Return the key of a GetCoverage request: the hash of its canonical form.
+
+        Args:
+            path: The path of the request, holding the model and the entry point (and the ensemble member).
+            params: The query parameters of the request. The order of the subsets doesn't matter.
+        """
+        canonical = {
+            name: sorted(value) if isinstance(value, (list, tuple)) else value for name, value in params.items()
+        }
+        request = json.dumps({"path": path, "params": canonical}, sort_keys=True, default=str)
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Return a stored file, None if missing. Counted as a hit or a miss.
+
+        Args:
+            key: The key of the file, see `key`.
+        """
+        path = self._file_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        self._count(hit=True)
+        self._touch(path)
+        return data
+
+    def copy_to(self, key: str, destination: Path) -> bool:
+        """Copy a stored file, without loading it in memory. Counted as a hit or a miss.
+
+        Args:
+            key: The key of the file, see `key`.
+            destination: The path of the copy.
+
+        Returns:
+            Whether the file was stored.
+        """
+        path = self._file_path(key)
+        try:
+            shutil.copyfile(path, destination)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return False
+        self._count(hit=True)
+        self._touch(path)
+        return True
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a file, atomically, then evict the least recently used files if the store is full.
+
+        Args:
+            key: The key of the file, see `key`.
+            data: The content of the file.
+        """
+        try:
+            atomic_write(self._file_path(key), data)
+        except OSError as exc:
+            # The store is an optimization: a read-only or full disk mustn't break the requests
+            logger.warning(f"Could not store the GRIB file {key}: {exc}")
+            return
+        self._stored(len(data))
+
+    def put_file(self, key: str, source: Path) -> None:
+        """Store a copy of a file, atomically, see `put`.
+
+        Args:
+            key: The key of the file, see `key`.
+            source: The file to copy.
+        """
+        path = self._file_path(key)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, tmp_path)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning(f"Could not store the GRIB file {key}: {exc}")
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            return
+        self._stored(size)
+
+    def clear(self) -> None:
+        """Remove every file of the store. The statistics are kept."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        with self._lock:
+            self._estimated_bytes = 0
+
+    def info(self) -> GribStoreInfo:
+        """Return the statistics of the store."""
+        files = self._files()
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        return GribStoreInfo(hits, misses, self.max_bytes, sum(size for _, size, _ in files), len(files))
+
+    def _file_path(self, key: str) -> Path:
+        """(Protected)
+        Return the file of a key, in a subdirectory named after its first characters (to keep directories small).
+        """
+        return self.path / key[:2] / f"{key}{self.SUFFIX}"
+
+    def _count(self, hit: bool) -> None:
+        """(Protected)
+        Count a hit or a miss.
+        """
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """(Protected)
+        Mark a file as recently used: its modification time orders the evictions.
+        """
+        with contextlib.suppress(OSError):
+            # Evicted in the meantime
+            os.utime(path)
+
+    def _files(self) -> list[tuple[float, int, Path]]:
+        """(Protected)
+        Return the (last use, size, path) of the stored files.
+        """
+        files = []
+        for path in self.path.glob(f"*/*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _stored(self, size: int) -> None:
+        """(Protected)
+        Account for a file written to the store, and scan the store for evictions if it may be full.
+
+        Args:
+            size: The size of the file, in bytes.
+        """
+        with self._lock:
+            self._puts_since_scan += 1
+            if self._estimated_bytes is not None:
+                # Overestimated if the file replaced another one, which only brings the next scan forward
+                self._estimated_bytes += size
+            scan = (
+                self._estimated_bytes is None
+                or self._estimated_bytes > self.max_bytes
+                or self._puts_since_scan >= self.RESCAN_PUTS
+            )
+            if scan:
+                self._puts_since_scan = 0
+        if scan:
+            self._evict()
+
+    def _evict(self) -> None:
+        """(Protected)
+        Remove the least recently used files if the store exceeds `max_bytes`, until it fits in `LOW_WATER_MARK` of
+        it. Evictions are serialized between processes, readers are not blocked.
+        """
+        with file_lock(self.path / ".lock"):
+            files = self._files()
+            size = sum(file_size for _, file_size, _ in files)
+            if size > self.max_bytes:
+                for _, file_size, path in sorted(files):
+                    if size <= self.max_bytes * self.LOW_WATER_MARK:
+                        break
+                    with contextlib.suppress(FileNotFoundError):
+                        path.unlink()
+                        logger.debug(f"Evicted {path.name} from the GRIB store")
+                    size -= file_size
+        with self._lock:
+            self._estimated_bytes = size
+
+
+class MissingDataCache:
+    """An in-memory cache of the requests answered with a `MissingDataError`, shared by the threads of the process.
+
+    A coverage can be listed in the capabilities before all its horizons (or members) are published. Forecasts given
+    a cache (`missing_data_cache=...`) remember the GetCoverage requests found missing, and raise the same error again
+    for a while instead of requesting them:
+    - `recent_run_ttl` seconds for the coverages of a run being published, whose data may appear soon;
+    - `published_run_ttl` seconds for the coverages of a run published for more than `publication_window` seconds.
+
+    Example:
+        >>> arome = AromeForecast(api_key="...", missing_data_cache=MissingDataCache())
+
+    Attributes:
+        maxsize: The maximum number of requests remembered.
+    """
+
+    RECENT_RUN_TTL_SEC: float = 60
+    PUBLISHED_RUN_TTL_SEC: float = 3600
+    PUBLICATION_WINDOW_SEC: float = 12 * 3600
+
+    def __init__(
+        self,
+        *,
+        recent_run_ttl: float = RECENT_RUN_TTL_SEC,
+        published_run_ttl: float = PUBLISHED_RUN_TTL_SEC,
+        publication_window: float = PUBLICATION_WINDOW_SEC,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            recent_run_ttl: Lifetime of a missing request on a run being published, in seconds.
+            published_run_ttl: Lifetime of a missing request on a published run, in seconds.
+            publication_window: Time after which a run is considered fully published, in seconds.
+            maxsize: The maximum number of requests remembered, the least recently used are forgotten first.
+            clock: Wall clock, in seconds since the epoch.
+        """
+        self.recent_run_ttl = recent_run_ttl
+        self.published_run_ttl = published_run_ttl
+        self.publication_window = publication_window
+        self.maxsize = maxsize
+        self._entries: LRUCache[str, tuple[float, MissingDataError]] = LRUCache(maxsize)
+        self._clock = clock
+
+    def get(self, key: str) -> MissingDataError | None:
+        """Return the error of a request known to be missing.
+
+        Args:
+            key: The key of the request, see `GribStore.key`.
+
+        Returns:
+            A copy of the error the request was answered with, or None if it isn't known to be missing (anymore).
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return copy.copy(entry[1])
+
+    def set(self, key: str, error: MissingDataError, ttl: float) -> None:
+        """Remember a request found missing.
+
+        Args:
+            key: The key of the request, see `GribStore.key`.
+            error: The error the request was answered with.
+            ttl: Time during which the request is considered missing, in seconds.
+        """
+        self._entries.set(key, (self._clock() + ttl, error))
+
+    def clear(self) -> None:
+        """Forget every request."""
+        self._entries.clear()
+
+    def ttl(self, coverage_id: str) -> float:
+        """Return the time during which a request on a coverage is considered missing, according to the age of its run.
+
+        Args:
+            coverage_id: The id of the coverage, e.g. "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T18.00.00Z".
+        """
+        run = run_of_coverage(coverage_id)
+        if run is None or self._clock() - run.timestamp() < self.publication_window:
+            return self.recent_run_ttl
+        return self.published_run_ttl
+
+
+def run_of_coverage(coverage_id: str) -> dt.datetime | None:
+    """Return the run of a coverage, from its id.
+
+    Args:
+        coverage_id: The id of the coverage, e.g. "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T18.00.00Z".
+
+    Returns:
+        The run (UTC), or None if the id doesn't hold one.
+    """
+    match = re.search(r"___(\d{4}-\d{2}-\d{2}T\d{2}\.\d{2}\.\d{2})Z", coverage_id)
+    if match is None:
+        return None
+    return dt.datetime.strptime(match.group(1), "%Y-%m-%dT%H.%M.%S").replace(tzinfo=dt.timezone.utc)
@@ -0,0 +1,202 @@
+"""Client-side circuit breaking during outages of the API"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+from meteole.errors import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """States of a circuit"""
+
+    CLOSED = "closed"  # requests are made
+    OPEN = "open"  # requests fail fast
+    HALF_OPEN = "half_open"  # a probe request checks whether the API recovered
+
+
+@dataclass
+class _Circuit:
+    """(Protected)
+    State of the circuit of an API base URL.
+    """
+
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probe_started_at: float = 0.0
+
+
+class CircuitBreaker:
+    """A circuit breaker, shared by all the callers of a client, with a circuit per API base URL.
+
+    After `failure_threshold` consecutive failures (502, 503 and 504 responses, connection errors and timeouts), the
+    circuit opens: requests fail fast with a `CircuitOpenError` instead of retrying, so that the callers aren't all
+    parked in their retry loops during an outage. After `recovery_time` seconds, the circuit is half-open: a single
+    probe request is let through, which closes the circuit if it succeeds, or opens it again if it fails.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, recovery_time=30)
+        >>> breaker.add_listener(lambda key, old, new: print(f"{key}: {old.value} -> {new.value}"))
+        >>> client = MeteoFranceClient(api_key="...", circuit_breaker=breaker)
+
+    Attributes:
+        failure_threshold: Number of consecutive failures opening the circuit.
+        recovery_time: Time after which an open circuit lets a probe request through, in seconds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        *,
+        on_state_change: Callable[[str, CircuitState, CircuitState], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            failure_threshold: Number of consecutive failures opening the circuit.
+            recovery_time: Time after which an open circuit lets a probe request through, in seconds. A probe that
+                doesn't report its outcome within this time is replaced by another one.
+            on_state_change: A function called on each transition, see `add_listener`.
+            clock: Monotonic clock, in seconds.
+        """
+        if failure_threshold < 1:
+            raise ValueError("Parameter `failure_threshold` must be a positive integer")
+        if recovery_time <= 0:
+            raise ValueError("Parameter `recovery_time` must be positive")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._listeners: list[Callable[[str, CircuitState, CircuitState], None]] = (
+            [on_state_change] if on_state_change is not None else []
+        )
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[str, CircuitState, CircuitState], None]) -> None:
+        """Call a function on each transition of a circuit.
+
+        The listeners are called from the thread of the request causing the transition. Their exceptions are logged
+        and ignored.
+
+        Args:
+            listener: A function called with the key of the circuit (the API base URL), its previous state and its
+                new state.
+        """
+        self._listeners.append(listener)
+
+    def state(self, key: str) -> CircuitState:
+        """Return the state of the circuit of an API base URL."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def before_request(self, key: str) -> None:
+        """Check that a request can be made: the circuit is closed, or it is the probe of a half-open circuit.
+
+        Args:
+            key: The API base URL.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe in flight.
+        """
+        self._check(key, probe=True)
+
+    def check(self, key: str) -> None:
+        """Check that the circuit isn't open, without being the probe of a half-open circuit (e.g. before waiting to
+        retry).
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe in flight.
+        """
+        self._check(key, probe=False)
+
+    def record_success(self, key: str) -> None:
+        """Record a request that reached the API, closing the circuit."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or (circuit.state is CircuitState.CLOSED and circuit.failures == 0):
+                return
+            circuit.failures = 0
+            transition = self._transition(key, circuit, CircuitState.CLOSED)
+        self._notify(key, transition)
+
+    def record_failure(self, key: str) -> None:
+        """Record a request that failed because of an outage, opening the circuit after `failure_threshold` failures
+        (or at once if it was the probe of a half-open circuit).
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            transition = None
+            if circuit.state is CircuitState.HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = self._clock()
+                transition = self._transition(key, circuit, CircuitState.OPEN)
+        self._notify(key, transition)
+
+    def _check(self, key: str, probe: bool) -> None:
+        """(Protected)
+        Raise a `CircuitOpenError` if no request can be made, see `before_request`.
+        """
+        transition = None
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state is CircuitState.CLOSED:
+                return
+
+            now = self._clock()
+            if circuit.state is CircuitState.OPEN:
+                retry_after = circuit.opened_at + self.recovery_time - now
+                if retry_after > 0:
+                    raise CircuitOpenError(key, retry_after)
+                if not probe:
+                    return
+                transition = self._transition(key, circuit, CircuitState.HALF_OPEN)
+                circuit.probe_started_at = now
+            else:
+                # Half-open: the probe in flight decides
+                probe_expires_at = circuit.probe_started_at + self.recovery_time
+                if not probe or now < probe_expires_at:
+                    raise CircuitOpenError(key, max(0.0, probe_expires_at - now))
+                logger.debug(f"The probe of {key} didn't report its outcome, replacing it")
+                circuit.probe_started_at = now
+        self._notify(key, transition)
+
+    @staticmethod
+    def _transition(key: str, circuit: _Circuit, state: CircuitState) -> tuple[CircuitState, CircuitState] | None:
+        """(Protected)
+        Change the state of a circuit. The lock must be held.
+
+        Returns:
+            The previous and new states, or None if the state didn't change.
+        """
+        if circuit.state is state:
+            return None
+        previous, circuit.state = circuit.state, state
+        if state is CircuitState.OPEN:
+            logger.warning(f"Circuit of {key} open after {circuit.failures} failures - failing fast")
+        else:
+            logger.info(f"Circuit of {key} {state.value}")
+        return previous, state
+
+    def _notify(self, key: str, transition: tuple[CircuitState, CircuitState] | None) -> None:
+        """(Protected)
+        Call the listeners of a transition, outside of the lock.
+        """
+        if transition is None:
+            return
+        for listener in self._listeners:
+            try:
+                listener(key, *transition)
+            except Exception:
+                logger.exception(f"Listener {listener!r} of the circuit breaker failed")
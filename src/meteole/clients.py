@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import logging
+import random
+import ssl
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import requests
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
 
-from meteole.errors import GenericMeteofranceApiError, MissingDataError
+from meteole._concurrency import AsyncSingleFlight, SingleFlight
+from meteole.circuitbreaker import CircuitBreaker
+from meteole.deadline import Deadline
+from meteole.errors import DeadlineExceededError, GenericMeteofranceApiError, MissingDataError
+from meteole.hedging import HedgingPolicy
+from meteole.metrics import Instrumentation, RequestMetrics
+from meteole.ratelimit import RateLimiter, parse_retry_after
+from meteole.tokens import FileTokenStore, Token, jwt_expiry
 
 logger = logging.getLogger(__name__)
 
@@ -42,13 +57,24 @@ class BaseClient(ABC):
     """
 
     @abstractmethod
-    def get(self, path: str, *, params: dict[str, Any] | None = None, max_retries: int = 5) -> Response:
+    def get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        max_retries: int = 5,
+        deadline: Deadline | None = None,
+        stream: bool = False,
+    ) -> Response:
         """Retrieve some data with retry capability.
 
         Args:
             path: Path to a resource.
             params: The query parameters of the request.
             max_retries: The maximum number of retry attempts in case of failure.
+            deadline: A deadline after which the request is abandoned.
+            stream: Whether to return before downloading the body of the response, to read it in chunks
+                (`Response.iter_content`). The response must then be closed.
 
         Returns:
             The response returned by the API.
@@ -56,119 +82,800 @@ class BaseClient(ABC):
         raise NotImplementedError
 
 
-class MeteoFranceClient(BaseClient):
-    """A client for interacting with the Meteo France API.
+class AsyncBaseClient(ABC):
+    """(Abstract)
 
-    This class handles the connection setup and token refreshment required for
-    authenticating and making requests to the Meteo France API.
+    Base class for asynchronous weather forecast provider clients.
+    """
+
+    @abstractmethod
+    async def get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        max_retries: int = 5,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        """Retrieve some data with retry capability.
+
+        Args:
+            path: Path to a resource.
+            params: The query parameters of the request.
+            max_retries: The maximum number of retry attempts in case of failure.
+            deadline: A deadline after which the request is abandoned.
+
+        Returns:
+            The response returned by the API.
+        """
+        raise NotImplementedError
+
+    async def aclose(self) -> None:  # noqa: B027
+        """Release the resources (e.g. connections) held by the client."""
+
+
+class _MeteoFranceClientBase:
+    """(Protected)
+
+    Authentication and response handling shared by the synchronous and asynchronous Meteo France clients.
     """
 
     # Class constants
     TOKEN_URL: str = "https://portail-api.meteofrance.fr/token"  # noqa: S105
     GET_TOKEN_TIMEOUT_SEC: int = 10
     INVALID_JWT_ERROR_CODE: str = "900901"
+    TOKEN_REFRESH_MARGIN_SEC: int = 60
     RETRY_DELAY_SEC: int = 10
+    MAX_RETRY_DELAY_SEC: int = 120
+    CONNECT_TIMEOUT_SEC: int = 10
+    READ_TIMEOUT_SEC: int = 60
 
     def __init__(
         self,
         *,
         token: str | None = None,
         api_base_url: str = "https://public-api.meteofrance.fr/public/",  # need it as an argument since PIAF model has a different base URL
+        token_url: str | None = None,
         api_key: str | None = None,
         application_id: str | None = None,
         certs_path: Path | None = None,
+        rate_limiter: RateLimiter | None = None,
+        connect_timeout: float | None = CONNECT_TIMEOUT_SEC,
+        read_timeout: float | None = READ_TIMEOUT_SEC,
+        max_total_time: float | None = None,
+        token_store: FileTokenStore | None = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         """
         Initialize attributes.
 
         Args:
             token: The authentication token for accessing the API.
+            api_base_url: The base URL of the API.
+            token_url: The URL of the token endpoint, requested with `application_id`. Defaults to `TOKEN_URL`.
             api_key: The API key for accessing the Meteo France API.
             application_id: The application ID used for identification.
             certs_path: The path to a file or directory of trusted CA certificates for SSL verification.
+            rate_limiter: A rate limiter, possibly shared with other clients, to stay under the API quotas.
+            connect_timeout: Time to establish a connection, in seconds (None to wait forever).
+            read_timeout: Time to wait for the server between two bytes, in seconds (None to wait forever).
+            max_total_time: Time budget of a request, retries included, in seconds (None for no limit).
+            token_store: A store to share the tokens requested with `application_id` between processes.
+            coalesce_requests: Whether to make a single request for concurrent identical requests. Off by default.
+            circuit_breaker: A circuit breaker, possibly shared with other clients, failing fast during outages.
+            hedging: A policy to send a duplicate of the slow requests, possibly shared with other clients.
+            instrumentation: Receives the measures of every request, see `meteole.metrics`.
         """
         self._api_base_url = api_base_url
+        self._token_url = token_url
+        self._rate_limiter = rate_limiter
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._max_total_time = max_total_time
+        self._token_store = token_store
         self._token = token
+        self._token_expires_at: float | None = jwt_expiry(token) if token is not None else None
         self._api_key = api_key
         self._application_id = application_id
         self._verify: str | None = str(certs_path) if certs_path is not None else None
-
-        self._session = Session()
+        self._coalesce_requests = coalesce_requests
+        self._circuit_breaker = circuit_breaker
+        self._hedging = hedging
+        self._instrumentation = instrumentation
 
         self._token_expired: bool = False
 
+    def _check_circuit(self, probe: bool = True) -> None:
+        """(Protected)
+        Fail fast if the circuit of the API is open, see `CircuitBreaker.before_request` (or `check` if not `probe`).
+
+        Raises:
+            CircuitOpenError: If the circuit of the API is open.
+        """
+        if self._circuit_breaker is None:
+            return
+        if probe:
+            self._circuit_breaker.before_request(self._api_base_url)
+        else:
+            self._circuit_breaker.check(self._api_base_url)
+
+    def _record_attempt(self, resp: Any | None) -> None:
+        """(Protected)
+        Report the outcome of an attempt to the circuit breaker, if any.
+
+        Args:
+            resp: The response of the attempt, None if the connection failed or timed out.
+        """
+        if self._circuit_breaker is None:
+            return
+        if resp is None or resp.status_code in (
+            HttpStatus.BAD_GATEWAY,
+            HttpStatus.UNAVAILABLE,
+            HttpStatus.GATEWAY_TIMEOUT,
+        ):
+            self._circuit_breaker.record_failure(self._api_base_url)
+        else:
+            self._circuit_breaker.record_success(self._api_base_url)
+
+    def _report(self, metrics: RequestMetrics) -> None:
+        """(Protected)
+        Report the measures of a request to the instrumentation, if any. Its errors never fail the request.
+        """
+        if self._instrumentation is None:
+            return
+        try:
+            self._instrumentation.record_request(metrics)
+        except Exception:
+            logger.exception("Failed to report the measures of a request")
+
+    def _body_size(self, resp: Any, stream: bool = False) -> int:
+        """(Protected)
+        Return the size of the body of a response, in bytes (announced by `Content-Length` if it is streamed).
+        """
+        if self._instrumentation is None:
+            # Not measured
+            return 0
+        try:
+            return int(resp.headers.get("Content-Length", 0)) if stream else len(resp.content)
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _request_key(path: str, params: dict[str, Any] | None) -> tuple[str, tuple[tuple[str, Any], ...]]:
+        """(Protected)
+        Return the key identifying identical requests: the path and the parameters, in a canonical order (the
+        subsets of a coverage can be given in any order).
+        """
+        return path, tuple(
+            sorted(
+                (name, tuple(sorted(map(str, value))) if isinstance(value, (list, tuple)) else str(value))
+                for name, value in (params or {}).items()
+            )
+        )
+
+    def _is_token_expiring(self) -> bool:
+        """(Protected)
+        Check if the token expires soon and can be refreshed beforehand (i.e. `application_id` is known).
+        """
+        return (
+            self._application_id is not None
+            and self._token is not None
+            and self._token_expires_at is not None
+            and self._token_expires_at - time.time() <= self.TOKEN_REFRESH_MARGIN_SEC
+        )
+
+    def _fetch_token(self, rejected_token: str | None) -> Token:
+        """(Protected)
+        Get a new token, from the token store if another process already refreshed it, or from the API.
+
+        Args:
+            rejected_token: The token that expired or is about to, which must not be returned.
+
+        Returns:
+            A valid token.
+        """
+        if self._token_store is None:
+            return self._request_token()
+
+        key = self._token_store.key(str(self._application_id))
+        with self._token_store.lock():
+            token = self._token_store.load(key)
+            if (
+                token is not None
+                and token.access_token != rejected_token
+                and not token.expires_within(self.TOKEN_REFRESH_MARGIN_SEC)
+            ):
+                logger.debug("Using the token of the token store")
+                return token
+
+            token = self._request_token()
+            self._token_store.save(key, token)
+
+        return token
+
+    def _request_token(self) -> Token:
+        """(Protected)
+        Request a token from the Meteo-France API.
+
+        If a new token is requested before the previous one expires, the previous one is invalidated.
+        """
+        logger.info("Requesting a new token")
+
+        # Seems useless (TODO remove if it's True):
+        # params: dict[str, str] = {"grant_type": "client_credentials"}
+        headers: dict[str, str] = {"Authorization": "Basic " + str(self._application_id)}
+
+        resp: Response = requests.post(
+            self._token_url or self.TOKEN_URL,
+            # params=params,
+            headers=headers,
+            timeout=self.GET_TOKEN_TIMEOUT_SEC,
+            verify=self._verify,
+        )
+        return Token.from_response(resp.json())
+
+    def _auth_headers(self) -> dict[str, str]:
+        """(Protected)
+        Build the authentication headers of the requests.
+
+        Note:
+        If the API key is provided, it is used to authenticate the user.
+        Otherwise, the token is used.
+        """
+        if self._api_key is not None:
+            logger.debug("using api key")
+            return {"apikey": self._api_key}
+
+        logger.debug("using token")
+        return {"Authorization": f"Bearer {self._token}"}
+
+    def _handle_response(self, resp: Any) -> bool:
+        """(Protected)
+        Check the status of a response.
+
+        Args:
+            resp: A request's response from the API.
+
+        Returns:
+            True if the request succeeded, False if it should be retried (the token may have to be refreshed).
+
+        Raises:
+            GenericMeteofranceApiError: The request is forbidden or invalid.
+            MissingDataError: The requested data does not exist.
+        """
+        if (
+            resp.status_code == HttpStatus.OK
+            or resp.status_code == HttpStatus.REQUEST_ACCEPTED
+            or resp.status_code == HttpStatus.FILE_SENT
+        ):
+            logger.debug("Successful request")
+            return True
+
+        elif self._is_token_expired(resp):
+            logger.info("Token expired, requesting a new one")
+
+        elif resp.status_code == HttpStatus.FORBIDDEN:
+            logger.error("Access forbidden")
+            raise GenericMeteofranceApiError(resp.text)
+
+        elif resp.status_code == HttpStatus.BAD_REQUEST:
+            logger.error("Parameter error")
+            raise GenericMeteofranceApiError(resp.text)
+
+        elif resp.status_code == HttpStatus.NOT_FOUND:
+            logger.error("Missing data")
+            raise MissingDataError(resp.text)
+
+        elif resp.status_code == HttpStatus.TOO_MANY_REQUESTS:
+            logger.warning("Too many requests")
+
+        elif (
+            resp.status_code == HttpStatus.BAD_GATEWAY
+            or resp.status_code == HttpStatus.UNAVAILABLE
+            or resp.status_code == HttpStatus.GATEWAY_TIMEOUT
+        ):
+            logger.error("Service not available")
+
+        return False
+
+    def _get_retry_after(self, resp: Any) -> float | None:
+        """(Protected)
+        Return the time to wait before retrying, as requested by a 429 response.
+
+        Args:
+            resp: A request's response from the API.
+
+        Returns:
+            The `Retry-After` delay (or `RETRY_DELAY_SEC` if missing) for a 429 response, None otherwise.
+        """
+        if resp.status_code != HttpStatus.TOO_MANY_REQUESTS:
+            return None
+        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+        return float(self.RETRY_DELAY_SEC) if retry_after is None else retry_after
+
+    def _get_waiting_time(self, attempt: int, family: str, retry_after: float | None) -> float:
+        """(Protected)
+        Compute the time to wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far.
+            family: API family of the request, see `RateLimiter.family`.
+            retry_after: Delay requested by a 429 response, if any.
+
+        Returns:
+            The waiting time, in seconds.
+        """
+        if retry_after is None:
+            # Exponential backoff with full jitter, so that concurrent callers don't retry in lockstep
+            backoff = min(self.MAX_RETRY_DELAY_SEC, self.RETRY_DELAY_SEC * 2 ** (attempt - 1))
+            return random.uniform(0, backoff)
+
+        if self._rate_limiter is not None:
+            # Every caller of this API family will wait in the rate limiter
+            self._rate_limiter.penalize(family, retry_after)
+            return 0.0
+
+        return retry_after
+
+    def _get_deadline(self, deadline: Deadline | None) -> Deadline | None:
+        """(Protected)
+        Combine the deadline of a request with the maximum total time of the client.
+
+        Args:
+            deadline: The deadline given by the caller, if any.
+
+        Returns:
+            The earliest deadline, or None if there is none.
+        """
+        if deadline is None:
+            return None if self._max_total_time is None else Deadline(self._max_total_time)
+        return deadline.earliest(self._max_total_time)
+
+    def _get_timeouts(self, deadline: Deadline | None) -> tuple[float | None, float | None]:
+        """(Protected)
+        Return the (connect, read) timeouts of an attempt, capped by the remaining time before the deadline.
+        """
+        if deadline is None:
+            return self._connect_timeout, self._read_timeout
+
+        remaining = deadline.remaining()
+        return (
+            remaining if self._connect_timeout is None else min(self._connect_timeout, remaining),
+            remaining if self._read_timeout is None else min(self._read_timeout, remaining),
+        )
+
+    @staticmethod
+    def _check_deadline(deadline: Deadline | None, url: str, waiting_time: float = 0.0) -> None:
+        """(Protected)
+        Abandon a request if its deadline expires before its next attempt.
+
+        Args:
+            deadline: The deadline of the request, if any.
+            url: The URL of the request.
+            waiting_time: Time to wait before the next attempt, in seconds.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before the next attempt.
+        """
+        if deadline is not None and deadline.remaining() <= waiting_time:
+            raise DeadlineExceededError(f"Deadline exceeded for GET {url}")
+
+    def _is_token_expired(self, response: Any) -> bool:
+        """(Protected)
+        Check if the token is expired.
+
+        Args:
+            response: A request's response from the API.
+
+        Returns:
+            True if the token is expired, False otherwise.
+        """
+        result: bool = False
+
+        if response.status_code == HttpStatus.UNAUTHORIZED and "application/json" in response.headers["Content-Type"]:
+            error: str = response.json()["code"]
+
+            if error == self.INVALID_JWT_ERROR_CODE:
+                result = True
+                self._token_expired = True
+
+        return result
+
+
+class MeteoFranceClient(_MeteoFranceClientBase, BaseClient):
+    """A client for interacting with the Meteo France API.
+
+    This class handles the connection setup and token refreshment required for
+    authenticating and making requests to the Meteo France API.
+    """
+
+    # Class constants
+    MAX_CONCURRENT_HEDGES: int = 4
+
+    def __init__(
+        self,
+        *,
+        token: str | None = None,
+        api_base_url: str = "https://public-api.meteofrance.fr/public/",  # need it as an argument since PIAF model has a different base URL
+        token_url: str | None = None,
+        api_key: str | None = None,
+        application_id: str | None = None,
+        certs_path: Path | None = None,
+        rate_limiter: RateLimiter | None = None,
+        connect_timeout: float | None = _MeteoFranceClientBase.CONNECT_TIMEOUT_SEC,
+        read_timeout: float | None = _MeteoFranceClientBase.READ_TIMEOUT_SEC,
+        max_total_time: float | None = None,
+        token_store: FileTokenStore | None = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> None:
+        """
+        Initialize attributes.
+
+        Args:
+            token: The authentication token for accessing the API.
+            api_base_url: The base URL of the API.
+            token_url: The URL of the token endpoint, requested with `application_id`. Defaults to `TOKEN_URL`.
+            api_key: The API key for accessing the Meteo France API.
+            application_id: The application ID used for identification.
+            certs_path: The path to a file or directory of trusted CA certificates for SSL verification.
+            rate_limiter: A rate limiter, possibly shared with other clients, to stay under the API quotas.
+            connect_timeout: Time to establish a connection, in seconds (None to wait forever).
+            read_timeout: Time to wait for the server between two bytes, in seconds (None to wait forever).
+            max_total_time: Time budget of a request, retries included, in seconds (None for no limit).
+            token_store: A store to share the tokens requested with `application_id` between processes.
+            coalesce_requests: Whether to make a single request for concurrent identical requests (same path and
+                parameters, streamed requests excepted). Off by default: the callers share the same `Response`,
+                and an error of the request is raised to each of them. See `coalesced_requests`.
+            circuit_breaker: A circuit breaker, possibly shared with other clients: during an outage of the API,
+                requests fail fast with a `CircuitOpenError` instead of retrying.
+            hedging: A policy, possibly shared with other clients, to send a duplicate of the requests that are
+                slower than most recent ones (streamed requests excepted): the first response wins. The requests
+                are then sent from a pool of `pool_maxsize` threads, plus `MAX_CONCURRENT_HEDGES` for the duplicates.
+            instrumentation: Receives the measures (family, status, latency, size, retries, ...) of every request,
+                e.g. a `meteole.metrics.MetricsCollector`.
+            pool_connections: Number of hosts whose connection pool is kept.
+            pool_maxsize: Number of connections kept open per host. Set it to the number of concurrent requests
+                (e.g. `max_workers` of `get_coverage`), otherwise the extra connections are discarded.
+            pool_block: Whether to wait for a free connection when `pool_maxsize` connections are in use,
+                instead of opening a connection that is discarded afterwards.
+            keep_alive: Whether to reuse the connections (and their TLS sessions) between requests.
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("Parameters `pool_connections` and `pool_maxsize` must be positive integers")
+
+        super().__init__(
+            token=token,
+            api_base_url=api_base_url,
+            token_url=token_url,
+            api_key=api_key,
+            application_id=application_id,
+            certs_path=certs_path,
+            rate_limiter=rate_limiter,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_total_time=max_total_time,
+            token_store=token_store,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            instrumentation=instrumentation,
+        )
+
+        self._token_lock = threading.Lock()
+        self._single_flight: SingleFlight[Response] = SingleFlight()
+        self._hedging_executor: ThreadPoolExecutor | None = None
+        self._hedging_lock = threading.Lock()
+        self._hedge_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_HEDGES)
+        self._pool_maxsize = pool_maxsize
+        self._session = Session()
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
         # Initialize the requests session object
         self._connect()
 
-    def get(self, path: str, *, params: dict[str, Any] | None = None, max_retries: int = 5) -> Response:
+    def __enter__(self) -> MeteoFranceClient:
+        """Use the client as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the client when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        if self._hedging_executor is not None:
+            self._hedging_executor.shutdown(wait=False)
+        self._session.close()
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Return the usage statistics of the connection pools.
+
+        Returns:
+            A dictionary with an entry per host ("https://public-api.meteofrance.fr:443", ...), holding:
+                - connections: number of connections created by the pool. A connection closed by the server is
+                  reopened in place, without being counted again.
+                - requests: number of requests made.
+                - in_use: number of connections taken from the pool.
+                - idle: number of open connections waiting in the pool.
+                - maxsize: maximum number of connections kept in the pool.
+        """
+        pools = self._adapter.poolmanager.pools
+        stats: dict[str, dict[str, int]] = {}
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                # Evicted meanwhile
+                continue
+
+            # The queue holds the idle connections, and None placeholders for the connections not opened yet
+            queue = list(pool.pool.queue) if pool.pool is not None else []
+            maxsize = pool.pool.maxsize if pool.pool is not None else 0
+            stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "connections": pool.num_connections,
+                "requests": pool.num_requests,
+                "in_use": max(0, maxsize - len(queue)),
+                "idle": sum(conn is not None for conn in queue),
+                "maxsize": maxsize,
+            }
+
+        return stats
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of requests that waited for an identical request in flight instead of being made."""
+        return self._single_flight.coalesced
+
+    def get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        max_retries: int = 5,
+        deadline: Deadline | None = None,
+        stream: bool = False,
+    ) -> Response:
         """
         Make a GET request to the API with optional retries.
 
+        With `coalesce_requests`, concurrent identical requests are coalesced: a single request is made,
+        and its response (or error) is returned to every caller.
+
         Args:
             path: Path to a resource.
             params: The query parameters of the request.
             max_retries: The maximum number of retry attempts in case of failure.
+            deadline: A deadline after which the request is abandoned.
+            stream: Whether to return before downloading the body of the response, to read it in chunks
+                (`Response.iter_content`). The response must then be closed. Streamed requests are never
+                coalesced.
 
         Returns:
             The response returned by the API.
+
+        Raises:
+            DeadlineExceededError: If the deadline (or `max_total_time`) expires before a successful response.
+        """
+        deadline = self._get_deadline(deadline)
+        if stream or not self._coalesce_requests:
+            return self._get(path, params, max_retries, deadline, stream)
+
+        try:
+            return self._single_flight.do(
+                self._request_key(path, params),
+                lambda: self._get(path, params, max_retries, deadline),
+                timeout=None if deadline is None else deadline.remaining(),
+            )
+        except DeadlineExceededError:
+            raise
+        except concurrent.futures.TimeoutError as exc:
+            # Waiting for an identical request in flight
+            raise DeadlineExceededError(f"Deadline exceeded for GET {self._api_base_url + path}") from exc
+
+    def _get(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        max_retries: int,
+        deadline: Deadline | None,
+        stream: bool = False,
+    ) -> Response:
+        """(Protected)
+        Make a GET request to the API with retries, see `get`, and report its measures.
+        """
+        metrics = RequestMetrics(family=RateLimiter.family(path))
+        start = time.monotonic()
+        try:
+            return self._get_with_retries(path, params, max_retries, deadline, stream, metrics)
+        except BaseException as exc:
+            metrics.error = type(exc).__name__
+            raise
+        finally:
+            metrics.latency = time.monotonic() - start
+            self._report(metrics)
+
+    def _get_with_retries(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        max_retries: int,
+        deadline: Deadline | None,
+        stream: bool,
+        metrics: RequestMetrics,
+    ) -> Response:
+        """(Protected)
+        Make a GET request to the API with retries, measuring it, see `_get`.
         """
         url: str = self._api_base_url + path
+        family: str = metrics.family
         attempt: int = 0
         logger.debug(f"GET {url}")
 
         while attempt < max_retries:
-            # HTTP GET request
-            try:
-                resp: Response = self._session.get(url, params=params, verify=self._verify)
-
-                if (
-                    resp.status_code == HttpStatus.OK
-                    or resp.status_code == HttpStatus.REQUEST_ACCEPTED
-                    or resp.status_code == HttpStatus.FILE_SENT
-                ):
-                    logger.debug("Successful request")
-                    return resp
+            self._check_circuit()
+            if self._rate_limiter is not None:
+                metrics.throttle_time += self._rate_limiter.acquire(family)
 
-                elif self._is_token_expired(resp):
-                    logger.info("Token expired, requesting a new one")
+            self._check_deadline(deadline, url)
+            retry_after: float | None = None
 
-                    # Refresh the cached token
-                    self._token = self._get_token()
+            if self._is_token_expiring():
+                # Refresh the token before the API rejects it
+                self._refresh_token(self._token)
+                metrics.token_refreshes += 1
 
-                    # Reconnect with the new token
-                    self._connect()
+            # HTTP GET request
+            try:
+                token = self._token
+                metrics.attempts += 1
+                resp = self._send(url, params, self._get_timeouts(deadline), stream, metrics)
+                metrics.status = resp.status_code
+                self._record_attempt(resp)
 
-                elif resp.status_code == HttpStatus.FORBIDDEN:
-                    logger.error("Access forbidden")
-                    raise GenericMeteofranceApiError(resp.text)
+                if self._handle_response(resp):
+                    metrics.bytes_received = self._body_size(resp, stream)
+                    return resp
 
-                elif resp.status_code == HttpStatus.BAD_REQUEST:
-                    logger.error("Parameter error")
-                    raise GenericMeteofranceApiError(resp.text)
+                # Release the connection of a streamed response
+                resp.close()
 
-                elif resp.status_code == HttpStatus.NOT_FOUND:
-                    logger.error("Missing data")
-                    raise MissingDataError(resp.text)
+                if self._token_expired:
+                    self._refresh_token(token)
+                    metrics.token_refreshes += 1
 
-                elif (
-                    resp.status_code == HttpStatus.BAD_GATEWAY
-                    or resp.status_code == HttpStatus.UNAVAILABLE
-                    or resp.status_code == HttpStatus.GATEWAY_TIMEOUT
-                ):
-                    logger.error("Service not available")
+                retry_after = self._get_retry_after(resp)
 
-            except requests.exceptions.ConnectionError as e:
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
                 logger.warning(f"Connection error : {e}.")
+                self._record_attempt(None)
 
             # Wait before retrying
             attempt += 1
-            waiting_time = attempt * self.RETRY_DELAY_SEC
-            logger.info(f"Retrying (attempt {attempt}/{max_retries}) - waiting {waiting_time}s before retrying...")
+            if attempt >= max_retries:
+                break
+            # Stop retrying once the circuit is open
+            self._check_circuit(probe=False)
+            waiting_time = self._get_waiting_time(attempt, family, retry_after)
+            self._check_deadline(deadline, url, waiting_time)
+            logger.info(f"Retrying (attempt {attempt}/{max_retries}) - waiting {waiting_time:.2f}s before retrying...")
+            metrics.backoff_time += waiting_time
             time.sleep(waiting_time)
-            continue
 
         raise GenericMeteofranceApiError(f"Failed to get a successful response from API after {attempt} retries")
 
+    def _send(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        timeout: tuple[float | None, float | None],
+        stream: bool,
+        metrics: RequestMetrics,
+    ) -> Response:
+        """(Protected)
+        Send a GET request, hedged if the client has a hedging policy (streamed requests are never hedged).
+
+        Returns:
+            The first response.
+        """
+
+        def send() -> Response:
+            return self._session.get(url, params=params, verify=self._verify, timeout=timeout, stream=stream)
+
+        hedging = self._hedging
+        if hedging is None or stream:
+            return send()
+
+        delay = hedging.delay()
+        if delay is None:
+            start = time.monotonic()
+            resp = send()
+            hedging.record(time.monotonic() - start)
+            return resp
+
+        # Both attempts run in the pool, so that the first response is returned while the other one is in flight.
+        # The delay and the latency are measured from the start of the primary request, not from its submission
+        started = threading.Event()
+        start = time.monotonic()
+
+        def send_primary() -> Response:
+            nonlocal start
+            start = time.monotonic()
+            started.set()
+            return send()
+
+        executor = self._get_hedging_executor()
+        attempts: list[Future[Response]] = [executor.submit(send_primary)]
+        started.wait()
+        done, _ = wait(attempts, timeout=delay)
+        if not done and self._hedge_slots.acquire(blocking=False):
+            if self._acquire_hedge(hedging, metrics):
+                logger.debug(f"No response after {delay:.3f}s, hedging GET {url}")
+                attempts.append(executor.submit(self._send_hedge, send))
+            else:
+                self._hedge_slots.release()
+
+        # The first successful response wins, the other one is dropped when it arrives
+        errors: list[BaseException] = []
+        pending: set[Future[Response]] = set(attempts)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for attempt, error in [(attempt, attempt.exception()) for attempt in sorted(done, key=attempts.index)]:
+                if error is None:
+                    hedging.record(time.monotonic() - start, hedge_won=attempt is not attempts[0])
+                    return attempt.result()
+                errors.append(error)
+        raise errors[0]
+
+    def _acquire_hedge(self, hedging: HedgingPolicy, metrics: RequestMetrics) -> bool:
+        """(Protected)
+        Take the right to send a hedge from the policy, and a token from the rate limiter if any. A hedge never
+        waits for the rate limiter: it isn't sent when the quota is reached.
+        """
+        if not hedging.acquire():
+            return False
+        if self._rate_limiter is not None:
+            throttle_time = self._rate_limiter.try_acquire(metrics.family)
+            if throttle_time is None:
+                logger.debug(f"Rate limit of '{metrics.family}' reached - not hedging")
+                hedging.release()
+                return False
+            metrics.throttle_time += throttle_time
+        return True
+
+    def _send_hedge(self, send: Callable[[], Response]) -> Response:
+        """(Protected)
+        Send a hedge, and free its slot afterwards.
+        """
+        try:
+            return send()
+        finally:
+            self._hedge_slots.release()
+
+    def _get_hedging_executor(self) -> ThreadPoolExecutor:
+        """(Protected)
+        Return the pool sending the hedged requests, created on first use with a thread per pooled connection and
+        per hedge slot.
+        """
+        with self._hedging_lock:
+            if self._hedging_executor is None:
+                self._hedging_executor = ThreadPoolExecutor(
+                    max_workers=self._pool_maxsize + self.MAX_CONCURRENT_HEDGES, thread_name_prefix="meteole-hedging"
+                )
+            return self._hedging_executor
+
     def _connect(self):
         """(Protected)
         Connect to the Meteo-France API.
@@ -185,72 +892,398 @@ class MeteoFranceClient(BaseClient):
             # Connection with application_id
             self._token = self._get_token()
 
-        if self._api_key is not None:
-            logger.debug("using api key")
-
-            # Connection with api_key
-            self._session.headers.update({"apikey": self._api_key})
-
-        else:
-            logger.debug("using token")
-
-            # Connection with token
-            self._session.headers.update({"Authorization": f"Bearer {self._token}"})
+        self._session.headers.update(self._auth_headers())
 
     def _get_token(self) -> str:
         """(Protected)
-        Request a token from the Meteo-France API.
+        Get a token for the Meteo-France API.
 
         The token lasts 1 hour, and is used to authenticate the user.
         If a new token is requested before the previous one expires, the previous one is invalidated.
-        A local cache is used to avoid requesting a new token at each run of the script.
+        The token is cached by the client, and shared between processes through the token store, if any.
 
         Rerturns:
             A JWT.
         """
-        if self._token_expired is False and self._token is not None:
+        if self._token_expired is False and self._token is not None and not self._is_token_expiring():
             # Use cached token
-            token: str = self._token
+            return self._token
 
-        elif self._token_expired is True and self._application_id is None:
+        if self._application_id is None:
             # Can do nothing
             raise ValueError("The 'application_id' is unknown, can't get a new token")
 
-        else:
-            # Retrieve a new token
-
-            # Seems useless (TODO remove if it's True):
-            # params: dict[str, str] = {"grant_type": "client_credentials"}
-            headers: dict[str, str] = {"Authorization": "Basic " + str(self._application_id)}
-
-            resp: Response = requests.post(
-                self.TOKEN_URL,
-                # params=params,
-                headers=headers,
-                timeout=self.GET_TOKEN_TIMEOUT_SEC,
-                verify=self._verify,
+        token = self._fetch_token(self._token)
+        self._token_expires_at = token.expires_at
+        return token.access_token
+
+    def _refresh_token(self, expired_token: str | None) -> None:
+        """(Protected)
+        Get a new token and use it for the next requests.
+
+        Concurrent refreshes of the same token (in threads) are collapsed into a single request.
+
+        Args:
+            expired_token: The token that was rejected by the API or is about to expire.
+        """
+        with self._token_lock:
+            if self._token != expired_token:
+                # Already refreshed by another thread
+                self._token_expired = False
+                return
+
+            self._token = self._get_token()
+            self._token_expired = False
+
+            # Reconnect with the new token
+            self._connect()
+
+
+class AsyncMeteoFranceClient(_MeteoFranceClientBase, AsyncBaseClient):
+    """An asynchronous client for interacting with the Meteo France API.
+
+    It has the same retry and token refreshment behaviour as `MeteoFranceClient`, but is built on
+    `httpx.AsyncClient`, so that a single event loop can keep many requests in flight.
+
+    Note: The optional dependency `httpx` is required (`pip install meteole[async]`).
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str | None = None,
+        api_base_url: str = "https://public-api.meteofrance.fr/public/",
+        token_url: str | None = None,
+        api_key: str | None = None,
+        application_id: str | None = None,
+        certs_path: Path | None = None,
+        rate_limiter: RateLimiter | None = None,
+        connect_timeout: float | None = _MeteoFranceClientBase.CONNECT_TIMEOUT_SEC,
+        read_timeout: float | None = _MeteoFranceClientBase.READ_TIMEOUT_SEC,
+        max_total_time: float | None = None,
+        token_store: FileTokenStore | None = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+        max_connections: int = 100,
+    ) -> None:
+        """
+        Initialize attributes.
+
+        Args:
+            token: The authentication token for accessing the API.
+            api_base_url: The base URL of the API.
+            token_url: The URL of the token endpoint, requested with `application_id`. Defaults to `TOKEN_URL`.
+            api_key: The API key for accessing the Meteo France API.
+            application_id: The application ID used for identification.
+            certs_path: The path to a file or directory of trusted CA certificates for SSL verification.
+            rate_limiter: A rate limiter, possibly shared with other clients, to stay under the API quotas.
+            connect_timeout: Time to establish a connection, in seconds (None to wait forever).
+            read_timeout: Time to wait for the server between two bytes, in seconds (None to wait forever).
+            max_total_time: Time budget of a request, retries included, in seconds (None for no limit).
+            token_store: A store to share the tokens requested with `application_id` between processes.
+            coalesce_requests: Whether to make a single request for concurrent identical requests (same path and
+                parameters). Off by default: the callers share the same response, and an error of the request is
+                raised to each of them. See `coalesced_requests`.
+            circuit_breaker: A circuit breaker, possibly shared with other clients: during an outage of the API,
+                requests fail fast with a `CircuitOpenError` instead of retrying.
+            hedging: A policy, possibly shared with other clients, to send a duplicate of the requests that are
+                slower than most recent ones: the first response wins.
+            instrumentation: Receives the measures (family, status, latency, size, retries, ...) of every request,
+                e.g. a `meteole.metrics.MetricsCollector`.
+            max_connections: The maximum number of concurrent connections to the API.
+        """
+        if find_spec("httpx") is None:
+            raise ImportError(
+                "The 'httpx' module is required by the asynchronous client. Please install it using:\n\n"
+                "  pip install meteole[async]\n\n"
             )
-            token = resp.json()["access_token"]
+        import httpx  # noqa: PLC0415
 
-        return token
+        super().__init__(
+            token=token,
+            api_base_url=api_base_url,
+            token_url=token_url,
+            api_key=api_key,
+            application_id=application_id,
+            certs_path=certs_path,
+            rate_limiter=rate_limiter,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_total_time=max_total_time,
+            token_store=token_store,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            instrumentation=instrumentation,
+        )
 
-    def _is_token_expired(self, response: Response) -> bool:
-        """(Protected)
-        Check if the token is expired.
+        if self._api_key is None and self._token is None and self._application_id is None:
+            raise ValueError("api_key or token or application_id must be provided")
+
+        verify: ssl.SSLContext | bool = True
+        if certs_path is not None:
+            verify = (
+                ssl.create_default_context(capath=self._verify)
+                if Path(certs_path).is_dir()
+                else ssl.create_default_context(cafile=self._verify)
+            )
+
+        self._client = httpx.AsyncClient(
+            verify=verify,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=httpx.Timeout(connect_timeout, read=read_timeout, write=read_timeout, pool=None),
+        )
+        self._httpx = httpx
+        self._transport_errors: tuple[type[Exception], ...] = (httpx.TransportError,)
+        self._token_lock: asyncio.Lock | None = None
+        self._single_flight: AsyncSingleFlight[Any] = AsyncSingleFlight()
+
+        if self._api_key is not None or self._token is not None:
+            self._client.headers.update(self._auth_headers())
+
+    async def __aenter__(self) -> AsyncMeteoFranceClient:
+        """Use the client as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the client when leaving the context."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._client.aclose()
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of requests that waited for an identical request in flight instead of being made."""
+        return self._single_flight.coalesced
+
+    async def get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        max_retries: int = 5,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        """
+        Make a GET request to the API with optional retries.
+
+        With `coalesce_requests`, concurrent identical requests are coalesced: a single request is made,
+        and its response (or error) is returned to every caller.
 
         Args:
-            response: A request's response from the API.
+            path: Path to a resource.
+            params: The query parameters of the request.
+            max_retries: The maximum number of retry attempts in case of failure.
+            deadline: A deadline after which the request is abandoned.
 
         Returns:
-            True if the token is expired, False otherwise.
+            The response (`httpx.Response`) returned by the API.
+
+        Raises:
+            DeadlineExceededError: If the deadline (or `max_total_time`) expires before a successful response.
         """
-        result: bool = False
+        deadline = self._get_deadline(deadline)
+        if not self._coalesce_requests:
+            return await self._get(path, params, max_retries, deadline)
 
-        if response.status_code == HttpStatus.UNAUTHORIZED and "application/json" in response.headers["Content-Type"]:
-            error: str = response.json()["code"]
+        try:
+            return await self._single_flight.do(
+                self._request_key(path, params),
+                lambda: self._get(path, params, max_retries, deadline),
+                timeout=None if deadline is None else deadline.remaining(),
+            )
+        except DeadlineExceededError:
+            raise
+        except asyncio.TimeoutError as exc:
+            # Waiting for an identical request in flight
+            raise DeadlineExceededError(f"Deadline exceeded for GET {self._api_base_url + path}") from exc
 
-            if error == self.INVALID_JWT_ERROR_CODE:
-                result = True
-                self._token_expired = True
+    async def _get(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        max_retries: int,
+        deadline: Deadline | None,
+    ) -> Any:
+        """(Protected)
+        Make a GET request to the API with retries, see `get`, and report its measures.
+        """
+        metrics = RequestMetrics(family=RateLimiter.family(path))
+        start = time.monotonic()
+        try:
+            return await self._get_with_retries(path, params, max_retries, deadline, metrics)
+        except BaseException as exc:
+            metrics.error = type(exc).__name__
+            raise
+        finally:
+            metrics.latency = time.monotonic() - start
+            self._report(metrics)
 
-        return result
+    async def _get_with_retries(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        max_retries: int,
+        deadline: Deadline | None,
+        metrics: RequestMetrics,
+    ) -> Any:
+        """(Protected)
+        Make a GET request to the API with retries, measuring it, see `_get`.
+        """
+        url: str = self._api_base_url + path
+        family: str = metrics.family
+        attempt: int = 0
+        logger.debug(f"GET {url}")
+
+        if self._api_key is None and self._token is None:
+            # Connection with application_id
+            await self._refresh_token(None)
+            metrics.token_refreshes += 1
+
+        while attempt < max_retries:
+            self._check_circuit()
+            if self._rate_limiter is not None:
+                metrics.throttle_time += await self._rate_limiter.aacquire(family)
+
+            self._check_deadline(deadline, url)
+            retry_after: float | None = None
+
+            if self._is_token_expiring():
+                # Refresh the token before the API rejects it
+                await self._refresh_token(self._token)
+                metrics.token_refreshes += 1
+
+            # HTTP GET request
+            try:
+                token = self._token
+                connect_timeout, read_timeout = self._get_timeouts(deadline)
+                timeout = self._httpx.Timeout(
+                    connect=connect_timeout,
+                    read=read_timeout,
+                    write=read_timeout,
+                    pool=None if deadline is None else deadline.remaining(),
+                )
+                metrics.attempts += 1
+                resp = await self._send(url, params, timeout, metrics)
+                metrics.status = resp.status_code
+                self._record_attempt(resp)
+
+                if self._handle_response(resp):
+                    metrics.bytes_received = self._body_size(resp)
+                    return resp
+
+                if self._token_expired:
+                    await self._refresh_token(token)
+                    metrics.token_refreshes += 1
+
+                retry_after = self._get_retry_after(resp)
+
+            except self._transport_errors as e:
+                logger.warning(f"Connection error : {e}.")
+                self._record_attempt(None)
+
+            # Wait before retrying
+            attempt += 1
+            if attempt >= max_retries:
+                break
+            # Stop retrying once the circuit is open
+            self._check_circuit(probe=False)
+            waiting_time = self._get_waiting_time(attempt, family, retry_after)
+            self._check_deadline(deadline, url, waiting_time)
+            logger.info(f"Retrying (attempt {attempt}/{max_retries}) - waiting {waiting_time:.2f}s before retrying...")
+            metrics.backoff_time += waiting_time
+            await asyncio.sleep(waiting_time)
+
+        raise GenericMeteofranceApiError(f"Failed to get a successful response from API after {attempt} retries")
+
+    async def _send(self, url: str, params: dict[str, Any] | None, timeout: Any, metrics: RequestMetrics) -> Any:
+        """(Protected)
+        Send a GET request, hedged if the client has a hedging policy.
+
+        Returns:
+            The first response.
+        """
+        hedging = self._hedging
+        if hedging is None:
+            return await self._client.get(url, params=params, timeout=timeout)
+
+        start = time.monotonic()
+        delay = hedging.delay()
+        if delay is None:
+            resp = await self._client.get(url, params=params, timeout=timeout)
+            hedging.record(time.monotonic() - start)
+            return resp
+
+        attempts = [asyncio.ensure_future(self._client.get(url, params=params, timeout=timeout))]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and await self._acquire_hedge(hedging, metrics):
+                logger.debug(f"No response after {delay:.3f}s, hedging GET {url}")
+                attempts.append(asyncio.ensure_future(self._client.get(url, params=params, timeout=timeout)))
+
+            # The first successful response wins, the other request is cancelled
+            errors: list[BaseException] = []
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Retrieve every exception, even after a success
+                outcomes = [(attempt, attempt.exception()) for attempt in sorted(done, key=attempts.index)]
+                for attempt, error in outcomes:
+                    if error is None:
+                        hedging.record(time.monotonic() - start, hedge_won=attempt is not attempts[0])
+                        return attempt.result()
+                    errors.append(error)
+            raise errors[0]
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def _acquire_hedge(self, hedging: HedgingPolicy, metrics: RequestMetrics) -> bool:
+        """(Protected)
+        Asynchronous counterpart of `MeteoFranceClient._acquire_hedge`.
+        """
+        if not hedging.acquire():
+            return False
+        if self._rate_limiter is not None:
+            throttle_time = await self._rate_limiter.atry_acquire(metrics.family)
+            if throttle_time is None:
+                logger.debug(f"Rate limit of '{metrics.family}' reached - not hedging")
+                hedging.release()
+                return False
+            metrics.throttle_time += throttle_time
+        return True
+
+    async def _refresh_token(self, expired_token: str | None) -> None:
+        """(Protected)
+        Request a new token and use it for the next requests.
+
+        Concurrent refreshes of the same expired token are collapsed into a single request.
+
+        Args:
+            expired_token: The token that was rejected by the API (None if there was no token yet).
+        """
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        async with self._token_lock:
+            if self._token is not None and self._token != expired_token:
+                # Already refreshed by another request
+                self._token_expired = False
+                return
+
+            if self._application_id is None:
+                # Can do nothing
+                raise ValueError("The 'application_id' is unknown, can't get a new token")
+
+            # Retrieve a new token (the token store blocks while another process refreshes it)
+            token = await asyncio.to_thread(self._fetch_token, expired_token)
+            self._token = token.access_token
+            self._token_expires_at = token.expires_at
+            self._token_expired = False
+
+            # Reconnect with the new token
+            self._client.headers.update(self._auth_headers())
@@ -24,7 +24,6 @@ import datetime
 import logging
 import time
 from abc import ABC, abstractmethod
-from importlib.util import find_spec
 from io import StringIO
 from math import acos, cos, radians, sin
 from typing import Any
@@ -33,11 +32,6 @@ import pandas as pd
 
 from meteole.clients import BaseClient
 
-if find_spec("cfgrib") is None:
-    raise ImportError(
-        "The 'cfgrib' module is required to read Arome and Arpege GRIB files. Please install it using:\n\n"
-        "  conda install -c conda-forge cfgrib\n\n"
-    )
 logger = logging.getLogger(__name__)
 
 NEIGHBOURS = {
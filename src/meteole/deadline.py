@@ -0,0 +1,51 @@
+"""Time budget of a batch of requests"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+class Deadline:
+    """A point in time after which the requests of a batch are abandoned.
+
+    The same deadline can be passed to several calls (e.g. `get_coverage` then `get_combined_coverage`), which then
+    share the time budget. The clients cap their timeouts to the remaining time and raise a `DeadlineExceededError`
+    instead of retrying once it is spent.
+
+    Example:
+        >>> deadline = Deadline(300)
+        >>> df = arome.get_coverage(indicator="TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND", deadline=deadline)
+
+    Attributes:
+        expires_at: Time of expiration, according to the clock.
+    """
+
+    def __init__(self, seconds: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize attributes.
+
+        Args:
+            seconds: The time budget, in seconds.
+            clock: Monotonic clock, in seconds.
+        """
+        self._clock = clock
+        self.expires_at: float = clock() + seconds
+
+    def remaining(self) -> float:
+        """Return the remaining time, in seconds (0 once expired)."""
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the time budget is spent."""
+        return self.remaining() <= 0
+
+    def earliest(self, seconds: float | None) -> Deadline:
+        """Return the earliest of this deadline and another one expiring in `seconds` (None means never)."""
+        if seconds is None or self.remaining() <= seconds:
+            return self
+        return Deadline(seconds, clock=self._clock)
+
+    def __repr__(self) -> str:
+        """Return a representation of the deadline with its remaining time."""
+        return f"Deadline(remaining={self.remaining():.2f}s)"
@@ -59,3 +59,49 @@ class MissingDataError(Exception):
             message = text
 
         super().__init__(message)
+
+
+class PartialCoverageError(Exception):
+    """Exception raised when some sub-requests of a coverage failed while errors were collected.
+
+    Attributes:
+        errors: List of (parameters of the failed sub-request, exception raised).
+        partial_result: The data of the successful sub-requests, or None if they all failed.
+    """
+
+    def __init__(self, errors: list[tuple[dict[str, Any], BaseException]], partial_result: Any = None) -> None:
+        """Initialize the exception with the errors of the failed sub-requests.
+
+        Args:
+            errors: List of (parameters of the failed sub-request, exception raised).
+            partial_result: The data of the successful sub-requests, if any.
+        """
+        self.errors = errors
+        self.partial_result = partial_result
+
+        details: str = "\n".join(f" - {params}: {exc!r}" for params, exc in errors)
+        super().__init__(f"{len(errors)} sub-request(s) failed:\n{details}")
+
+
+class DeadlineExceededError(TimeoutError):
+    """Exception raised when the time budget of a request (see `Deadline`, `max_total_time`) is spent."""
+
+
+class CircuitOpenError(Exception):
+    """Exception raised instead of making a request while the circuit of the API is open (see `CircuitBreaker`).
+
+    Attributes:
+        key: The API base URL whose circuit is open.
+        retry_after: Time before a request can be attempted again, in seconds.
+    """
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        """Initialize the exception.
+
+        Args:
+            key: The API base URL whose circuit is open.
+            retry_after: Time before a request can be attempted again, in seconds.
+        """
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(f"Circuit of {key} open, not requesting it for {retry_after:.2f}s")
@@ -1,23 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import copy
 import datetime as dt
+import hashlib
 import logging
 import os
 import re
 import shutil
 import tempfile
 from abc import ABC, abstractmethod
-from functools import reduce
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial, reduce
 from importlib.util import find_spec
-from typing import Any
+from pathlib import Path
+from typing import Any, Collection, Iterator
 from warnings import warn
+from xml.parsers.expat import ExpatError
 
 import pandas as pd
-import xarray as xr
 import xmltodict
 
-from meteole.clients import BaseClient
-from meteole.errors import MissingDataError
+from meteole._capabilities import RUN_FORMAT, CapabilitiesIndex, parse_capabilities
+from meteole._concurrency import gather_ordered, run_ordered, run_pipeline
+from meteole._grib import GribColumns, grib_to_columns, grib_to_df
+from meteole.cache import CacheInfo, GribStore, LRUCache, MetadataCache, MissingDataCache
+from meteole.clients import AsyncBaseClient, BaseClient
+from meteole.deadline import Deadline
+from meteole.errors import MissingDataError, PartialCoverageError
+from meteole.tracing import current_span, span, traced
 
 if find_spec("cfgrib") is None:
     raise ImportError(
@@ -28,6 +41,20 @@ if find_spec("cfgrib") is None:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _GribDownload:
+    """(Protected)
+    A downloaded GRIB file, waiting to be decoded.
+
+    Attributes:
+        source: The content of the file, or its path if it was streamed to disk.
+        files: Deletes the temporary file (if any) once closed.
+    """
+
+    source: bytes | Path
+    files: contextlib.ExitStack = field(default_factory=contextlib.ExitStack)
+
+
 class WeatherForecast(ABC):
     """(Abstract)
     Base class for weather forecast models.
@@ -56,20 +83,44 @@ class WeatherForecast(ABC):
     DEFAULT_TERRITORY: str = "FRANCE"
     DEFAULT_PRECISION: float = 0.01
     MAX_DECIMAL_PLACES: int = 4  # used to avoid floating point issues when finding the closest grid point
+    DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
+    DESCRIPTION_CACHE_SIZE: int = 128
     CLIENT_CLASS: type[BaseClient]
 
     def __init__(
         self,
-        client: BaseClient | None = None,
+        client: BaseClient | AsyncBaseClient | None = None,
         *,
         territory: str = DEFAULT_TERRITORY,
         precision: float = DEFAULT_PRECISION,
+        stream_downloads: bool = False,
+        metadata_cache: MetadataCache | None = None,
+        description_cache_size: int = DESCRIPTION_CACHE_SIZE,
+        capabilities_filter: Collection[str] | None = None,
+        grib_store: GribStore | None = None,
+        missing_data_cache: MissingDataCache | None = None,
         **kwargs: Any,
     ):
         """Initialize attributes.
 
         Args:
+            client: The client used to make the requests. With an `AsyncBaseClient`, only the asynchronous
+                methods (`aget_capabilities`, `aget_coverage_description`, `aget_coverage`,
+                `aget_combined_coverage`) can be used.
             territory: The ARPEGE territory to fetch.
+            stream_downloads: Whether to write the GRIB files to disk in chunks while they are downloaded,
+                instead of holding them in memory. This bounds the memory used by large coverages
+                (e.g. PE-ARPEGE, or AROME on a large area). Requires a client supporting `stream=True`.
+            metadata_cache: A cache on disk of the capabilities and of the coverage descriptions, shared by the
+                forecasts and processes of the machine. Defaults to None (always requested).
+            description_cache_size: Number of coverage descriptions kept in memory, until the capabilities are
+                refreshed. 0 disables this cache.
+            capabilities_filter: If set, only the coverages of these indicators are kept in the capabilities,
+                which saves memory and time for the largest models (e.g. ARPEGE on the globe).
+            grib_store: A store on disk of the downloaded GRIB files, shared by the forecasts and processes of the
+                machine: requesting the same data again costs no API call. Defaults to None (always requested).
+            missing_data_cache: A cache of the GetCoverage requests answered with a `MissingDataError`, which
+                raise the same error again without request for a while. Defaults to None (always requested).
             api_key: The API key for authentication. Defaults to None.
             token: The API token for authentication. Defaults to None.
             application_id: The Application ID for authentication. Defaults to None.
@@ -77,9 +128,16 @@ class WeatherForecast(ABC):
 
         self.territory = territory  # "FRANCE", "ANTIL", or others (see API doc)
         self.precision = precision
+        self.stream_downloads = stream_downloads
+        self.metadata_cache = metadata_cache
+        self.grib_store = grib_store
+        self.missing_data_cache = missing_data_cache
+        self.capabilities_filter = frozenset(capabilities_filter) if capabilities_filter is not None else None
+        self._coverage_descriptions: LRUCache[tuple[str, int | None], dict[str, Any]] = LRUCache(description_cache_size)
         self._validate_parameters()
 
         self._capabilities: pd.DataFrame | None = None
+        self._capabilities_index: CapabilitiesIndex | None = None
         self._entry_point: str
 
         if self.MODEL_TYPE == "ENSEMBLE":
@@ -92,7 +150,12 @@ class WeatherForecast(ABC):
             )
         self._model_base_path = self.MODEL_NAME + "/" + self.API_VERSION
 
-        if client is not None:
+        self._client: BaseClient | None = None
+        self._async_client: AsyncBaseClient | None = None
+
+        if isinstance(client, AsyncBaseClient):
+            self._async_client = client
+        elif client is not None:
             self._client = client
         else:
             # Try to instantiate it (can be user friendly)
@@ -104,7 +167,7 @@ class WeatherForecast(ABC):
 
         Returns: List of all indicators
         """
-        return self.capabilities["indicator"].unique().tolist()
+        return list(self.capabilities_index.indicators)
 
     @property
     def instant_indicators(self) -> list[str]:
@@ -112,7 +175,7 @@ class WeatherForecast(ABC):
 
         Returns: List of instant indicators
         """
-        return self.capabilities[self.capabilities["interval"] == ""]["indicator"].unique().tolist()
+        return list(self.capabilities_index.instant_indicators)
 
     @property
     def INDICATORS(self) -> list[str]:
@@ -151,6 +214,22 @@ class WeatherForecast(ABC):
             self._capabilities = self._build_capabilities()
         return self._capabilities
 
+    @property
+    def capabilities_index(self) -> CapabilitiesIndex:
+        """The capabilities indexed by indicator and run, rebuilt whenever the capabilities change.
+
+        Returns:
+            The index of the capabilities.
+        """
+        capabilities = self.capabilities
+        index = self._capabilities_index
+        if index is None or index.source is not capabilities:
+            index = CapabilitiesIndex(capabilities)
+            if self._capabilities is capabilities:
+                # Not replaced by a concurrent refresh in the meantime
+                self._capabilities_index = index
+        return index
+
     @abstractmethod
     def _validate_parameters(self) -> None:
         """Check the territory and the precision parameters.
@@ -168,8 +247,78 @@ class WeatherForecast(ABC):
         """
         return self.capabilities
 
+    async def aget_capabilities(self) -> pd.DataFrame:
+        """Asynchronous counterpart of `get_capabilities`.
+
+        Returns:
+            DataFrame of details on all available coverage ids.
+        """
+        return await self._aget_capabilities()
+
+    async def _aget_capabilities(self, deadline: Deadline | None = None) -> pd.DataFrame:
+        """(Protected)
+        Implementation of `aget_capabilities`, with a deadline for the request if the capabilities must be fetched.
+        """
+        if self._capabilities is None:
+            self._capabilities = self._cached_capabilities()
+        if self._capabilities is None:
+            logger.info("Fetching all available coverages...")
+            url, params = self._capabilities_request()
+            with span("GetCapabilities") as stage:
+                response = await self._aget(url, params, deadline)
+                stage.set(bytes=len(response.content))
+            self._capabilities = self._parse_capabilities(response.text)
+            self._cache_capabilities(self._capabilities)
+        return self._capabilities
+
+    def refresh_capabilities(self) -> pd.DataFrame:
+        """Fetch the capabilities again, e.g. to see the runs published since they were fetched.
+
+        The coverage descriptions kept in memory are forgotten. The metadata cache, if any, is bypassed and updated.
+        Until the new capabilities are ready, the previous ones remain available to the other threads.
+
+        Returns:
+            DataFrame of details on all available coverage ids.
+        """
+        logger.info("Refreshing all available coverages...")
+        return self._swap_capabilities(self._parse_capabilities(self._fetch_capabilities()))
+
+    async def arefresh_capabilities(self) -> pd.DataFrame:
+        """Asynchronous counterpart of `refresh_capabilities`.
+
+        Returns:
+            DataFrame of details on all available coverage ids.
+        """
+        logger.info("Refreshing all available coverages...")
+        url, params = self._capabilities_request()
+        with span("GetCapabilities") as stage:
+            response = await self._aget(url, params)
+            stage.set(bytes=len(response.content))
+        return self._swap_capabilities(self._parse_capabilities(response.text))
+
+    def _swap_capabilities(self, capabilities: pd.DataFrame) -> pd.DataFrame:
+        """(Protected)
+        Replace the capabilities and their index at once, and forget the coverage descriptions.
+
+        Args:
+            capabilities: The new capabilities.
+
+        Returns:
+            The new capabilities.
+        """
+        # The index first: readers of the new capabilities find it ready
+        self._capabilities_index = CapabilitiesIndex(capabilities)
+        self._capabilities = capabilities
+        self._coverage_descriptions.clear()
+        self._cache_capabilities(capabilities)
+        return capabilities
+
+    def coverage_description_cache_info(self) -> CacheInfo:
+        """Return the hits, misses and size of the in-memory cache of coverage descriptions."""
+        return self._coverage_descriptions.info()
+
     def get_coverage_description(
-        self, coverage_id: str, ensemble_numbers: list[int | None] | None = None
+        self, coverage_id: str, ensemble_numbers: list[int | None] | None = None, deadline: Deadline | None = None
     ) -> dict[str, Any]:
         """Return the available axis (times, heights) of a coverage.
 
@@ -179,6 +328,7 @@ class WeatherForecast(ABC):
             coverage_id: An id of a coverage, use get_capabilities() to get them.
             ensemble_numbers: For ensemble models only, numbers of the desired
                    ensemble members. If None, defaults to the member 0.
+            deadline: A deadline after which the requests are abandoned. Defaults to None (no deadline).
         Returns:
             A dictionary containing more info on the coverage.
         """
@@ -194,46 +344,7 @@ class WeatherForecast(ABC):
             numbers_to_fetch = [None]
 
         for ensemble_number in numbers_to_fetch:
-            description = self._get_coverage_description(coverage_id, ensemble_number)
-            grid_axis = description["wcs:CoverageDescriptions"]["wcs:CoverageDescription"]["gml:domainSet"][
-                "gmlrgrid:ReferenceableGridByVectors"
-            ]["gmlrgrid:generalGridAxis"]
-
-            coverage_description_single = {
-                "forecast_horizons": [
-                    dt.timedelta(seconds=time) for time in self._get_available_feature(grid_axis, "time")
-                ],
-                "heights": self._get_available_feature(grid_axis, "height"),
-                "pressures": self._get_available_feature(grid_axis, "pressure"),
-            }
-
-            # Find min and max latitude and longitude
-            envelope = description["wcs:CoverageDescriptions"]["wcs:CoverageDescription"]["gml:boundedBy"][
-                "gml:EnvelopeWithTimePeriod"
-            ]
-            lower = envelope["gml:lowerCorner"]  # '-12 37.5'
-            upper = envelope["gml:upperCorner"]  # '16 55.4'
-            lower_vals = [float(val) for val in lower.split()]
-            upper_vals = [float(val) for val in upper.split()]
-
-            axis_labels = envelope.get("@axisLabels")
-            if axis_labels and "long" in axis_labels and "lat" in axis_labels:
-                labels = axis_labels.split()
-                idx_long = labels.index("long")
-                idx_lat = labels.index("lat")
-
-                lower_long = lower_vals[idx_long]
-                lower_lat = lower_vals[idx_lat]
-                upper_long = upper_vals[idx_long]
-                upper_lat = upper_vals[idx_lat]
-            else:
-                lower_long, lower_lat = lower_vals[:2]
-                upper_long, upper_lat = upper_vals[:2]
-
-            coverage_description_single["min_latitude"] = lower_lat
-            coverage_description_single["max_latitude"] = upper_lat
-            coverage_description_single["min_longitude"] = lower_long
-            coverage_description_single["max_longitude"] = upper_long
+            coverage_description_single = self._describe_coverage(coverage_id, ensemble_number, deadline)
 
             if ensemble_number is None or len(numbers_to_fetch) == 1:
                 coverage_description = coverage_description_single
@@ -242,6 +353,127 @@ class WeatherForecast(ABC):
 
         return coverage_description
 
+    async def aget_coverage_description(
+        self, coverage_id: str, ensemble_numbers: list[int | None] | None = None, deadline: Deadline | None = None
+    ) -> dict[str, Any]:
+        """Asynchronous counterpart of `get_coverage_description`.
+
+        Args:
+            coverage_id: An id of a coverage, use get_capabilities() to get them.
+            ensemble_numbers: For ensemble models only, numbers of the desired
+                   ensemble members. If None, defaults to the member 0.
+            deadline: A deadline after which the requests are abandoned. Defaults to None (no deadline).
+        Returns:
+            A dictionary containing more info on the coverage.
+        """
+        numbers_to_fetch: list[int | None]
+
+        if self.MODEL_TYPE == "ENSEMBLE":
+            numbers_to_fetch = [0] if ensemble_numbers is None else ensemble_numbers
+        else:
+            numbers_to_fetch = [None]
+
+        descriptions = await asyncio.gather(
+            *(self._adescribe_coverage(coverage_id, ensemble_number, deadline) for ensemble_number in numbers_to_fetch)
+        )
+
+        if len(numbers_to_fetch) == 1:
+            return descriptions[0]
+        return {
+            f"number_{ensemble_number}": description
+            for ensemble_number, description in zip(numbers_to_fetch, descriptions)
+        }
+
+    def _describe_coverage(
+        self, coverage_id: str, ensemble_number: int | None, deadline: Deadline | None = None
+    ) -> dict[str, Any]:
+        """(Protected)
+        Return the parsed description of a coverage, from the in-memory cache if possible.
+
+        Args:
+            coverage_id: An id of a coverage.
+            ensemble_number: For ensemble models only, number of the desired ensemble member.
+            deadline: A deadline after which the request is abandoned. Defaults to None.
+
+        Returns:
+            The description, see `_parse_coverage_description`.
+        """
+        description = self._coverage_descriptions.get((coverage_id, ensemble_number))
+        if description is None:
+            description = self._parse_coverage_description(
+                self._get_coverage_description(coverage_id, ensemble_number, deadline)
+            )
+            self._coverage_descriptions.set((coverage_id, ensemble_number), description)
+        # The callers may modify it
+        return copy.deepcopy(description)
+
+    async def _adescribe_coverage(
+        self, coverage_id: str, ensemble_number: int | None, deadline: Deadline | None = None
+    ) -> dict[str, Any]:
+        """(Protected)
+        Asynchronous counterpart of `_describe_coverage`.
+        """
+        description = self._coverage_descriptions.get((coverage_id, ensemble_number))
+        if description is None:
+            description = self._parse_coverage_description(
+                await self._aget_coverage_description(coverage_id, ensemble_number, deadline)
+            )
+            self._coverage_descriptions.set((coverage_id, ensemble_number), description)
+        return copy.deepcopy(description)
+
+    def _parse_coverage_description(self, description: dict[Any, Any]) -> dict[str, Any]:
+        """(Protected)
+        Extract the available axis and the bounds of a coverage from its raw description.
+
+        Args:
+            description: The raw description of a coverage, see `_get_coverage_description`.
+
+        Returns:
+            A dictionary containing the forecast horizons, heights, pressures and the min/max coordinates.
+        """
+        grid_axis = description["wcs:CoverageDescriptions"]["wcs:CoverageDescription"]["gml:domainSet"][
+            "gmlrgrid:ReferenceableGridByVectors"
+        ]["gmlrgrid:generalGridAxis"]
+
+        coverage_description_single = {
+            "forecast_horizons": [
+                dt.timedelta(seconds=time) for time in self._get_available_feature(grid_axis, "time")
+            ],
+            "heights": self._get_available_feature(grid_axis, "height"),
+            "pressures": self._get_available_feature(grid_axis, "pressure"),
+        }
+
+        # Find min and max latitude and longitude
+        envelope = description["wcs:CoverageDescriptions"]["wcs:CoverageDescription"]["gml:boundedBy"][
+            "gml:EnvelopeWithTimePeriod"
+        ]
+        lower = envelope["gml:lowerCorner"]  # '-12 37.5'
+        upper = envelope["gml:upperCorner"]  # '16 55.4'
+        lower_vals = [float(val) for val in lower.split()]
+        upper_vals = [float(val) for val in upper.split()]
+
+        axis_labels = envelope.get("@axisLabels")
+        if axis_labels and "long" in axis_labels and "lat" in axis_labels:
+            labels = axis_labels.split()
+            idx_long = labels.index("long")
+            idx_lat = labels.index("lat")
+
+            lower_long = lower_vals[idx_long]
+            lower_lat = lower_vals[idx_lat]
+            upper_long = upper_vals[idx_long]
+            upper_lat = upper_vals[idx_lat]
+        else:
+            lower_long, lower_lat = lower_vals[:2]
+            upper_long, upper_lat = upper_vals[:2]
+
+        coverage_description_single["min_latitude"] = lower_lat
+        coverage_description_single["max_latitude"] = upper_lat
+        coverage_description_single["min_longitude"] = lower_long
+        coverage_description_single["max_longitude"] = upper_long
+
+        return coverage_description_single
+
+    @traced("get_coverage")
     def get_coverage(
         self,
         indicator: str | None = None,
@@ -255,9 +487,19 @@ class WeatherForecast(ABC):
         interval: str | None = None,
         coverage_id: str = "",
         temp_dir: str | None = None,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        on_error: str = "raise",
+        deadline: Deadline | None = None,
+        decode_workers: int | None = None,
+        decode_executor: Executor | None = None,
+        queue_size: int | None = None,
     ) -> pd.DataFrame:
         """Return the coverage data (i.e., the weather forecast data).
 
+        One request is made for each combination of forecast horizon, pressure, height and ensemble member.
+        These requests are made sequentially, unless `max_workers` or `executor` is given.
+
         Args:
             indicator: Indicator of a coverage to retrieve.
             lat (long): Minimum and maximum latitude (longitude), or latitude (longitude) of the desired location.
@@ -274,16 +516,182 @@ class WeatherForecast(ABC):
                     as TOTAL_PRECIPITATION.
             coverage_id: An id of a coverage, use get_capabilities() to get them.
             temp_dir (str | None): Directory to store the temporary file. Defaults to None.
+            max_workers: Maximum number of requests made concurrently (in threads). Defaults to None (sequential).
+            executor: An executor to run the requests with, instead of a thread pool of `max_workers` threads.
+                It is left open afterwards, so it can be shared between calls.
+            on_error: What to do when a request fails. "raise" (default) re-raises the first error and cancels
+                the pending requests. "collect" makes every request, then raises a `PartialCoverageError`
+                holding all the errors and the data of the successful requests.
+            deadline: A deadline after which the pending requests (GetCapabilities and DescribeCoverage
+                included, if they must be made) are abandoned with a `DeadlineExceededError`. Defaults to None
+                (no deadline).
+            decode_workers: Number of processes decoding the GRIB files. Defaults to None (the files are decoded in
+                the threads making the requests, where decoding is serialized by the GIL). Worth it along with
+                `max_workers`, when many files are requested. With `queue_size`, it also sets the number of threads
+                consuming the queue, each one decoding a file at a time (in the pool of processes): set it to the
+                size of `decode_executor` too, if given.
+            decode_executor: An executor (e.g. a `ProcessPoolExecutor`) to decode the GRIB files with, instead of
+                a pool of `decode_workers` processes. It is left open afterwards.
+            queue_size: If set, the files are downloaded and decoded in a pipeline: `max_workers` threads (or the
+                threads of `executor`, if `max_workers` is None) download the files into a queue of `queue_size`
+                files, from which `decode_workers` threads (1 by default) decode them. Decoding then overlaps the downloads, and the downloads wait while `queue_size` files
+                are waiting to be decoded. Defaults to None (each thread downloads then decodes a file).
 
         Returns:
             pd.DataFrame: The complete run for the specified execution.
         """
-        # Numbers cannot be None if the model type is ENSEMBLE
-        if self.MODEL_TYPE == "ENSEMBLE":
-            if ensemble_numbers is None:
-                ensemble_numbers = [0]
-            logger.info(f"Using {len(ensemble_numbers)} ensemble members")
+        if indicator and deadline is not None:
+            self._load_capabilities(deadline)
+        coverage_id = self._resolve_coverage_id(indicator, coverage_id, run, interval)
+        axis = self.get_coverage_description(coverage_id, deadline=deadline)
+        calls = self._get_coverage_calls(
+            coverage_id, axis, lat, long, ensemble_numbers, heights, pressures, forecast_horizons, temp_dir, deadline
+        )
+        current_span().set(coverage_id=coverage_id, requests=len(calls))
+
+        with self._decode_pool(decode_workers, decode_executor) as decode_pool:
+            if queue_size is not None:
+                df_list, errors = run_pipeline(
+                    self._download_single_forecast,
+                    lambda download, call: self._decode_single_forecast(
+                        download,
+                        coverage_id=call["coverage_id"],
+                        ensemble_number=call["ensemble_number"],
+                        lat=call["lat"],
+                        long=call["long"],
+                        temp_dir=call["temp_dir"],
+                        decode_executor=decode_pool,
+                    ),
+                    calls,
+                    fetch_workers=max_workers,
+                    decode_workers=decode_workers or 1,
+                    queue_size=queue_size,
+                    executor=executor,
+                    on_error=on_error,
+                    release=lambda download: download.files.close(),
+                )
+            else:
+                df_list, errors = run_ordered(
+                    self._get_data_single_forecast
+                    if decode_pool is None
+                    else partial(self._get_data_single_forecast, decode_executor=decode_pool),
+                    calls,
+                    max_workers=max_workers,
+                    executor=executor,
+                    on_error=on_error,
+                )
+
+        return self._concat_coverage(calls, df_list, errors)
+
+    async def aget_coverage(
+        self,
+        indicator: str | None = None,
+        lat: tuple | float = FRANCE_METRO_LATITUDES,
+        long: tuple | float = FRANCE_METRO_LONGITUDES,
+        ensemble_numbers: list[int] | None = None,
+        heights: list[int] | None = None,
+        pressures: list[int] | None = None,
+        forecast_horizons: list[dt.timedelta] | None = None,
+        run: str | None = None,
+        interval: str | None = None,
+        coverage_id: str = "",
+        temp_dir: str | None = None,
+        max_concurrency: int | None = None,
+        on_error: str = "raise",
+        deadline: Deadline | None = None,
+    ) -> pd.DataFrame:
+        """Asynchronous counterpart of `get_coverage`.
+
+        The requests are made concurrently on the running event loop, and the GRIB files are decoded in threads.
+
+        Args:
+            indicator: Indicator of a coverage to retrieve.
+            lat (long): Minimum and maximum latitude (longitude), or latitude (longitude) of the desired location.
+                        The closest grid point to the requested coordinate will be used.
+            ensemble_numbers: For ensemble models only, numbers of the desired
+                   ensemble members. If None, defaults to the member 0.
+            heights: Heights in meters.
+            pressures: Pressures in hPa.
+            forecast_horizons: List of timedelta, representing the forecast horizons in hours.
+            run: The model inference timestamp. If None, defaults to the latest available run.
+                Expected format: "YYYY-MM-DDTHH:MM:SSZ".
+            interval: The aggregation period. Must be None for instant indicators;
+                    raises an error if specified. Defaults to "P1D" for time-aggregated indicators such
+                    as TOTAL_PRECIPITATION.
+            coverage_id: An id of a coverage, use get_capabilities() to get them.
+            temp_dir (str | None): Directory to store the temporary file. Defaults to None.
+            max_concurrency: Maximum number of requests in flight. Defaults to None (no limit).
+            on_error: "raise" or "collect", see `get_coverage`. Defaults to "raise".
+            deadline: A deadline after which the pending requests are abandoned, see `get_coverage`.
+
+        Returns:
+            pd.DataFrame: The complete run for the specified execution.
+        """
+        return await self._aget_coverage(
+            indicator=indicator,
+            lat=lat,
+            long=long,
+            ensemble_numbers=ensemble_numbers,
+            heights=heights,
+            pressures=pressures,
+            forecast_horizons=forecast_horizons,
+            run=run,
+            interval=interval,
+            coverage_id=coverage_id,
+            temp_dir=temp_dir,
+            semaphore=asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None,
+            on_error=on_error,
+            deadline=deadline,
+        )
+
+    @traced("get_coverage")
+    async def _aget_coverage(
+        self,
+        indicator: str | None,
+        lat: tuple | float,
+        long: tuple | float,
+        ensemble_numbers: list[int] | None,
+        heights: list[int] | None,
+        pressures: list[int] | None,
+        forecast_horizons: list[dt.timedelta] | None,
+        run: str | None,
+        interval: str | None,
+        coverage_id: str,
+        temp_dir: str | None,
+        semaphore: asyncio.Semaphore | None,
+        on_error: str,
+        deadline: Deadline | None = None,
+    ) -> pd.DataFrame:
+        """(Protected)
+        Implementation of `aget_coverage`, with a semaphore that can be shared between coverages.
+        """
+        if indicator:
+            await self._aget_capabilities(deadline)
+        coverage_id = self._resolve_coverage_id(indicator, coverage_id, run, interval)
+        axis = await self.aget_coverage_description(coverage_id, deadline=deadline)
+        calls = self._get_coverage_calls(
+            coverage_id, axis, lat, long, ensemble_numbers, heights, pressures, forecast_horizons, temp_dir, deadline
+        )
+        current_span().set(coverage_id=coverage_id, requests=len(calls))
 
+        df_list, errors = await gather_ordered(
+            self._aget_data_single_forecast,
+            calls,
+            semaphore=semaphore,
+            on_error=on_error,
+        )
+
+        return self._concat_coverage(calls, df_list, errors)
+
+    def _resolve_coverage_id(
+        self, indicator: str | None, coverage_id: str, run: str | None, interval: str | None
+    ) -> str:
+        """(Protected)
+        Return the coverage id, given either directly or through an indicator.
+
+        Raises:
+            ValueError: Both or none of `indicator` and `coverage_id` are given.
+        """
         # Ensure we only have one of coverage_id, indicator
         if not bool(indicator) ^ bool(coverage_id):
             raise ValueError("Argument `indicator` or `coverage_id` need to be set (only one of them)")
@@ -291,8 +699,37 @@ class WeatherForecast(ABC):
             coverage_id = self._get_coverage_id(indicator, run, interval)
 
         logger.info(f"Using `coverage_id={coverage_id}`")
+        return coverage_id
+
+    def _get_coverage_calls(
+        self,
+        coverage_id: str,
+        axis: dict[str, Any],
+        lat: tuple | float,
+        long: tuple | float,
+        ensemble_numbers: list[int] | None,
+        heights: list[int] | None,
+        pressures: list[int] | None,
+        forecast_horizons: list[dt.timedelta] | None,
+        temp_dir: str | None,
+        deadline: Deadline | None = None,
+    ) -> list[dict[str, Any]]:
+        """(Protected)
+        Validate the parameters of a coverage and list its sub-requests.
+
+        Args:
+            coverage_id: The id of the coverage.
+            axis: The description of the coverage, see `get_coverage_description`.
+            Others: see `get_coverage`.
 
-        axis = self.get_coverage_description(coverage_id)
+        Returns:
+            The keyword arguments of `_get_data_single_forecast`, one per sub-request.
+        """
+        # Numbers cannot be None if the model type is ENSEMBLE
+        if self.MODEL_TYPE == "ENSEMBLE":
+            if ensemble_numbers is None:
+                ensemble_numbers = [0]
+            logger.info(f"Using {len(ensemble_numbers)} ensemble members")
 
         # Handle lat,long inputs (needs axis to check bounds)
         user_lat, user_long = lat, long
@@ -306,24 +743,46 @@ class WeatherForecast(ABC):
             "forecast_horizons", forecast_horizons, axis["forecast_horizons"]
         )
 
-        df_list = [
-            self._get_data_single_forecast(
-                coverage_id=coverage_id,
-                ensemble_number=ensemble_number,
-                height=height if height != -1 else None,
-                pressure=pressure if pressure != -1 else None,
-                forecast_horizon=forecast_horizon,
-                lat=lat,
-                long=long,
-                temp_dir=temp_dir,
-            )
+        return [
+            {
+                "coverage_id": coverage_id,
+                "ensemble_number": ensemble_number,
+                "height": height if height != -1 else None,
+                "pressure": pressure if pressure != -1 else None,
+                "forecast_horizon": forecast_horizon,
+                "lat": lat,
+                "long": long,
+                "temp_dir": temp_dir,
+                "deadline": deadline,
+            }
             for forecast_horizon in forecast_horizons
             for pressure in pressures
             for height in heights
             for ensemble_number in ([None] if (ensemble_numbers is None) else ensemble_numbers)
         ]
 
-        return pd.concat(df_list, axis=0).reset_index(drop=True)
+    @staticmethod
+    def _concat_coverage(
+        calls: list[dict[str, Any]],
+        df_list: list[pd.DataFrame | None],
+        errors: list[tuple[int, BaseException]],
+    ) -> pd.DataFrame:
+        """(Protected)
+        Concatenate the data of the sub-requests of a coverage.
+
+        Raises:
+            PartialCoverageError: Some sub-requests failed (with `on_error="collect"`).
+        """
+        if errors:
+            current_span().set(errors=len(errors))
+            succeeded = [df for df in df_list if df is not None]
+            raise PartialCoverageError(
+                errors=[(calls[index], exc) for index, exc in errors],
+                partial_result=pd.concat(succeeded, axis=0).reset_index(drop=True) if succeeded else None,
+            )
+
+        with span("concat", frames=len(df_list)):
+            return pd.concat(df_list, axis=0).reset_index(drop=True)
 
     def _check_and_format_coords(
         self, lat: float | tuple[float, float], long: float | tuple[float, float], axis: dict[str, Any]
@@ -368,32 +827,92 @@ class WeatherForecast(ABC):
         coord_grid = round(coord_grid, self.MAX_DECIMAL_PLACES)  # avoid floating point issues
         return coord_grid
 
-    def _build_capabilities(self) -> pd.DataFrame:
+    def _load_capabilities(self, deadline: Deadline | None) -> None:
+        """(Protected)
+        Fetch and build the model capabilities if not done yet, see `capabilities`, within a deadline.
+        """
+        if self._capabilities is None:
+            self._capabilities = self._build_capabilities(deadline)
+
+    def _build_capabilities(self, deadline: Deadline | None = None) -> pd.DataFrame:
         """(Protected)
         Fetch and build the model capabilities.
 
+        Args:
+            deadline: A deadline after which the request is abandoned. Defaults to None.
+
         Returns:
             DataFrame all the details.
         """
+        capabilities = self._cached_capabilities()
+        if capabilities is not None:
+            return capabilities
 
         logger.info("Fetching all available coverages...")
 
-        capabilities = self._fetch_capabilities()
-        df_capabilities = pd.DataFrame(capabilities["wcs:Capabilities"]["wcs:Contents"]["wcs:CoverageSummary"])
-        df_capabilities = df_capabilities.rename(
-            columns={
-                "wcs:CoverageId": "id",
-                "ows:Title": "title",
-                "wcs:CoverageSubtype": "subtype",
-            }
-        )
-        df_capabilities["indicator"] = [coverage_id.split("___")[0] for coverage_id in df_capabilities["id"]]
-        df_capabilities["run"] = [
-            coverage_id.split("___")[1].split("Z")[0] + "Z" for coverage_id in df_capabilities["id"]
-        ]
-        df_capabilities["interval"] = [
-            coverage_id.split("___")[1].split("Z")[1].strip("_") for coverage_id in df_capabilities["id"]
-        ]
+        capabilities = self._parse_capabilities(self._fetch_capabilities(deadline))
+        self._cache_capabilities(capabilities)
+        return capabilities
+
+    def _cached_capabilities(self) -> pd.DataFrame | None:
+        """(Protected)
+        Return the capabilities from the metadata cache, None if there is no fresh entry (or no cache).
+        """
+        if self.metadata_cache is None:
+            return None
+
+        key = self._capabilities_cache_key()
+        data = self.metadata_cache.get(key)
+        if data is None:
+            return None
+        logger.debug(f"Capabilities read from the metadata cache ({key})")
+        return pd.DataFrame(data)
+
+    def _cache_capabilities(self, capabilities: pd.DataFrame) -> None:
+        """(Protected)
+        Store the capabilities in the metadata cache, if any.
+        """
+        if self.metadata_cache is not None:
+            self.metadata_cache.set(
+                self._capabilities_cache_key(),
+                capabilities.to_dict(orient="list"),
+                ttl=self.metadata_cache.capabilities_ttl_for(capabilities["id"]),
+            )
+
+    def _capabilities_cache_key(self) -> str:
+        """(Protected)
+        Return the key of the capabilities in the metadata cache: the path of the request, and the filter if any.
+        """
+        url, _ = self._capabilities_request()
+        if self.capabilities_filter is None:
+            return url
+        digest = hashlib.sha256("\n".join(sorted(self.capabilities_filter)).encode()).hexdigest()[:16]
+        return f"{url}-{digest}"
+
+    def _parse_capabilities(self, xml: str | bytes) -> pd.DataFrame:
+        """(Protected)
+        Build the model capabilities from the raw GetCapabilities response.
+
+        Only the coverages of the indicators of `capabilities_filter` are kept, if set.
+
+        Args:
+            xml: Raw capabilities (XML document).
+
+        Returns:
+            DataFrame all the details.
+        """
+        try:
+            with span("parse_capabilities") as stage:
+                df_capabilities = parse_capabilities(xml, indicators=self.capabilities_filter)
+                stage.set(coverages=len(df_capabilities))
+        except ExpatError as e:
+            logger.error(f"Error parsing the XML response: {e}")
+            logger.error(f"Response: {xml!r}")
+            raise e
+
+        if df_capabilities.empty:
+            logger.warning("No coverage found in the capabilities")
+            return df_capabilities
 
         nb_indicators = len(df_capabilities["indicator"].unique())
         nb_coverage_ids = df_capabilities.shape[0]
@@ -434,28 +953,27 @@ class WeatherForecast(ABC):
             ValueError: If `indicator` is missing or invalid.
             ValueError: If `interval` is invalid or required but missing.
         """
-        capabilities = self.capabilities[self.capabilities["indicator"] == indicator]
+        index = self.capabilities_index
 
-        if indicator not in self.indicators:
+        if indicator not in index.indicator_set:
             raise ValueError(f"Unknown `indicator` - checkout `{self.MODEL_NAME}.indicators` to have the full list.")
 
         if run is None:
-            run = capabilities.run.max()
+            run = index.latest_run(indicator)
             logger.info(f"Using latest `run={run}`.")
 
         try:
-            dt.datetime.strptime(run, "%Y-%m-%dT%H.%M.%SZ")
+            dt.datetime.strptime(run, RUN_FORMAT)
         except ValueError as exc:
             raise ValueError(f"Run '{run}' is invalid. Expected format 'YYYY-MM-DDTHH.MM.SSZ'") from exc
 
-        valid_runs = capabilities["run"].unique().tolist()
-        if run not in valid_runs:
-            raise ValueError(f"Run '{run}' is invalid. Valid runs : {valid_runs}")
+        if not index.has_run(indicator, run):
+            raise ValueError(f"Run '{run}' is invalid. Valid runs : {index.runs(indicator)}")
 
         # handle interval
-        valid_intervals = capabilities["interval"].unique().tolist()
+        valid_intervals = index.intervals(indicator)
 
-        if indicator in self.instant_indicators:
+        if indicator in index.instant_indicator_set:
             if not interval:
                 # no interval is expected for instant indicators
                 pass
@@ -513,13 +1031,36 @@ class WeatherForecast(ABC):
                 logger.info(f"Using `{param_name}={inputs}`")
         return inputs
 
-    def _fetch_capabilities(self) -> dict[Any, Any]:
+    def _fetch_capabilities(self, deadline: Deadline | None = None) -> str:
         """Fetch the model capabilities.
 
+        Args:
+            deadline: A deadline after which the request is abandoned. Defaults to None.
+
         Returns:
-            Raw capabilities (dictionary).
+            Raw capabilities (XML document).
         """
 
+        url, params = self._capabilities_request()
+        try:
+            with span("GetCapabilities") as stage:
+                response = self._get(url, params, deadline)
+                stage.set(bytes=len(response.content))
+        except MissingDataError as e:
+            logger.error(f"Error fetching the capabilities: {e}")
+            logger.error(f"URL: {url}")
+            logger.error(f"Params: {params}")
+            raise e
+
+        return response.text
+
+    def _capabilities_request(self) -> tuple[str, dict[str, Any]]:
+        """(Protected)
+        Build the GetCapabilities request.
+
+        Returns:
+            The path and the query parameters of the request.
+        """
         if self.MODEL_TYPE == "ENSEMBLE":
             url = f"{self._model_base_path}/{self._entry_point.replace('xxx', '001')}/GetCapabilities"
         else:
@@ -530,24 +1071,37 @@ class WeatherForecast(ABC):
             "version": "2.0.1",
             "language": "eng",
         }
-        try:
-            response = self._client.get(url, params=params)
-        except MissingDataError as e:
-            logger.error(f"Error fetching the capabilities: {e}")
-            logger.error(f"URL: {url}")
-            logger.error(f"Params: {params}")
-            raise e
+        return url, params
+
+    def _get(self, url: str, params: dict[str, Any], deadline: Deadline | None = None, stream: bool = False) -> Any:
+        """(Protected)
+        Make a request with the synchronous client.
 
-        xml = response.text
+        Raises:
+            TypeError: The forecast was built with an asynchronous client.
+        """
+        if self._client is None:
+            raise TypeError(
+                f"{type(self).__name__} was built with an asynchronous client: use the `aget_*` methods instead."
+            )
+        if stream:
+            return self._client.get(url, params=params, deadline=deadline, stream=True)
+        return self._client.get(url, params=params, deadline=deadline)
 
-        try:
-            return xmltodict.parse(xml)
-        except MissingDataError as e:
-            logger.error(f"Error parsing the XML response: {e}")
-            logger.error(f"Response: {xml}")
-            raise e
+    async def _aget(self, url: str, params: dict[str, Any], deadline: Deadline | None = None) -> Any:
+        """(Protected)
+        Make a request with the asynchronous client.
+
+        Raises:
+            TypeError: The forecast was built with a synchronous client.
+        """
+        if self._async_client is None:
+            raise TypeError(f"{type(self).__name__} was built with a synchronous client: use an `AsyncBaseClient`.")
+        return await self._async_client.get(url, params=params, deadline=deadline)
 
-    def _get_coverage_description(self, coverage_id: str, ensemble_number: int | None) -> dict[Any, Any]:
+    def _get_coverage_description(
+        self, coverage_id: str, ensemble_number: int | None, deadline: Deadline | None = None
+    ) -> dict[Any, Any]:
         """(Protected)
         Get the description of a coverage.
 
@@ -561,14 +1115,73 @@ class WeatherForecast(ABC):
             coverage_id (str): the Coverage ID. Use :meth:`get_coverage` to access the available coverage ids.
                 By default use the latest temperature coverage ID.
             ensemble_number: For ensemble models only, number of the desired ensemble member.
+            deadline: A deadline after which the request is abandoned. Defaults to None.
 
         Returns:
             description (dict): the description of the coverage.
         """
-        if self.MODEL_TYPE == "ENSEMBLE":
-            url = (
-                f"{self._model_base_path}/{self._entry_point.replace('xxx', f'{ensemble_number:03}')}/DescribeCoverage"
-            )
+        url, params = self._coverage_description_request(coverage_id, ensemble_number)
+        with span("DescribeCoverage", coverage_id=coverage_id, ensemble_number=ensemble_number) as stage:
+            description = self._cached_coverage_description(url, coverage_id)
+            stage.set(cached=description is not None)
+            if description is None:
+                response = self._get(url, params, deadline)
+                stage.set(bytes=len(response.content))
+                description = xmltodict.parse(response.text)
+                self._cache_coverage_description(url, coverage_id, description)
+        return description
+
+    async def _aget_coverage_description(
+        self, coverage_id: str, ensemble_number: int | None, deadline: Deadline | None = None
+    ) -> dict[Any, Any]:
+        """(Protected)
+        Asynchronous counterpart of `_get_coverage_description`.
+        """
+        url, params = self._coverage_description_request(coverage_id, ensemble_number)
+        with span("DescribeCoverage", coverage_id=coverage_id, ensemble_number=ensemble_number) as stage:
+            description = self._cached_coverage_description(url, coverage_id)
+            stage.set(cached=description is not None)
+            if description is None:
+                response = await self._aget(url, params, deadline)
+                stage.set(bytes=len(response.content))
+                description = xmltodict.parse(response.text)
+                self._cache_coverage_description(url, coverage_id, description)
+        return description
+
+    def _cached_coverage_description(self, url: str, coverage_id: str) -> dict[Any, Any] | None:
+        """(Protected)
+        Return the raw description of a coverage from the metadata cache, None if there is no fresh entry.
+
+        Args:
+            url: The path of the DescribeCoverage request (which depends on the ensemble member).
+            coverage_id: The id of the coverage.
+        """
+        if self.metadata_cache is None:
+            return None
+        return self.metadata_cache.get(f"{url}/{coverage_id}")
+
+    def _cache_coverage_description(self, url: str, coverage_id: str, description: dict[Any, Any]) -> None:
+        """(Protected)
+        Store the raw description of a coverage in the metadata cache, if any. See `_cached_coverage_description`.
+        """
+        if self.metadata_cache is not None:
+            self.metadata_cache.set(
+                f"{url}/{coverage_id}", description, ttl=self.metadata_cache.description_ttl(coverage_id)
+            )
+
+    def _coverage_description_request(
+        self, coverage_id: str, ensemble_number: int | None
+    ) -> tuple[str, dict[str, Any]]:
+        """(Protected)
+        Build the DescribeCoverage request.
+
+        Returns:
+            The path and the query parameters of the request.
+        """
+        if self.MODEL_TYPE == "ENSEMBLE":
+            url = (
+                f"{self._model_base_path}/{self._entry_point.replace('xxx', f'{ensemble_number:03}')}/DescribeCoverage"
+            )
         else:
             url = f"{self._model_base_path}/{self._entry_point}/DescribeCoverage"
         params = {
@@ -576,8 +1189,7 @@ class WeatherForecast(ABC):
             "version": "2.0.1",
             "coverageid": coverage_id,
         }
-        response = self._client.get(url, params=params)
-        return xmltodict.parse(response.text)
+        return url, params
 
     def _grib_bytes_to_df(
         self,
@@ -587,9 +1199,9 @@ class WeatherForecast(ABC):
         """(Protected)
         Converts GRIB data (in binary format) into a pandas DataFrame.
 
-        This method writes the binary GRIB data to a temporary file, reads it using
-        the `cfgrib` engine via xarray, and converts the resulting xarray Dataset
-        into a pandas DataFrame.
+        A GRIB file made of a single message on a regular grid (as returned by GetCoverage) is decoded in memory
+        with eccodes. Otherwise, this method writes the binary GRIB data to a temporary file, reads it using
+        the `cfgrib` engine via xarray, and converts the resulting xarray Dataset into a pandas DataFrame.
 
         Args:
             grib_str (bytes): Binary GRIB data as a byte string.
@@ -608,34 +1220,103 @@ class WeatherForecast(ABC):
             - The temporary file used for parsing is automatically deleted after use.
             - Ensure the input GRIB data is valid and encoded in a binary format.
         """
-        created_temp_dir = False
+        df = grib_to_df(grib_str)
+        if df is not None:
+            return df
 
-        if temp_dir:
-            if not os.path.exists(temp_dir):
-                os.makedirs(temp_dir)
-                created_temp_dir = True
-            temp_subdir = os.path.join(temp_dir, "temp_grib")
-            os.makedirs(temp_subdir, exist_ok=True)
-        else:
-            temp_subdir = tempfile.mkdtemp()
+        return self._cfgrib_bytes_to_df(grib_str, temp_dir)
 
-        with tempfile.NamedTemporaryFile(dir=temp_subdir, delete=False) as temp_file:
+    @classmethod
+    def _cfgrib_bytes_to_df(cls, grib_str: bytes, temp_dir: str | None = None) -> pd.DataFrame:
+        """(Protected)
+        Write GRIB data to a temporary file and read it with the `cfgrib` engine, see `_grib_bytes_to_df`.
+        """
+        with cls._temp_grib_file(temp_dir) as path:
             # Write the GRIB binary data to the temporary file
-            temp_file.write(grib_str)
-            temp_file.flush()  # Ensure the data is written to disk
+            with open(path, "wb") as temp_file:
+                temp_file.write(grib_str)
+
+            return cls._cfgrib_file_to_df(path)
+
+    @classmethod
+    def _grib_file_to_df(cls, path: Path) -> pd.DataFrame:
+        """(Protected)
+        Read a GRIB file into a pandas DataFrame, with eccodes if possible, otherwise with cfgrib.
+        """
+        df = grib_to_df(path)
+        if df is not None:
+            return df
 
-            # Open the GRIB file as an xarray Dataset using the cfgrib engine
-            ds = xr.open_dataset(temp_file.name, engine="cfgrib")
+        return cls._cfgrib_file_to_df(path)
 
+    @staticmethod
+    def _cfgrib_file_to_df(path: Path) -> pd.DataFrame:
+        """(Protected)
+        Read a GRIB file into a pandas DataFrame, using the `cfgrib` engine via xarray.
+        """
+        # xarray is slow to import, and only needed for the GRIB files eccodes can't decode alone
+        import xarray as xr  # noqa: PLC0415
+
+        # Open the GRIB file as an xarray Dataset using the cfgrib engine, without writing an index file
+        with xr.open_dataset(path, engine="cfgrib", indexpath="") as ds:
             # Convert the Dataset to a pandas DataFrame
-            df = ds.to_dataframe().reset_index()
+            return ds.to_dataframe().reset_index()
 
-        if created_temp_dir and temp_dir is not None:
-            shutil.rmtree(temp_dir)
-        else:
-            shutil.rmtree(temp_subdir)
+    @staticmethod
+    def _decode_in_executor(executor: Executor, source: bytes | Path, temp_dir: str | None = None) -> pd.DataFrame:
+        """(Protected)
+        Decode a GRIB file (its content or its path) in an executor, e.g. a process pool.
 
-        return df
+        The workers send back compact columns rather than DataFrames when possible, to limit the data to unpickle.
+        """
+        decoded = executor.submit(_decode_grib, source, temp_dir).result()
+        return decoded.to_df() if isinstance(decoded, GribColumns) else decoded
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _decode_pool(decode_workers: int | None, decode_executor: Executor | None) -> Iterator[Executor | None]:
+        """(Protected)
+        Provide the executor decoding the GRIB files: `decode_executor`, a new pool of `decode_workers` processes
+        (shut down afterwards), or None to decode in the calling threads.
+
+        Raises:
+            ValueError: If `decode_workers` is invalid.
+        """
+        if decode_executor is not None or decode_workers is None:
+            yield decode_executor
+            return
+
+        if decode_workers < 1:
+            raise ValueError("Parameter `decode_workers` must be a positive integer")
+
+        with ProcessPoolExecutor(max_workers=decode_workers) as pool:
+            yield pool
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _temp_grib_file(temp_dir: str | None = None) -> Iterator[Path]:
+        """(Protected)
+        Provide the path of a temporary GRIB file, deleted (with its index files) afterwards.
+
+        Args:
+            temp_dir (str | None): Directory to store the temporary file. Defaults to None.
+        """
+        created_temp_dir = False
+
+        if temp_dir and not os.path.exists(temp_dir):
+            os.makedirs(temp_dir, exist_ok=True)
+            created_temp_dir = True
+
+        # One subdirectory per call, so that concurrent calls never remove each other's files
+        temp_subdir = tempfile.mkdtemp(dir=temp_dir or None)
+        try:
+            yield Path(temp_subdir) / "coverage.grib"
+        finally:
+            shutil.rmtree(temp_subdir)
+            if created_temp_dir and temp_dir is not None:
+                with contextlib.suppress(OSError):
+                    # Still in use by a concurrent call
+                    os.rmdir(temp_dir)
 
     def _get_data_single_forecast(
         self,
@@ -647,6 +1328,8 @@ class WeatherForecast(ABC):
         lat: tuple,
         long: tuple,
         temp_dir: str | None = None,
+        deadline: Deadline | None = None,
+        decode_executor: Executor | None = None,
     ) -> pd.DataFrame:
         """(Protected)
         Return the forecast's data for a given time and indicator.
@@ -660,12 +1343,173 @@ class WeatherForecast(ABC):
             lat (tuple): minimum and maximum latitude
             long (tuple): minimum and maximum longitude
             temp_dir (str | None): Directory to store the temporary file. Defaults to None.
+            deadline (Deadline | None): A deadline after which the request is abandoned. Defaults to None.
+            decode_executor (Executor | None): An executor to decode the GRIB file with. Defaults to None
+                (decoded in the calling thread).
+
+        Returns:
+            pd.DataFrame: The forecast for the specified time.
+        """
+        download = self._download_single_forecast(
+            coverage_id=coverage_id,
+            forecast_horizon=forecast_horizon,
+            ensemble_number=ensemble_number,
+            pressure=pressure,
+            height=height,
+            lat=lat,
+            long=long,
+            temp_dir=temp_dir,
+            deadline=deadline,
+        )
+        return self._decode_single_forecast(
+            download,
+            coverage_id=coverage_id,
+            ensemble_number=ensemble_number,
+            lat=lat,
+            long=long,
+            temp_dir=temp_dir,
+            decode_executor=decode_executor,
+        )
+
+    def _download_single_forecast(
+        self,
+        coverage_id: str,
+        forecast_horizon: dt.timedelta,
+        ensemble_number: int | None,
+        pressure: int | None,
+        height: int | None,
+        lat: tuple,
+        long: tuple,
+        temp_dir: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> _GribDownload:
+        """(Protected)
+        Download the GRIB file of a given time and indicator, see `_get_data_single_forecast`.
+
+        Returns:
+            _GribDownload: The downloaded file, in memory or in a temporary file if `stream_downloads` is set.
+        """
+        request: dict[str, Any] = {
+            "coverage_id": coverage_id,
+            "ensemble_number": ensemble_number,
+            "height": height,
+            "pressure": pressure,
+            "forecast_horizon_in_seconds": int(forecast_horizon.total_seconds()),
+            "lat": lat,
+            "long": long,
+        }
+        store = self.grib_store
+        key = (
+            GribStore.key(*self._coverage_file_request(**request))
+            if store is not None or self.missing_data_cache is not None
+            else ""
+        )
+        with span(
+            "GetCoverage",
+            coverage_id=coverage_id,
+            forecast_horizon=forecast_horizon,
+            height=height,
+            pressure=pressure,
+            ensemble_number=ensemble_number,
+        ) as stage:
+            if not self.stream_downloads:
+                if store is not None and (stored := store.get(key)) is not None:
+                    stage.set(source="store", bytes=len(stored))
+                    return _GribDownload(stored)
+                with self._remember_missing_data(key, coverage_id):
+                    data = self._get_coverage_file(**request, deadline=deadline)
+                stage.set(source="api", bytes=len(data))
+                if store is not None:
+                    store.put(key, data)
+                return _GribDownload(data)
+
+            with contextlib.ExitStack() as files:
+                path = files.enter_context(self._temp_grib_file(temp_dir))
+                if store is not None and store.copy_to(key, path):
+                    stage.set(source="store")
+                else:
+                    with self._remember_missing_data(key, coverage_id):
+                        self._download_coverage_file(path, **request, deadline=deadline)
+                    stage.set(source="api")
+                    if store is not None:
+                        store.put_file(key, path)
+                stage.set(bytes=path.stat().st_size)
+                # The file is deleted once decoded
+                return _GribDownload(path, files.pop_all())
+
+    @contextlib.contextmanager
+    def _remember_missing_data(self, key: str, coverage_id: str) -> Iterator[None]:
+        """(Protected)
+        Guard a GetCoverage request with the missing data cache, if any: raise the error of a request known to be
+        missing instead of making it, and remember the requests answered with a `MissingDataError`.
+
+        Args:
+            key: The key of the request, see `GribStore.key`.
+            coverage_id: The coverage requested.
+
+        Raises:
+            MissingDataError: The request is known to be missing.
+        """
+        cache = self.missing_data_cache
+        if cache is None:
+            yield
+            return
+
+        error = cache.get(key)
+        if error is not None:
+            logger.debug(f"Known to be missing, not requested again: {coverage_id}")
+            raise error
+        try:
+            yield
+        except MissingDataError as exc:
+            cache.set(key, exc, ttl=cache.ttl(coverage_id))
+            raise
+
+    def _decode_single_forecast(
+        self,
+        download: _GribDownload,
+        coverage_id: str,
+        ensemble_number: int | None,
+        lat: tuple,
+        long: tuple,
+        temp_dir: str | None = None,
+        decode_executor: Executor | None = None,
+    ) -> pd.DataFrame:
+        """(Protected)
+        Decode a downloaded GRIB file, and delete it if it was written to disk. See `_get_data_single_forecast`.
 
         Returns:
             pd.DataFrame: The forecast for the specified time.
         """
+        df: pd.DataFrame
+        with span("decode", coverage_id=coverage_id) as stage, download.files:
+            if decode_executor is not None:
+                df = self._decode_in_executor(decode_executor, download.source, temp_dir=temp_dir)
+            elif isinstance(download.source, Path):
+                df = self._grib_file_to_df(download.source)
+            else:
+                df = self._grib_bytes_to_df(download.source, temp_dir=temp_dir)
+            stage.set(rows=len(df))
+
+        with span("format", coverage_id=coverage_id):
+            return self._format_single_forecast(df, coverage_id, ensemble_number, lat, long)
 
-        grib_binary: bytes = self._get_coverage_file(
+    async def _aget_data_single_forecast(
+        self,
+        coverage_id: str,
+        forecast_horizon: dt.timedelta,
+        ensemble_number: int | None,
+        pressure: int | None,
+        height: int | None,
+        lat: tuple,
+        long: tuple,
+        temp_dir: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> pd.DataFrame:
+        """(Protected)
+        Asynchronous counterpart of `_get_data_single_forecast`. The GRIB file is decoded in a thread.
+        """
+        url, params = self._coverage_file_request(
             coverage_id=coverage_id,
             ensemble_number=ensemble_number,
             height=height,
@@ -674,9 +1518,51 @@ class WeatherForecast(ABC):
             lat=lat,
             long=long,
         )
+        store = self.grib_store
+        key = GribStore.key(url, params) if store is not None or self.missing_data_cache is not None else ""
+        with span(
+            "GetCoverage",
+            coverage_id=coverage_id,
+            forecast_horizon=forecast_horizon,
+            height=height,
+            pressure=pressure,
+            ensemble_number=ensemble_number,
+        ) as stage:
+            data = await asyncio.to_thread(store.get, key) if store is not None else None
+            if data is not None:
+                stage.set(source="store")
+            else:
+                with self._remember_missing_data(key, coverage_id):
+                    response = await self._aget(url, params, deadline)
+                data = response.content
+                stage.set(source="api")
+                if store is not None:
+                    await asyncio.to_thread(store.put, key, data)
+            stage.set(bytes=len(data))
+
+        with span("decode", coverage_id=coverage_id) as stage:
+            df: pd.DataFrame = await asyncio.to_thread(self._grib_bytes_to_df, data, temp_dir=temp_dir)
+            stage.set(rows=len(df))
+
+        with span("format", coverage_id=coverage_id):
+            return self._format_single_forecast(df, coverage_id, ensemble_number, lat, long)
+
+    def _format_single_forecast(
+        self, df: pd.DataFrame, coverage_id: str, ensemble_number: int | None, lat: tuple, long: tuple
+    ) -> pd.DataFrame:
+        """(Protected)
+        Filter, rename and drop the columns of a decoded GRIB file.
 
-        df: pd.DataFrame = self._grib_bytes_to_df(grib_binary, temp_dir=temp_dir)
+        Args:
+            df: The decoded GRIB file, see `_grib_bytes_to_df`.
+            coverage_id (str): the indicator.
+            ensemble_number (int): For ensemble models only, number of the desired ensemble member.
+            lat (tuple): minimum and maximum latitude
+            long (tuple): minimum and maximum longitude
 
+        Returns:
+            pd.DataFrame: The forecast for the specified time.
+        """
         if self.MODEL_NAME == "pearpege":
             # for unclear reasons, the pearpege API does not accept lat, long
             # parameters unlike the other models API.
@@ -746,6 +1632,7 @@ class WeatherForecast(ABC):
         forecast_horizon_in_seconds: int = 0,
         lat: tuple = (37.5, 55.4),
         long: tuple = (-12, 16),
+        deadline: Deadline | None = None,
     ) -> bytes:
         """(Protected)
         Retrieves data for a specified model prediction.
@@ -762,6 +1649,7 @@ class WeatherForecast(ABC):
                 Defaults to (37.5, 55.4), covering the latitudes of France.
             long (tuple[float, float], optional): Tuple specifying the minimum and maximum longitudes.
                 Defaults to (-12, 16), covering the longitudes of France.
+            deadline (Deadline, optional): A deadline after which the request is abandoned.
 
         Returns:
             Path: The file path to the saved raster data.
@@ -773,6 +1661,83 @@ class WeatherForecast(ABC):
         See Also:
             raster.plot_tiff_file: Method for plotting raster data stored in TIFF format.
         """
+        url, params = self._coverage_file_request(
+            coverage_id=coverage_id,
+            ensemble_number=ensemble_number,
+            height=height,
+            pressure=pressure,
+            forecast_horizon_in_seconds=forecast_horizon_in_seconds,
+            lat=lat,
+            long=long,
+        )
+
+        response = self._get(url, params, deadline)
+
+        return response.content
+
+    def _download_coverage_file(
+        self,
+        path: Path,
+        coverage_id: str,
+        ensemble_number: int | None,
+        height: int | None = None,
+        pressure: int | None = None,
+        forecast_horizon_in_seconds: int = 0,
+        lat: tuple = (37.5, 55.4),
+        long: tuple = (-12, 16),
+        deadline: Deadline | None = None,
+    ) -> int:
+        """(Protected)
+        Download the data of a model prediction to a file, in chunks of `DOWNLOAD_CHUNK_SIZE` bytes.
+
+        Unlike `_get_coverage_file`, the GRIB file is never held in memory as a whole.
+
+        Args:
+            path (Path): The file to write.
+            Others: see `_get_coverage_file`.
+
+        Returns:
+            int: The size of the file, in bytes.
+        """
+        url, params = self._coverage_file_request(
+            coverage_id=coverage_id,
+            ensemble_number=ensemble_number,
+            height=height,
+            pressure=pressure,
+            forecast_horizon_in_seconds=forecast_horizon_in_seconds,
+            lat=lat,
+            long=long,
+        )
+
+        size = 0
+        response = self._get(url, params, deadline, stream=True)
+        try:
+            with open(path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
+                    size += len(chunk)
+        finally:
+            response.close()
+
+        logger.debug(f"Downloaded {size} bytes to {path}")
+        return size
+
+    def _coverage_file_request(
+        self,
+        coverage_id: str,
+        ensemble_number: int | None,
+        height: int | None,
+        pressure: int | None,
+        forecast_horizon_in_seconds: int,
+        lat: tuple,
+        long: tuple,
+    ) -> tuple[str, dict[str, Any]]:
+        """(Protected)
+        Build the GetCoverage request, see `_get_coverage_file`.
+
+        Returns:
+            The path and the query parameters of the request.
+        """
         if ensemble_number is None:
             url = f"{self._model_base_path}/{self._entry_point}/GetCoverage"
         else:
@@ -804,10 +1769,7 @@ class WeatherForecast(ABC):
             "format": "application/wmo-grib",
             "subset": subset,
         }
-
-        response = self._client.get(url, params=params)
-
-        return response.content
+        return url, params
 
     @staticmethod
     def _get_available_feature(grid_axis: list[dict[str, Any]], feature_name: str) -> list[int]:
@@ -834,6 +1796,7 @@ class WeatherForecast(ABC):
         )
         return features
 
+    @traced("get_combined_coverage")
     def get_combined_coverage(
         self,
         indicator_names: list[str],
@@ -846,6 +1809,13 @@ class WeatherForecast(ABC):
         long: tuple = FRANCE_METRO_LONGITUDES,
         forecast_horizons: list[dt.timedelta] | None = None,
         temp_dir: str | None = None,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        on_error: str = "raise",
+        deadline: Deadline | None = None,
+        decode_workers: int | None = None,
+        decode_executor: Executor | None = None,
+        queue_size: int | None = None,
     ) -> pd.DataFrame:
         """
         Get a combined DataFrame of coverage data for multiple indicators and different runs.
@@ -868,6 +1838,15 @@ class WeatherForecast(ABC):
             long (tuple): The longitude range as (min_longitude, max_longitude). Defaults to FRANCE_METRO_LONGITUDES.
             forecast_horizons (list[dt.timedelta] | None): A list of forecast horizon values in dt.timedelta. Defaults to None.
             temp_dir (str | None): Directory to store the temporary file. Defaults to None.
+            max_workers: Maximum number of requests made concurrently, see `get_coverage`. Defaults to None.
+            executor: An executor to run the requests with, see `get_coverage`. Defaults to None.
+            on_error: "raise" or "collect", see `get_coverage`. Defaults to "raise".
+            deadline: A deadline shared by all the requests, see `get_coverage`. Defaults to None.
+            decode_workers: Number of processes decoding the GRIB files of all the coverages, see `get_coverage`.
+                Defaults to None.
+            decode_executor: An executor to decode the GRIB files with, see `get_coverage`. Defaults to None.
+            queue_size: Size of the queue of the download/decode pipeline of each coverage, see `get_coverage`.
+                Defaults to None (no pipeline).
 
         Returns:
             pd.DataFrame: A combined DataFrame containing coverage data for all specified runs and indicators.
@@ -881,21 +1860,31 @@ class WeatherForecast(ABC):
 
         if runs is None:
             runs = [None]
-        coverages = [
-            self._get_combined_coverage_for_single_run(
-                indicator_names=indicator_names,
-                run=run,
-                lat=lat,
-                long=long,
-                ensemble_numbers=ensemble_numbers,
-                heights=heights,
-                pressures=pressures,
-                intervals=intervals,
-                forecast_horizons=forecast_horizons,
-                temp_dir=temp_dir,
-            )
-            for run in runs
-        ]
+
+        # A single pool of processes for all the coverages
+        with self._decode_pool(decode_workers, decode_executor) as decode_pool:
+            coverages = [
+                self._get_combined_coverage_for_single_run(
+                    indicator_names=indicator_names,
+                    run=run,
+                    lat=lat,
+                    long=long,
+                    ensemble_numbers=ensemble_numbers,
+                    heights=heights,
+                    pressures=pressures,
+                    intervals=intervals,
+                    forecast_horizons=forecast_horizons,
+                    temp_dir=temp_dir,
+                    max_workers=max_workers,
+                    executor=executor,
+                    on_error=on_error,
+                    deadline=deadline,
+                    decode_workers=decode_workers,
+                    decode_executor=decode_pool,
+                    queue_size=queue_size,
+                )
+                for run in runs
+            ]
         return pd.concat(coverages, axis=0).reset_index(drop=True)
 
     def _get_combined_coverage_for_single_run(
@@ -910,6 +1899,13 @@ class WeatherForecast(ABC):
         long: tuple = FRANCE_METRO_LONGITUDES,
         forecast_horizons: list[dt.timedelta] | None = None,
         temp_dir: str | None = None,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        on_error: str = "raise",
+        deadline: Deadline | None = None,
+        decode_workers: int | None = None,
+        decode_executor: Executor | None = None,
+        queue_size: int | None = None,
     ) -> pd.DataFrame:
         """(Protected)
         Get a combined DataFrame of coverage data for a given run considering a list of indicators.
@@ -932,6 +1928,14 @@ class WeatherForecast(ABC):
             long (tuple): The longitude range as (min_longitude, max_longitude). Defaults to FRANCE_METRO_LONGITUDES.
             forecast_horizons (list[dt.timedelta] | None): A list of forecast horizon values (as a dt.timedelta object). Defaults to None.
             temp_dir (str | None): Directory to store the temporary file. Defaults to None.
+            max_workers: Maximum number of requests made concurrently, see `get_coverage`. Defaults to None.
+            executor: An executor to run the requests with, see `get_coverage`. Defaults to None.
+            on_error: "raise" or "collect", see `get_coverage`. Defaults to "raise".
+            deadline: A deadline shared by all the requests, see `get_coverage`. Defaults to None.
+            decode_workers: Number of threads decoding the GRIB files in the pipeline, see `get_coverage`.
+                Defaults to None.
+            decode_executor: An executor to decode the GRIB files with, see `get_coverage`. Defaults to None.
+            queue_size: Size of the queue of the download/decode pipeline, see `get_coverage`. Defaults to None.
 
         Returns:
             pd.DataFrame: A combined DataFrame containing coverage data for all specified runs and indicators.
@@ -940,34 +1944,12 @@ class WeatherForecast(ABC):
             ValueError: If the length of `heights` does not match the length of `indicator_names`.
         """
 
-        def _check_params_length(params: list[Any] | None, arg_name: str) -> list[Any]:
-            """(Protected)
-            Assert length is ok or raise an error.
-
-            Args:
-                params: list of parameters.
-                arg_name: argument name.
-
-            Returns:
-                The given parameters unchanged.
-
-            Raises:
-                ValueError: The length of {arg_name} must match the length of indicator_names.
-            """
-            if params is None:
-                return [None] * len(indicator_names)
-            if len(params) != len(indicator_names):
-                raise ValueError(
-                    f"The length of {arg_name} must match the length of indicator_names."
-                    f" If you want multiple {arg_name} for a single indicator, create multiple"
-                    " entries in `indicator_names`."
-                )
-            return params
-
-        heights = _check_params_length(heights, "heights")
-        pressures = _check_params_length(pressures, "pressures")
-        intervals = _check_params_length(intervals, "intervals")
+        heights = self._check_params_length(heights, "heights", indicator_names)
+        pressures = self._check_params_length(pressures, "pressures", indicator_names)
+        intervals = self._check_params_length(intervals, "intervals", indicator_names)
 
+        if deadline is not None:
+            self._load_capabilities(deadline)
         # Get coverage id from run and indicator_name
         coverage_ids = [
             self._get_coverage_id(indicator_name, run, interval)
@@ -976,11 +1958,11 @@ class WeatherForecast(ABC):
 
         if forecast_horizons:
             # Check forecast_horizons is valid for all indicators
-            invalid_coverage_ids = self._validate_forecast_horizons(coverage_ids, forecast_horizons)
+            invalid_coverage_ids = self._validate_forecast_horizons(coverage_ids, forecast_horizons, deadline)
             if invalid_coverage_ids:
                 raise ValueError(f"{forecast_horizons} are not valid for these coverage_ids : {invalid_coverage_ids}")
         else:
-            forecast_horizons = [self.find_common_forecast_horizons(coverage_ids)[0]]
+            forecast_horizons = [self.find_common_forecast_horizons(coverage_ids, deadline)[0]]
             logger.info(f"Using common forecast_horizons `forecast_horizons={forecast_horizons}`.")
 
         coverages = [
@@ -995,51 +1977,253 @@ class WeatherForecast(ABC):
                     pressures=[pressure] if pressure is not None else [],
                     forecast_horizons=forecast_horizons,
                     temp_dir=temp_dir,
+                    max_workers=max_workers,
+                    executor=executor,
+                    on_error=on_error,
+                    deadline=deadline,
+                    decode_workers=decode_workers,
+                    decode_executor=decode_executor,
+                    queue_size=queue_size,
                 )
                 for coverage_id, height, pressure in zip(coverage_ids, heights, pressures)
             ]
             for ensemble_number in ([None] if (ensemble_numbers is None) else ensemble_numbers)
         ]
 
-        coverages_concat = pd.concat(
-            [
-                reduce(
-                    lambda left, right: pd.merge(
-                        left,
-                        right,
-                        on=["latitude", "longitude", "ensemble_number", "run", "forecast_horizon"]
-                        if self.MODEL_TYPE == "ENSEMBLE"
-                        else ["latitude", "longitude", "run", "forecast_horizon"],
-                        how="inner",
-                        validate="one_to_one",
-                    ),
-                    coverages[i],
+        return self._merge_coverages(coverages)
+
+    @traced("get_combined_coverage")
+    async def aget_combined_coverage(
+        self,
+        indicator_names: list[str],
+        runs: list[str | None] | None = None,
+        ensemble_numbers: list[int] | None = None,
+        heights: list[int] | None = None,
+        pressures: list[int] | None = None,
+        intervals: list[str | None] | None = None,
+        lat: tuple = FRANCE_METRO_LATITUDES,
+        long: tuple = FRANCE_METRO_LONGITUDES,
+        forecast_horizons: list[dt.timedelta] | None = None,
+        temp_dir: str | None = None,
+        max_concurrency: int | None = None,
+        on_error: str = "raise",
+        deadline: Deadline | None = None,
+    ) -> pd.DataFrame:
+        """Asynchronous counterpart of `get_combined_coverage`.
+
+        The coverages of all the indicators, runs and ensemble members are fetched concurrently.
+
+        Args:
+            indicator_names (list[str]): A list of indicator names to retrieve data for.
+            runs (list[str]): A list of runs for each indicator. Format should be "YYYY-MM-DDTHH:MM:SSZ".
+            ensemble_numbers: For ensemble models only, numbers of the desired
+                   ensemble members. If None, defaults to the member 0.
+            heights (list[int] | None): A list of heights in meters to filter by (default is None).
+            pressures (list[int] | None): A list of pressures in hPa to filter by (default is None).
+            intervals (list[str] | None): A list of aggregation periods (default is None).
+                    Must be `None` or "" for instant indicators ; otherwise, raises an exception.
+                    Defaults to 'P1D' for time-aggregated indicators.
+            lat (tuple): The latitude range as (min_latitude, max_latitude). Defaults to FRANCE_METRO_LATITUDES.
+            long (tuple): The longitude range as (min_longitude, max_longitude). Defaults to FRANCE_METRO_LONGITUDES.
+            forecast_horizons (list[dt.timedelta] | None): A list of forecast horizon values in dt.timedelta. Defaults to None.
+            temp_dir (str | None): Directory to store the temporary file. Defaults to None.
+            max_concurrency: Maximum number of GetCoverage requests in flight, across all the coverages.
+                Defaults to None (no limit).
+            on_error: "raise" or "collect", see `get_coverage`. Defaults to "raise".
+            deadline: A deadline shared by all the requests, see `get_coverage`. Defaults to None.
+
+        Returns:
+            pd.DataFrame: A combined DataFrame containing coverage data for all specified runs and indicators.
+
+        Raises:
+            ValueError: If the length of `heights` does not match the length of `indicator_names`.
+        """
+        # Numbers cannot be None if the model type is ENSEMBLE
+        if self.MODEL_TYPE == "ENSEMBLE" and ensemble_numbers is None:
+            ensemble_numbers = [0]
+
+        if runs is None:
+            runs = [None]
+
+        await self._aget_capabilities(deadline)
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+
+        coverages = await asyncio.gather(
+            *(
+                self._aget_combined_coverage_for_single_run(
+                    indicator_names=indicator_names,
+                    run=run,
+                    ensemble_numbers=ensemble_numbers,
+                    heights=heights,
+                    pressures=pressures,
+                    intervals=intervals,
+                    lat=lat,
+                    long=long,
+                    forecast_horizons=forecast_horizons,
+                    temp_dir=temp_dir,
+                    semaphore=semaphore,
+                    on_error=on_error,
+                    deadline=deadline,
                 )
-                for i in range(len(coverages))
-            ]
+                for run in runs
+            )
+        )
+        return pd.concat(coverages, axis=0).reset_index(drop=True)
+
+    async def _aget_combined_coverage_for_single_run(
+        self,
+        indicator_names: list[str],
+        run: str | None,
+        ensemble_numbers: list[int] | None,
+        heights: list[int] | None,
+        pressures: list[int] | None,
+        intervals: list[str | None] | None,
+        lat: tuple,
+        long: tuple,
+        forecast_horizons: list[dt.timedelta] | None,
+        temp_dir: str | None,
+        semaphore: asyncio.Semaphore | None,
+        on_error: str,
+        deadline: Deadline | None = None,
+    ) -> pd.DataFrame:
+        """(Protected)
+        Asynchronous counterpart of `_get_combined_coverage_for_single_run`.
+        """
+        heights = self._check_params_length(heights, "heights", indicator_names)
+        pressures = self._check_params_length(pressures, "pressures", indicator_names)
+        intervals = self._check_params_length(intervals, "intervals", indicator_names)
+
+        # Get coverage id from run and indicator_name
+        coverage_ids = [
+            self._get_coverage_id(indicator_name, run, interval)
+            for indicator_name, interval in zip(indicator_names, intervals)
+        ]
+
+        descriptions = await asyncio.gather(
+            *(self.aget_coverage_description(cid, deadline=deadline) for cid in coverage_ids)
         )
+        indicator_forecast_horizons = [description["forecast_horizons"] for description in descriptions]
+
+        if forecast_horizons:
+            # Check forecast_horizons is valid for all indicators
+            invalid_coverage_ids = self._find_invalid_coverage_ids(
+                coverage_ids, indicator_forecast_horizons, forecast_horizons
+            )
+            if invalid_coverage_ids:
+                raise ValueError(f"{forecast_horizons} are not valid for these coverage_ids : {invalid_coverage_ids}")
+        else:
+            forecast_horizons = [self._intersect_forecast_horizons(indicator_forecast_horizons)[0]]
+            logger.info(f"Using common forecast_horizons `forecast_horizons={forecast_horizons}`.")
+
+        members = [None] if ensemble_numbers is None else ensemble_numbers
+        flat_coverages = await asyncio.gather(
+            *(
+                self._aget_coverage(
+                    indicator=None,
+                    coverage_id=coverage_id,
+                    run=run,
+                    interval=None,
+                    lat=lat,
+                    long=long,
+                    ensemble_numbers=[ensemble_number] if ensemble_number is not None else None,
+                    heights=[height] if height is not None else [],
+                    pressures=[pressure] if pressure is not None else [],
+                    forecast_horizons=forecast_horizons,
+                    temp_dir=temp_dir,
+                    semaphore=semaphore,
+                    on_error=on_error,
+                    deadline=deadline,
+                )
+                for ensemble_number in members
+                for coverage_id, height, pressure in zip(coverage_ids, heights, pressures)
+            )
+        )
+        coverages = [
+            list(flat_coverages[i * len(coverage_ids) : (i + 1) * len(coverage_ids)]) for i in range(len(members))
+        ]
+
+        return self._merge_coverages(coverages)
+
+    @staticmethod
+    def _check_params_length(params: list[Any] | None, arg_name: str, indicator_names: list[str]) -> list[Any]:
+        """(Protected)
+        Assert length is ok or raise an error.
+
+        Args:
+            params: list of parameters.
+            arg_name: argument name.
+            indicator_names: list of indicator names.
+
+        Returns:
+            The given parameters unchanged.
+
+        Raises:
+            ValueError: The length of {arg_name} must match the length of indicator_names.
+        """
+        if params is None:
+            return [None] * len(indicator_names)
+        if len(params) != len(indicator_names):
+            raise ValueError(
+                f"The length of {arg_name} must match the length of indicator_names."
+                f" If you want multiple {arg_name} for a single indicator, create multiple"
+                " entries in `indicator_names`."
+            )
+        return params
+
+    def _merge_coverages(self, coverages: list[list[pd.DataFrame]]) -> pd.DataFrame:
+        """(Protected)
+        Merge the coverages of several indicators, for each ensemble member, and concatenate the results.
+
+        Args:
+            coverages: For each ensemble member, the coverages of each indicator.
+
+        Returns:
+            pd.DataFrame: The merged coverages, with one column per indicator.
+        """
+        with span("merge", coverages=sum(len(indicators) for indicators in coverages)):
+            coverages_concat = pd.concat(
+                [
+                    reduce(
+                        lambda left, right: pd.merge(
+                            left,
+                            right,
+                            on=["latitude", "longitude", "ensemble_number", "run", "forecast_horizon"]
+                            if self.MODEL_TYPE == "ENSEMBLE"
+                            else ["latitude", "longitude", "run", "forecast_horizon"],
+                            how="inner",
+                            validate="one_to_one",
+                        ),
+                        coverages[i],
+                    )
+                    for i in range(len(coverages))
+                ]
+            )
 
         return coverages_concat
 
-    def _get_forecast_horizons(self, coverage_ids: list[str]) -> list[list[dt.timedelta]]:
+    def _get_forecast_horizons(
+        self, coverage_ids: list[str], deadline: Deadline | None = None
+    ) -> list[list[dt.timedelta]]:
         """(Protected)
         Retrieve the times for each coverage_id.
 
         Args:
             coverage_ids: List of coverage IDs.
+            deadline: A deadline after which the DescribeCoverage requests are abandoned. Defaults to None.
 
         Returns:
             List of times for each coverage ID.
         """
         indicator_times: list[list[dt.timedelta]] = []
         for coverage_id in coverage_ids:
-            times = self.get_coverage_description(coverage_id)["forecast_horizons"]
+            times = self.get_coverage_description(coverage_id, deadline=deadline)["forecast_horizons"]
             indicator_times.append(times)
         return indicator_times
 
     def find_common_forecast_horizons(
         self,
         list_coverage_id: list[str],
+        deadline: Deadline | None = None,
     ) -> list[dt.timedelta]:
         """Find common forecast_horizons among coverage IDs.
 
@@ -1048,12 +2232,24 @@ class WeatherForecast(ABC):
             run: Identifies the model inference. Defaults to latest if None. Format "YYYY-MM-DDTHH:MM:SSZ".
             intervals: List of aggregation periods. Must be None for instant indicators, otherwise raises.
                     Defaults to P1D for time-aggregated indicators like TOTAL_PRECIPITATION.
+            deadline: A deadline after which the DescribeCoverage requests are abandoned. Defaults to None.
 
         Returns:
             List of common forecast_horizons.
         """
-        indicator_forecast_horizons = self._get_forecast_horizons(list_coverage_id)
+        return self._intersect_forecast_horizons(self._get_forecast_horizons(list_coverage_id, deadline))
+
+    @staticmethod
+    def _intersect_forecast_horizons(indicator_forecast_horizons: list[list[dt.timedelta]]) -> list[dt.timedelta]:
+        """(Protected)
+        Find the forecast_horizons common to all the given lists.
+
+        Args:
+            indicator_forecast_horizons: The forecast_horizons of each coverage.
 
+        Returns:
+            List of common forecast_horizons, sorted.
+        """
         common_forecast_horizons = indicator_forecast_horizons[0]
         for times in indicator_forecast_horizons[1:]:
             common_forecast_horizons = [time for time in common_forecast_horizons if time in times]
@@ -1064,19 +2260,41 @@ class WeatherForecast(ABC):
 
         return sorted(common_forecast_horizons)
 
-    def _validate_forecast_horizons(self, coverage_ids: list[str], forecast_horizons: list[dt.timedelta]) -> list[str]:
+    def _validate_forecast_horizons(
+        self, coverage_ids: list[str], forecast_horizons: list[dt.timedelta], deadline: Deadline | None = None
+    ) -> list[str]:
         """(Protected)
         Validate forecast_horizons for a list of coverage IDs.
 
         Args:
             coverage_ids: List of coverage IDs.
             forecast_horizons: List of time forecasts to validate.
+            deadline: A deadline after which the DescribeCoverage requests are abandoned. Defaults to None.
 
         Returns:
             List of invalid coverage IDs.
         """
-        indicator_forecast_horizons = self._get_forecast_horizons(coverage_ids)
+        return self._find_invalid_coverage_ids(
+            coverage_ids, self._get_forecast_horizons(coverage_ids, deadline), forecast_horizons
+        )
 
+    @staticmethod
+    def _find_invalid_coverage_ids(
+        coverage_ids: list[str],
+        indicator_forecast_horizons: list[list[dt.timedelta]],
+        forecast_horizons: list[dt.timedelta],
+    ) -> list[str]:
+        """(Protected)
+        List the coverage IDs for which some of the forecast_horizons are not available.
+
+        Args:
+            coverage_ids: List of coverage IDs.
+            indicator_forecast_horizons: The available forecast_horizons of each coverage ID.
+            forecast_horizons: List of time forecasts to validate.
+
+        Returns:
+            List of invalid coverage IDs.
+        """
         invalid_coverage_ids = [
             coverage_id
             for coverage_id, times in zip(coverage_ids, indicator_forecast_horizons)
@@ -1084,3 +2302,19 @@ class WeatherForecast(ABC):
         ]
 
         return invalid_coverage_ids
+
+
+def _decode_grib(source: bytes | Path, temp_dir: str | None = None) -> GribColumns | pd.DataFrame:
+    """(Protected)
+    Decode a GRIB file (its content or its path), in a worker process. See `WeatherForecast._grib_bytes_to_df`.
+
+    Returns:
+        The compact columns of the file, or a DataFrame if it had to be decoded with cfgrib.
+    """
+    columns = grib_to_columns(source)
+    if columns is not None:
+        return columns
+
+    if isinstance(source, Path):
+        return WeatherForecast._cfgrib_file_to_df(source)
+    return WeatherForecast._cfgrib_bytes_to_df(source, temp_dir)
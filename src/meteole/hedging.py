@@ -0,0 +1,119 @@
+"""Hedged requests, against the long tail of the latencies of the API"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from collections import deque
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class HedgingStats(NamedTuple):
+    """Statistics of a `HedgingPolicy`."""
+
+    requests: int
+    hedges: int
+    hedge_wins: int
+
+
+class HedgingPolicy:
+    """When to send a duplicate of a slow request, shared by all the callers of a client.
+
+    A request that hasn't answered once the `percentile` of the recent latencies has elapsed is sent again, and the
+    first response wins. The extra requests are capped to `max_extra_ratio` of the requests, to stay under the quotas.
+
+    Example:
+        >>> hedging = HedgingPolicy(percentile=95, max_extra_ratio=0.05)
+        >>> client = MeteoFranceClient(api_key="...", hedging=hedging)
+
+    Attributes:
+        percentile: The percentile of the recent latencies after which a request is hedged.
+        max_extra_ratio: The maximum number of hedges, as a ratio of the number of requests.
+        min_delay: The minimum time before hedging a request, in seconds.
+        window: The number of recent latencies kept.
+        min_samples: The number of latencies needed before hedging requests.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        max_extra_ratio: float = 0.05,
+        *,
+        min_delay: float = 0.05,
+        window: int = 200,
+        min_samples: int = 20,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            percentile: The percentile of the recent latencies after which a request is hedged, in ]0, 100].
+            max_extra_ratio: The maximum number of hedges, as a ratio of the number of requests (e.g. 0.05 sends
+                at most 5 extra requests per 100 requests).
+            min_delay: The minimum time before hedging a request, in seconds.
+            window: The number of recent latencies kept.
+            min_samples: The number of latencies needed before hedging requests.
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("Parameter `percentile` must be in ]0, 100]")
+        if max_extra_ratio < 0:
+            raise ValueError("Parameter `max_extra_ratio` must be non-negative")
+        if window < 1 or min_samples < 1:
+            raise ValueError("Parameters `window` and `min_samples` must be positive integers")
+
+        self.percentile = percentile
+        self.max_extra_ratio = max_extra_ratio
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def delay(self) -> float | None:
+        """Count a new request, and return the time after which it is hedged.
+
+        Returns:
+            The delay, in seconds, or None if the request isn't hedged (not enough latencies known yet).
+        """
+        with self._lock:
+            self._requests += 1
+            if len(self._latencies) < min(self.min_samples, self.window):
+                return None
+            latencies = sorted(self._latencies)
+        rank = math.ceil(self.percentile / 100 * len(latencies)) - 1
+        return max(self.min_delay, latencies[max(0, rank)])
+
+    def acquire(self) -> bool:
+        """Take the right to send a hedge, if the cap allows it."""
+        with self._lock:
+            if self._hedges + 1 > self.max_extra_ratio * self._requests:
+                return False
+            self._hedges += 1
+            return True
+
+    def release(self) -> None:
+        """Give back the right taken with `acquire`, when the hedge isn't sent after all."""
+        with self._lock:
+            self._hedges -= 1
+
+    def record(self, latency: float, hedge_won: bool = False) -> None:
+        """Record the latency of a request.
+
+        Args:
+            latency: Time until the first response, in seconds.
+            hedge_won: Whether the hedge answered first.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            if hedge_won:
+                self._hedge_wins += 1
+
+    def stats(self) -> HedgingStats:
+        """Return the statistics of the policy."""
+        with self._lock:
+            return HedgingStats(self._requests, self._hedges, self._hedge_wins)
@@ -0,0 +1,196 @@
+"""Instrumentation of the requests of the clients"""
+
+from __future__ import annotations
+
+import bisect
+import copy
+import logging
+import threading
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency histograms, in seconds
+DEFAULT_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass
+class RequestMetrics:
+    """Measures of a request of a client, retries included.
+
+    Attributes:
+        family: The API family of the request ("arome", "DPClim", ...).
+        status: The status code of the last response, None if no response was received.
+        error: The name of the exception raised, None if the request succeeded.
+        latency: Total time of the request, in seconds.
+        bytes_received: Size of the body of the response, in bytes (its announced size for a streamed response).
+        attempts: Number of requests sent (1 + retries).
+        token_refreshes: Number of token refreshes during the request.
+        backoff_time: Time spent waiting between attempts, in seconds.
+        throttle_time: Time spent waiting for the rate limiter, in seconds.
+    """
+
+    family: str
+    status: int | None = None
+    error: str | None = None
+    latency: float = 0.0
+    bytes_received: int = 0
+    attempts: int = 0
+    token_refreshes: int = 0
+    backoff_time: float = 0.0
+    throttle_time: float = 0.0
+
+    @property
+    def retries(self) -> int:
+        """Number of retries."""
+        return max(0, self.attempts - 1)
+
+
+class Instrumentation:
+    """Receives the measures of every request of the clients it is given to (`instrumentation=...`).
+
+    Subclass it to send the measures elsewhere (logs, StatsD, OpenTelemetry, ...). See `MetricsCollector` for an
+    in-process aggregator.
+    """
+
+    def record_request(self, metrics: RequestMetrics) -> None:
+        """Receive the measures of a request, once it ended. Called from the thread of the request.
+
+        Args:
+            metrics: The measures of the request.
+        """
+
+
+@dataclass
+class _FamilyMetrics:
+    """(Protected)
+    Aggregated measures of an API family.
+    """
+
+    buckets: list[int]
+    requests: dict[str, int] = field(default_factory=dict)
+    latency_sum: float = 0.0
+    latency_count: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    token_refreshes: int = 0
+    backoff_time: float = 0.0
+    throttle_time: float = 0.0
+
+
+class MetricsCollector(Instrumentation):
+    """Aggregate the measures of the requests in memory: counters and latency histograms per API family.
+
+    Example:
+        >>> metrics = MetricsCollector()
+        >>> client = MeteoFranceClient(api_key="...", instrumentation=metrics)
+        >>> ...
+        >>> print(metrics.prometheus_text())
+
+    Attributes:
+        buckets: The upper bounds of the latency histograms, in seconds.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize attributes.
+
+        Args:
+            buckets: The upper bounds of the latency histograms, in seconds (an infinite bucket is added).
+        """
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Parameter `buckets` must be strictly increasing")
+
+        self.buckets = tuple(buckets)
+        self._families: dict[str, _FamilyMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record_request(self, metrics: RequestMetrics) -> None:
+        """Aggregate the measures of a request."""
+        outcome = str(metrics.status) if metrics.status is not None else "error"
+        with self._lock:
+            family = self._families.get(metrics.family)
+            if family is None:
+                family = self._families[metrics.family] = _FamilyMetrics(buckets=[0] * (len(self.buckets) + 1))
+            family.requests[outcome] = family.requests.get(outcome, 0) + 1
+            family.buckets[bisect.bisect_left(self.buckets, metrics.latency)] += 1
+            family.latency_sum += metrics.latency
+            family.latency_count += 1
+            family.bytes_received += metrics.bytes_received
+            family.retries += metrics.retries
+            family.token_refreshes += metrics.token_refreshes
+            family.backoff_time += metrics.backoff_time
+            family.throttle_time += metrics.throttle_time
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        """Return the aggregated measures.
+
+        Returns:
+            A dictionary with an entry per API family, holding:
+                - requests: number of requests, per status code ("error" if no response was received).
+                - latency_buckets: number of requests per latency upper bound (cumulative, `inf` last).
+                - latency_sum: total time of the requests, in seconds.
+                - bytes_received, retries, token_refreshes: totals.
+                - backoff_time, throttle_time: time spent waiting between attempts and for the rate limiter, in
+                  seconds.
+        """
+        with self._lock:
+            snapshot: dict[str, dict[str, object]] = {}
+            for name, family in self._families.items():
+                cumulative, counts = 0, {}
+                for bound, count in zip([*self.buckets, float("inf")], family.buckets):
+                    cumulative += count
+                    counts[bound] = cumulative
+                snapshot[name] = {
+                    "requests": dict(family.requests),
+                    "latency_buckets": counts,
+                    "latency_sum": family.latency_sum,
+                    "bytes_received": family.bytes_received,
+                    "retries": family.retries,
+                    "token_refreshes": family.token_refreshes,
+                    "backoff_time": family.backoff_time,
+                    "throttle_time": family.throttle_time,
+                }
+            return snapshot
+
+    def prometheus_text(self, prefix: str = "meteole") -> str:
+        """Export the aggregated measures in the Prometheus text format, e.g. for a `/metrics` endpoint.
+
+        Args:
+            prefix: The prefix of the metric names.
+        """
+        with self._lock:
+            families = copy.deepcopy(dict(sorted(self._families.items())))
+
+        lines = [
+            f"# HELP {prefix}_requests_total Requests made to the API, by status code of the last response.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for name, family in families.items():
+            for status, count in sorted(family.requests.items()):
+                lines.append(f'{prefix}_requests_total{{family="{name}",status="{status}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_request_duration_seconds Duration of the requests, retries included.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for name, family in families.items():
+            cumulative = 0
+            for bound, count in zip([*self.buckets, float("inf")], family.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{family="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{family="{name}"}} {family.latency_sum}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{family="{name}"}} {family.latency_count}')
+
+        for metric, attribute, help_text in (
+            ("response_bytes_total", "bytes_received", "Bytes received in the bodies of the responses."),
+            ("retries_total", "retries", "Retries of the requests."),
+            ("token_refreshes_total", "token_refreshes", "Token refreshes made by the requests."),
+            ("backoff_seconds_total", "backoff_time", "Time spent waiting before retrying."),
+            ("throttle_seconds_total", "throttle_time", "Time spent waiting for the rate limiter."),
+        ):
+            lines += [f"# HELP {prefix}_{metric} {help_text}", f"# TYPE {prefix}_{metric} counter"]
+            for name, family in families.items():
+                lines.append(f'{prefix}_{metric}{{family="{name}"}} {getattr(family, attribute)}')
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,217 @@
+"""Client-side rate limiting"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Bucket:
+    """(Protected)
+    State of the token bucket of an API family.
+    """
+
+    tokens: float
+    last: float
+    blocked_until: float = 0.0
+
+
+class RateLimiter:
+    """A token-bucket rate limiter, shared by all the callers of a client.
+
+    Requests are grouped by API family, i.e. the first segment of their path ("arome", "arpege", "DPClim",
+    "DPVigilance", ...), since each API of the portal has its own quota. A `Retry-After` received for a family
+    slows down every caller of that family, not only the one that got it.
+
+    Example:
+        >>> limiter = RateLimiter(50, per_family={"DPClim": 25})
+        >>> client = MeteoFranceClient(api_key="...", rate_limiter=limiter)
+
+    Attributes:
+        requests_per_minute: Default quota of the API families.
+        per_family: Quota of specific API families, overriding `requests_per_minute`.
+        burst: Number of requests that can be made at once after an idle period.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        *,
+        per_family: dict[str, float] | None = None,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            requests_per_minute: Default quota of the API families. None means no limit (only `Retry-After` is
+                honoured).
+            per_family: Quota of specific API families, e.g. {"arome": 50, "DPClim": 25}.
+            burst: Number of requests that can be made at once after an idle period. The default (1) spreads the
+                requests evenly over the minute.
+            clock: Monotonic clock, in seconds.
+        """
+        if burst < 1:
+            raise ValueError("Parameter `burst` must be a positive integer")
+
+        self.requests_per_minute = requests_per_minute
+        self.per_family = per_family or {}
+        self.burst = burst
+        self._clock = clock
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def family(path: str) -> str:
+        """Return the API family of a request path (its first segment)."""
+        return path.lstrip("/").split("/", 1)[0]
+
+    def acquire(self, family: str) -> float:
+        """Wait until a request of the API family can be made.
+
+        Args:
+            family: The API family, see `family`.
+
+        Returns:
+            The time waited, in seconds.
+        """
+        wait = self._reserve(family)
+        if wait > 0:
+            logger.debug(f"Rate limit of '{family}' reached - waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, family: str) -> float:
+        """Asynchronous counterpart of `acquire`."""
+        wait = self._reserve(family)
+        if wait > 0:
+            logger.debug(f"Rate limit of '{family}' reached - waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+    def try_acquire(self, family: str, max_wait: float = 0.0) -> float | None:
+        """Wait until a request of the API family can be made, unless it takes longer than `max_wait`.
+
+        Args:
+            family: The API family, see `family`.
+            max_wait: The longest acceptable wait, in seconds.
+
+        Returns:
+            The time waited, in seconds, or None if the request can't be made in time (then no token is taken).
+        """
+        wait = self._reserve(family, max_wait)
+        if wait > max_wait:
+            return None
+        if wait > 0:
+            logger.debug(f"Rate limit of '{family}' reached - waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def atry_acquire(self, family: str, max_wait: float = 0.0) -> float | None:
+        """Asynchronous counterpart of `try_acquire`."""
+        wait = self._reserve(family, max_wait)
+        if wait > max_wait:
+            return None
+        if wait > 0:
+            logger.debug(f"Rate limit of '{family}' reached - waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, family: str, delay: float) -> None:
+        """Block the requests of an API family, e.g. after a 429 response.
+
+        Args:
+            family: The API family, see `family`.
+            delay: Number of seconds during which no request is made.
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(family, now)
+            until = now + delay
+            bucket.blocked_until = max(bucket.blocked_until, until)
+            if self._rate(family) is not None:
+                # Restart from an empty bucket at the end of the penalty, so that the waiting callers are spread
+                # instead of being released all at once
+                bucket.tokens = min(bucket.tokens, 0.0)
+                bucket.last = max(bucket.last, until)
+        logger.warning(f"Quota of '{family}' exceeded - slowing down for {delay:.2f}s")
+
+    def _rate(self, family: str) -> float | None:
+        """(Protected)
+        Return the number of requests per second allowed for an API family, None if unlimited.
+        """
+        requests_per_minute = self.per_family.get(family, self.requests_per_minute)
+        return None if requests_per_minute is None else requests_per_minute / 60
+
+    def _bucket(self, family: str, now: float) -> _Bucket:
+        """(Protected)
+        Return the bucket of an API family, creating a full one if needed. The lock must be held.
+        """
+        if family not in self._buckets:
+            self._buckets[family] = _Bucket(tokens=float(self.burst), last=now)
+        return self._buckets[family]
+
+    def _reserve(self, family: str, max_wait: float = math.inf) -> float:
+        """(Protected)
+        Take a token from the bucket of an API family.
+
+        Args:
+            family: The API family, see `family`.
+            max_wait: The longest acceptable wait, in seconds. No token is taken if the wait is longer.
+
+        Returns:
+            The time to wait before the request can be made, in seconds.
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(family, now)
+            wait = max(0.0, bucket.blocked_until - now)
+
+            rate = self._rate(family)
+            tokens = bucket.tokens
+            if rate is not None:
+                if now > bucket.last:
+                    bucket.tokens = min(float(self.burst), bucket.tokens + (now - bucket.last) * rate)
+                    bucket.last = now
+                tokens = bucket.tokens - 1
+                if tokens < 0:
+                    wait = max(wait, (bucket.last - now) - tokens / rate)
+
+            if wait <= max_wait:
+                bucket.tokens = tokens
+
+        return wait
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a `Retry-After` header.
+
+    Args:
+        value: A number of seconds, or an HTTP date.
+
+    Returns:
+        The number of seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (date - dt.datetime.now(dt.timezone.utc)).total_seconds())
@@ -0,0 +1,152 @@
+"""Background refresh of the capabilities of a forecast"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from types import TracebackType
+from typing import TYPE_CHECKING, Callable
+
+from meteole._capabilities import CapabilitiesIndex
+
+if TYPE_CHECKING:
+    from meteole.forecast import WeatherForecast
+
+logger = logging.getLogger(__name__)
+
+
+class CapabilitiesRefresher:
+    """Refresh the capabilities of a forecast periodically, in a background thread.
+
+    The capabilities are fetched off the readers' path: until new ones are parsed and indexed, `forecast.capabilities`
+    keeps returning the previous ones, without blocking. A failed refresh keeps them too, and is retried at the next
+    period. Callbacks are called when new runs appear.
+
+    Example:
+        >>> arome = AromeForecast(api_key="...")
+        >>> with CapabilitiesRefresher(arome, interval=300, on_new_run=lambda run, indicators: print(run)):
+        ...     serve(arome)
+
+    Attributes:
+        forecast: The forecast refreshed. It must use a synchronous client.
+        interval: The period of the refreshes, in seconds.
+    """
+
+    def __init__(
+        self,
+        forecast: WeatherForecast,
+        interval: float = 600.0,
+        *,
+        on_new_run: Callable[[str, list[str]], None] | None = None,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            forecast: The forecast to refresh. It must use a synchronous client.
+            interval: The period of the refreshes, in seconds.
+            on_new_run: A function called with each new run and the indicators it is new for, see `add_callback`.
+        """
+        if interval <= 0:
+            raise ValueError("Parameter `interval` must be positive")
+
+        self.forecast = forecast
+        self.interval = interval
+        self._callbacks: list[Callable[[str, list[str]], None]] = [on_new_run] if on_new_run is not None else []
+        self._previous: CapabilitiesIndex | None = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add_callback(self, callback: Callable[[str, list[str]], None]) -> None:
+        """Call a function whenever a new run appears in the capabilities.
+
+        The callbacks are called from the refresh thread, from the oldest new run to the latest. Their exceptions are
+        logged and ignored.
+
+        Args:
+            callback: A function called with the new run (e.g. "2024-11-01T18.00.00Z") and the indicators it is new
+                for.
+        """
+        self._callbacks.append(callback)
+
+    @property
+    def running(self) -> bool:
+        """Whether the refresh thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start refreshing in a background (daemon) thread: once now, then every `interval` seconds.
+
+        Raises:
+            RuntimeError: If the refresher is already running.
+        """
+        if self.running:
+            raise RuntimeError("The refresher is already running")
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="meteole-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop refreshing, waiting for a refresh in progress to end.
+
+        Args:
+            timeout: Maximum time to wait for the thread, in seconds. None waits until it ends.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def refresh(self) -> list[str]:
+        """Refresh the capabilities now, in the current thread, and call the callbacks for the new runs.
+
+        The first refresh of a refresher gives no new runs: it compares the capabilities to the ones already loaded by
+        the forecast, if any.
+
+        Returns:
+            The new runs, from the oldest to the latest.
+        """
+        previous = self._previous
+        if previous is None and self.forecast._capabilities is not None:
+            previous = self.forecast.capabilities_index
+
+        self.forecast.refresh_capabilities()
+        index = self.forecast.capabilities_index
+        self._previous = index
+        if previous is None:
+            return []
+
+        new_runs = index.new_runs(previous)
+        for run, indicators in new_runs.items():
+            logger.info(f"New run {run} for {len(indicators)} indicators")
+            for callback in self._callbacks:
+                try:
+                    callback(run, indicators)
+                except Exception:
+                    logger.exception(f"Callback {callback!r} failed on the new run {run}")
+        return list(new_runs)
+
+    def _run(self) -> None:
+        """(Protected)
+        Body of the refresh thread.
+        """
+        while not self._stopped.is_set():
+            try:
+                self.refresh()
+            except Exception as exc:
+                logger.warning(f"Could not refresh the capabilities, keeping the previous ones: {exc}")
+            self._stopped.wait(self.interval)
+
+    def __enter__(self) -> CapabilitiesRefresher:
+        """Start refreshing, see `start`."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop refreshing, see `stop`."""
+        self.stop()
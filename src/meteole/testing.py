@@ -0,0 +1,867 @@
+"""A local stand-in for the Meteo-France portal, to test and benchmark meteole without network access
+
+The stand-in serves the endpoints used by meteole (token, WCS, DPClim and vigilance) on a local HTTP server, with
+synthetic GRIB2 files of configurable size, and faults injected on demand: latency, 429s, 5xx and expired tokens.
+
+Example:
+    >>> from meteole import AromeForecast
+    >>> from meteole.testing import StandInPortal
+    >>> with StandInPortal(latency=0.05, throttle_rate=0.1) as portal:
+    ...     arome = AromeForecast(portal.client())
+    ...     df = arome.get_coverage("TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND", max_workers=8)
+    ...     print(portal.count("GetCoverage", status=429))
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import functools
+import json
+import logging
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Mapping, NamedTuple, Sequence
+from urllib.parse import parse_qs, urlsplit
+
+import eccodes
+import numpy as np
+
+from meteole._capabilities import RUN_FORMAT
+from meteole.clients import AsyncMeteoFranceClient, MeteoFranceClient
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX: str = "/public/"
+INVALID_JWT_ERROR_CODE: str = "900901"
+
+# GRIB parameter (discipline, category, number) of the indicators, the others are decoded as "unknown"
+GRIB_PARAMETERS: dict[str, tuple[int, int, int]] = {
+    "TEMPERATURE": (0, 0, 0),
+    "RELATIVE_HUMIDITY": (0, 1, 1),
+    "TOTAL_PRECIPITATION": (0, 1, 8),
+    "WIND_SPEED": (0, 2, 1),
+    "U_COMPONENT_OF_WIND": (0, 2, 2),
+    "V_COMPONENT_OF_WIND": (0, 2, 3),
+    "GEOPOTENTIAL": (0, 3, 4),
+}
+
+# Time step of the observations, by DPClim endpoint
+OBSERVATION_STEPS: dict[str, dt.timedelta] = {
+    "infrahoraire-6m": dt.timedelta(minutes=6),
+    "horaire": dt.timedelta(hours=1),
+    "quotidienne": dt.timedelta(days=1),
+    "decadaire": dt.timedelta(days=10),
+    "mensuelle": dt.timedelta(days=30),
+}
+MAX_OBSERVATIONS: int = 100_000
+
+
+class Indicator(NamedTuple):
+    """An indicator served by the stand-in.
+
+    Attributes:
+        levels: The levels of its vertical axis: heights in meters if the indicator is on height levels, pressures
+            in hPa if it is on isobaric surfaces, none for a surface.
+        intervals: Its aggregation periods ("PT1H", "P1D", ...), none for an instant indicator.
+    """
+
+    levels: tuple[int, ...] = ()
+    intervals: tuple[str, ...] = ()
+
+
+DEFAULT_INDICATORS: dict[str, Indicator] = {
+    "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND": Indicator(levels=(2, 10, 20)),
+    "RELATIVE_HUMIDITY__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND": Indicator(levels=(2,)),
+    "WIND_SPEED__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND": Indicator(levels=(10,)),
+    "TEMPERATURE__ISOBARIC_SURFACE": Indicator(levels=(500, 850)),
+    "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE": Indicator(intervals=("PT1H", "P1D")),
+}
+
+DEFAULT_FORECAST_HORIZONS: tuple[dt.timedelta, ...] = tuple(dt.timedelta(hours=hour) for hour in range(7))
+
+# Bounds of the grids: minimum and maximum latitude, minimum and maximum longitude
+FRANCE_DOMAIN: tuple[float, float, float, float] = (37.5, 55.4, -12.0, 16.0)
+
+
+def make_grib(
+    level: tuple[int, int | None] = (103, 2),
+    param: tuple[int, int, int] = (0, 0, 0),
+    template: int | None = None,
+    number: int | None = None,
+    missing: bool = False,
+    north_first: bool = True,
+    *,
+    shape: tuple[int, int] = (3, 4),
+    origin: tuple[float, float] = (45.0, 2.0),
+    increment: float = 0.01,
+    run: dt.datetime = dt.datetime(2026, 1, 1, 6),
+    step: dt.timedelta = dt.timedelta(hours=3),
+) -> bytes:
+    """Build a GRIB2 message on a regular lat/lon grid, as returned by GetCoverage.
+
+    Args:
+        level: Type and value of the level (e.g. (103, 2) for 2 m above ground, (100, 85000) for 850 hPa, (1, None)
+            for the ground).
+        param: Discipline, category and number of the parameter.
+        template: Number of the product definition template (e.g. 1 for an ensemble member).
+        number: Number of the ensemble member.
+        missing: Whether a value is missing (with a bitmap).
+        north_first: Whether the rows go from north to south.
+        shape: Number of latitudes and longitudes of the grid.
+        origin: Latitude and longitude of the north-west point of the grid.
+        increment: Distance between two points of the grid, in degrees.
+        run: Reference time of the forecast.
+        step: Forecast horizon.
+
+    Returns:
+        The GRIB message.
+    """
+    n_lat, n_long = shape
+    north, west = origin
+    south, east = round(north - (n_lat - 1) * increment, 6), round(west + (n_long - 1) * increment, 6)
+    handle = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
+    try:
+        if template is not None:
+            eccodes.codes_set(handle, "productDefinitionTemplateNumber", template)
+        eccodes.codes_set(handle, "Ni", n_long)
+        eccodes.codes_set(handle, "Nj", n_lat)
+        eccodes.codes_set(handle, "jScansPositively", 0 if north_first else 1)
+        first_lat, last_lat = (north, south) if north_first else (south, north)
+        eccodes.codes_set(handle, "latitudeOfFirstGridPointInDegrees", first_lat)
+        eccodes.codes_set(handle, "latitudeOfLastGridPointInDegrees", last_lat)
+        eccodes.codes_set(handle, "longitudeOfFirstGridPointInDegrees", west)
+        eccodes.codes_set(handle, "longitudeOfLastGridPointInDegrees", east)
+        eccodes.codes_set(handle, "iDirectionIncrementInDegrees", increment)
+        eccodes.codes_set(handle, "jDirectionIncrementInDegrees", increment)
+        eccodes.codes_set(handle, "dataDate", int(run.strftime("%Y%m%d")))
+        eccodes.codes_set(handle, "dataTime", run.hour * 100 + run.minute)
+        minutes = int(step.total_seconds()) // 60
+        if minutes % 60:
+            eccodes.codes_set(handle, "indicatorOfUnitOfTimeRange", 0)
+            eccodes.codes_set(handle, "forecastTime", minutes)
+        else:
+            eccodes.codes_set(handle, "forecastTime", minutes // 60)
+        eccodes.codes_set(handle, "typeOfFirstFixedSurface", level[0])
+        if level[1] is not None:
+            eccodes.codes_set(handle, "scaledValueOfFirstFixedSurface", level[1])
+        for key, value in zip(("discipline", "parameterCategory", "parameterNumber"), param):
+            eccodes.codes_set(handle, key, value)
+        if number is not None:
+            eccodes.codes_set(handle, "perturbationNumber", number)
+
+        values = np.arange(n_lat * n_long) % 40 + 270.25
+        if missing:
+            eccodes.codes_set(handle, "bitmapPresent", 1)
+            values[3] = eccodes.codes_get_double(handle, "missingValue")
+        eccodes.codes_set_values(handle, values)
+        return eccodes.codes_get_message(handle)
+    finally:
+        eccodes.codes_release(handle)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_grib(**kwargs: Any) -> bytes:
+    """(Protected)
+    Build a GRIB message once, see `make_grib`: the same coverages are requested again and again.
+    """
+    return make_grib(**kwargs)
+
+
+def make_png(width: int = 1, height: int = 1) -> bytes:
+    """Build a blank PNG image, as returned by the vignette of the vigilance."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    rows = b"".join(b"\x00" + b"\xff\xff\xff" * width for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+@dataclass
+class _Response:
+    """(Protected)
+    A response of the stand-in.
+    """
+
+    status: int
+    body: bytes = b""
+    content_type: str = "text/plain"
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, status: int, payload: Any) -> _Response:
+        """Build a JSON response."""
+        return cls(status, json.dumps(payload).encode(), "application/json")
+
+    @classmethod
+    def text(cls, status: int, text: str, content_type: str = "text/plain") -> _Response:
+        """Build a text response."""
+        return cls(status, text.encode(), content_type)
+
+
+@dataclass
+class _Order:
+    """(Protected)
+    An order of observations.
+    """
+
+    station_id: str
+    endpoint: str
+    start: dt.datetime
+    end: dt.datetime
+    polls: int = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """(Protected)
+    Pass the requests to the stand-in.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Answer a GET request."""
+        self._reply(self.server.portal._handle("GET", self.path, self._headers()))
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Answer a POST request."""
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._reply(self.server.portal._handle("POST", self.path, self._headers()))
+
+    def _headers(self) -> dict[str, str]:
+        """(Protected)
+        Return the headers of the request, by lowercase name.
+        """
+        return {name.lower(): value for name, value in self.headers.items()}
+
+    def _reply(self, response: _Response) -> None:
+        """(Protected)
+        Send a response.
+        """
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(response.body)))
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Log the requests at the debug level."""
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class _Server(ThreadingHTTPServer):
+    """(Protected)
+    The HTTP server of a stand-in.
+    """
+
+    daemon_threads = True
+    portal: StandInPortal
+
+
+class StandInPortal:
+    """A local stand-in for the Meteo-France portal, serving on a local HTTP server:
+        - the token endpoint (tokens valid for `token_lifetime` seconds),
+        - GetCapabilities, DescribeCoverage and GetCoverage of every model, with synthetic GRIB2 files covering the
+          requested area at `resolution`,
+        - the stations, orders and files of DPClim (a file is "not ready yet" (204) for `order_polls` polls),
+        - the bulletin, map and vignette of the vigilance.
+
+    The faults can be changed while it serves: set `latency`, `throttle_rate` or `error_rate`, or call `fail_next`
+    and `expire_tokens`.
+
+    Attributes:
+        indicators: The indicators of the capabilities.
+        runs: The runs of the capabilities, latest first.
+        forecast_horizons: The forecast horizons of the coverages.
+        resolution: Distance between two points of the GRIB files, in degrees. The size of the files grows with the
+            inverse of its square: 0.01 (the resolution of AROME) makes files of the real size.
+        domain: Minimum and maximum latitude, minimum and maximum longitude of the coverages.
+        latency: Time before answering a request of the API, in seconds.
+        throttle_rate: Probability to answer a request of the API with a 429.
+        error_rate: Probability to answer a request of the API with a 503.
+        retry_after: The `Retry-After` of the 429 responses, in seconds.
+        token_lifetime: Lifetime of the tokens, in seconds.
+        order_polls: Number of polls of an order of observations answered with a 204 (not ready yet).
+        stations_per_departement: Number of stations of each departement.
+    """
+
+    def __init__(
+        self,
+        *,
+        indicators: Mapping[str, Indicator] | None = None,
+        runs: Sequence[dt.datetime] | None = None,
+        forecast_horizons: Sequence[dt.timedelta] = DEFAULT_FORECAST_HORIZONS,
+        resolution: float = 0.25,
+        domain: tuple[float, float, float, float] = FRANCE_DOMAIN,
+        latency: float = 0.0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 1.0,
+        token_lifetime: float = 3600.0,
+        order_polls: int = 1,
+        stations_per_departement: int = 3,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize attributes.
+
+        Args:
+            indicators: The indicators of the capabilities. Defaults to `DEFAULT_INDICATORS`.
+            runs: The runs of the capabilities. Defaults to the last two runs (every 6 hours) before now.
+            forecast_horizons: The forecast horizons of the coverages. Defaults to every hour up to 6 hours.
+            resolution: Distance between two points of the GRIB files, in degrees.
+            domain: Minimum and maximum latitude, minimum and maximum longitude of the coverages.
+            latency: Time before answering a request of the API, in seconds.
+            throttle_rate: Probability to answer a request of the API with a 429.
+            error_rate: Probability to answer a request of the API with a 503.
+            retry_after: The `Retry-After` of the 429 responses, in seconds.
+            token_lifetime: Lifetime of the tokens, in seconds.
+            order_polls: Number of polls of an order of observations answered with a 204 (not ready yet).
+            stations_per_departement: Number of stations of each departement.
+            seed: The seed of the random faults.
+            host: The address to serve on.
+            port: The port to serve on. Defaults to 0 (any free port).
+        """
+        if resolution <= 0:
+            raise ValueError("Parameter `resolution` must be positive")
+        if not (0 <= throttle_rate <= 1 and 0 <= error_rate <= 1):
+            raise ValueError("Parameters `throttle_rate` and `error_rate` must be in [0, 1]")
+
+        if runs is None:
+            now = dt.datetime.now(dt.timezone.utc).replace(minute=0, second=0, microsecond=0)
+            latest = now.replace(hour=now.hour // 6 * 6)
+            runs = [latest, latest - dt.timedelta(hours=6)]
+
+        self.indicators = dict(DEFAULT_INDICATORS if indicators is None else indicators)
+        self.runs = sorted(runs, reverse=True)
+        self.forecast_horizons = list(forecast_horizons)
+        self.resolution = resolution
+        self.domain = domain
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.token_lifetime = token_lifetime
+        self.order_polls = order_polls
+        self.stations_per_departement = stations_per_departement
+        self._host = host
+        self._port = port
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._forced: deque[int] = deque()
+        self._tokens: dict[str, float] = {}
+        self._issued_tokens = 0
+        self._orders: dict[str, _Order] = {}
+        self._counts: Counter[tuple[str, int]] = Counter()
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the API (`api_base_url` of the clients)."""
+        return f"http://{self._address}{API_PREFIX}"
+
+    @property
+    def token_url(self) -> str:
+        """The URL of the token endpoint (`token_url` of the clients)."""
+        return f"http://{self._address}/token"
+
+    @property
+    def _address(self) -> str:
+        """(Protected)
+        The address and port the stand-in serves on.
+        """
+        if self._server is None:
+            raise RuntimeError("The stand-in is not started")
+        host, port = self._server.server_address[:2]
+        return f"{host!s}:{port}"
+
+    def start(self) -> StandInPortal:
+        """Start serving, in a daemon thread.
+
+        Returns:
+            The stand-in itself.
+        """
+        if self._server is not None:
+            return self
+
+        self._server = _Server((self._host, self._port), _Handler)
+        self._server.portal = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, name="meteole-stand-in", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Stand-in portal serving on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = self._thread = None
+
+    def __enter__(self) -> StandInPortal:
+        """Start serving when entering the context."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving when leaving the context."""
+        self.stop()
+
+    def client(self, **kwargs: Any) -> MeteoFranceClient:
+        """Return a client of the stand-in.
+
+        Args:
+            **kwargs: Arguments of the client. It authenticates with an API key, unless `token` or `application_id`
+                is given.
+        """
+        return MeteoFranceClient(**self._client_kwargs(kwargs))
+
+    def async_client(self, **kwargs: Any) -> AsyncMeteoFranceClient:
+        """Return an asynchronous client of the stand-in, see `client`."""
+        return AsyncMeteoFranceClient(**self._client_kwargs(kwargs))
+
+    def _client_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """(Protected)
+        Complete the arguments of a client of the stand-in.
+        """
+        if not {"api_key", "token", "application_id"} & kwargs.keys():
+            kwargs = {**kwargs, "api_key": "stand-in"}
+        return {"api_base_url": self.url, "token_url": self.token_url, **kwargs}
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """Answer the next requests of the API with an error.
+
+        Args:
+            status: The status code of the error (429, 500, 502, 503, 504, ...).
+            count: The number of requests to fail.
+        """
+        with self._lock:
+            self._forced.extend([status] * count)
+
+    def expire_tokens(self) -> None:
+        """Expire the tokens issued so far: the requests using them are answered with a 401."""
+        with self._lock:
+            self._tokens.clear()
+
+    def count(self, operation: str | None = None, status: int | None = None) -> int:
+        """Return the number of requests answered.
+
+        Args:
+            operation: Only count the requests of this operation: "token", "GetCapabilities", "DescribeCoverage",
+                "GetCoverage", "stations", "station", "order", "file", "bulletin", "map" or "vignette".
+            status: Only count the requests answered with this status code.
+        """
+        with self._lock:
+            return sum(
+                count
+                for (counted_operation, counted_status), count in self._counts.items()
+                if operation in (None, counted_operation) and status in (None, counted_status)
+            )
+
+    def _handle(self, method: str, target: str, headers: Mapping[str, str]) -> _Response:
+        """(Protected)
+        Answer a request, and count it.
+
+        Args:
+            method: The method of the request.
+            target: The path and query of the request.
+            headers: The headers of the request, by lowercase name.
+        """
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        operation, response = "unknown", _Response.text(404, f"No route for {method} {url.path}")
+        try:
+            if method == "POST" and url.path == "/token":
+                operation, response = "token", self._token(headers)
+            elif method == "GET" and url.path.startswith(API_PREFIX):
+                operation, response = self._api(url.path[len(API_PREFIX) :], query, headers)
+        except Exception as exc:
+            logger.exception(f"Error of the stand-in on {method} {target}")
+            response = _Response.text(500, f"Internal error: {exc}")
+
+        with self._lock:
+            self._counts[operation, response.status] += 1
+        return response
+
+    def _token(self, headers: Mapping[str, str]) -> _Response:
+        """(Protected)
+        Issue a token to a client authenticated with its application id.
+        """
+        if not (headers.get("authorization") or "").startswith("Basic "):
+            return _Response.json(401, {"error": "invalid_client"})
+
+        with self._lock:
+            self._issued_tokens += 1
+            token = f"stand-in-token-{self._issued_tokens}"
+            self._tokens[token] = time.time() + self.token_lifetime
+        return _Response.json(
+            200, {"access_token": token, "scope": "default", "token_type": "Bearer", "expires_in": self.token_lifetime}
+        )
+
+    def _api(self, path: str, query: dict[str, list[str]], headers: Mapping[str, str]) -> tuple[str, _Response]:
+        """(Protected)
+        Answer a request of the API, unless a fault is injected.
+
+        Returns:
+            The operation requested, and the response.
+        """
+        operation, route, match = self._route(path)
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        denied = self._authenticate(headers)
+        if denied is not None:
+            return operation, denied
+
+        with self._lock:
+            forced = self._forced.popleft() if self._forced else None
+            draw = self._random.random()
+        if forced is None and draw < self.throttle_rate:
+            forced = 429
+        elif forced is None and draw < self.throttle_rate + self.error_rate:
+            forced = 503
+        if forced == 429:
+            response = _Response.text(429, "Too Many Requests")
+            response.headers["Retry-After"] = f"{self.retry_after:g}"
+            return operation, response
+        if forced is not None:
+            return operation, _Response.text(forced, "Service unavailable")
+
+        if route is None or match is None:
+            return operation, _Response.text(404, f"No route for {path}")
+        return operation, route(match, query)
+
+    def _authenticate(self, headers: Mapping[str, str]) -> _Response | None:
+        """(Protected)
+        Check the credentials of a request of the API.
+
+        Returns:
+            None if the request is authenticated, otherwise the response denying it.
+        """
+        if headers.get("apikey"):
+            return None
+
+        authorization = headers.get("authorization") or ""
+        if not authorization.startswith("Bearer "):
+            return _Response.json(401, {"code": "900902", "message": "Missing Credentials"})
+
+        with self._lock:
+            expires_at = self._tokens.get(authorization.removeprefix("Bearer "))
+        if expires_at is None or expires_at <= time.time():
+            return _Response.json(401, {"code": INVALID_JWT_ERROR_CODE, "message": "Invalid Credentials"})
+        return None
+
+    def _route(self, path: str) -> tuple[str, Any, re.Match[str] | None]:
+        """(Protected)
+        Find the operation of a path of the API.
+
+        Returns:
+            The operation, the method answering it and the match of its path ("unknown", None and None if the path
+            is unknown).
+        """
+        routes = (
+            (r"[^/]+/[^/]+/wcs/(?P<entry_point>[^/]+)/GetCapabilities", "GetCapabilities", self._capabilities),
+            (r"[^/]+/[^/]+/wcs/(?P<entry_point>[^/]+)/DescribeCoverage", "DescribeCoverage", self._description),
+            (r"[^/]+/[^/]+/wcs/(?P<entry_point>[^/]+)/GetCoverage", "GetCoverage", self._coverage),
+            (r"DPClim/v1/liste-stations/(?P<endpoint>[^/]+)", "stations", self._stations),
+            (r"DPClim/v1/information-station", "station", self._station),
+            (r"DPClim/v1/commande-station/(?P<endpoint>[^/]+)", "order", self._order),
+            (r"DPClim/v1/commande/fichier", "file", self._file),
+            (r"DPVigilance/v1/textesvigilance/encours", "bulletin", self._bulletin),
+            (r"DPVigilance/v1/cartevigilance/encours", "map", self._map),
+            (r"DPVigilance/v1/vignettenationale-J-et-J1/encours", "vignette", self._vignette),
+        )
+        for pattern, operation, route in routes:
+            match = re.fullmatch(pattern, path)
+            if match is not None:
+                return operation, route, match
+        return "unknown", None, None
+
+    def _coverage_ids(self) -> list[str]:
+        """(Protected)
+        Return the ids of the coverages of the capabilities.
+        """
+        return [
+            f"{indicator}___{run.strftime(RUN_FORMAT)}{f'_{interval}' if interval else ''}"
+            for indicator, description in self.indicators.items()
+            for run in self.runs
+            for interval in description.intervals or ("",)
+        ]
+
+    def _find_coverage(self, coverage_id: str) -> tuple[str, Indicator, dt.datetime] | None:
+        """(Protected)
+        Find the indicator and the run of a coverage.
+
+        Returns:
+            The indicator, its description and the run, or None if the coverage doesn't exist.
+        """
+        if coverage_id not in self._coverage_ids():
+            return None
+        indicator, _, run = coverage_id.partition("___")
+        run = run.split("_")[0]
+        return indicator, self.indicators[indicator], dt.datetime.strptime(run, RUN_FORMAT)
+
+    def _capabilities(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer GetCapabilities.
+        """
+        summaries = "".join(
+            "<wcs:CoverageSummary>"
+            f"<wcs:CoverageId>{coverage_id}</wcs:CoverageId>"
+            f"<ows:Title>{coverage_id.split('___')[0].replace('_', ' ').lower()}</ows:Title>"
+            "<wcs:CoverageSubtype>ReferenceableGridCoverage</wcs:CoverageSubtype>"
+            "</wcs:CoverageSummary>"
+            for coverage_id in self._coverage_ids()
+        )
+        return _Response.text(
+            200, f"<wcs:Capabilities><wcs:Contents>{summaries}</wcs:Contents></wcs:Capabilities>", "application/xml"
+        )
+
+    def _description(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer DescribeCoverage.
+        """
+        coverage_id = query.get("coverageid", [""])[0]
+        coverage = self._find_coverage(coverage_id)
+        if coverage is None:
+            return _Response.text(404, f"Coverage {coverage_id} not found")
+
+        indicator, description, _ = coverage
+        min_lat, max_lat, min_long, max_long = self.domain
+        axes = [
+            ("lat", f"{min_lat} {max_lat}"),
+            ("long", f"{min_long} {max_long}"),
+            ("time", " ".join(str(int(horizon.total_seconds())) for horizon in self.forecast_horizons)),
+        ]
+        if description.levels:
+            axes.append(("pressure" if "ISOBARIC" in indicator else "height", " ".join(map(str, description.levels))))
+        grid_axes = "".join(
+            "<gmlrgrid:generalGridAxis><gmlrgrid:GeneralGridAxis>"
+            f"<gmlrgrid:coefficients>{coefficients}</gmlrgrid:coefficients>"
+            f"<gmlrgrid:gridAxesSpanned>{name}</gmlrgrid:gridAxesSpanned>"
+            "</gmlrgrid:GeneralGridAxis></gmlrgrid:generalGridAxis>"
+            for name, coefficients in axes
+        )
+        return _Response.text(
+            200,
+            "<wcs:CoverageDescriptions><wcs:CoverageDescription><gml:boundedBy>"
+            '<gml:EnvelopeWithTimePeriod axisLabels="lat long time">'
+            f"<gml:lowerCorner>{min_lat} {min_long} 0</gml:lowerCorner>"
+            f"<gml:upperCorner>{max_lat} {max_long} 1</gml:upperCorner>"
+            "</gml:EnvelopeWithTimePeriod></gml:boundedBy>"
+            f"<gml:domainSet><gmlrgrid:ReferenceableGridByVectors>{grid_axes}</gmlrgrid:ReferenceableGridByVectors>"
+            "</gml:domainSet></wcs:CoverageDescription></wcs:CoverageDescriptions>",
+            "application/xml",
+        )
+
+    def _coverage(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer GetCoverage with a synthetic GRIB file covering the requested area.
+        """
+        coverage_id = query.get("coverageid", [""])[0]
+        coverage = self._find_coverage(coverage_id)
+        if coverage is None:
+            return _Response.text(404, f"Coverage {coverage_id} not found")
+        indicator, description, run = coverage
+
+        subsets: dict[str, list[float]] = {}
+        for subset in query.get("subset", []):
+            name, _, values = subset.partition("(")
+            subsets[name] = [float(value) for value in values.rstrip(")").split(",")]
+
+        horizon = dt.timedelta(seconds=subsets.get("time", [-1])[0])
+        if horizon not in self.forecast_horizons:
+            return _Response.text(404, f"No data for the forecast horizon {horizon} of {coverage_id}")
+
+        level: tuple[int, int | None] = (1, None)
+        if description.levels:
+            kind = "pressure" if "ISOBARIC" in indicator else "height"
+            if kind not in subsets:
+                return _Response.text(400, f"Missing subset {kind} for {coverage_id}")
+            value = int(subsets[kind][0])
+            if value not in description.levels:
+                return _Response.text(404, f"No data for the {kind} {value} of {coverage_id}")
+            level = (100, value * 100) if kind == "pressure" else (103, value)
+
+        min_lat, max_lat, min_long, max_long = self.domain
+        south, north = subsets.get("lat", [min_lat, max_lat])
+        west, east = subsets.get("long", [min_long, max_long])
+        north, south = min(north, max_lat), max(south, min_lat)
+        west, east = max(west, min_long), min(east, max_long)
+        if south > north or west > east:
+            return _Response.text(400, f"The requested area is out of the domain of {coverage_id}")
+
+        ensemble = re.search(r"[A-Z](\d{3})-", match["entry_point"])
+        number = int(ensemble[1]) if ensemble is not None else None
+        grib = _cached_grib(
+            level=level,
+            param=GRIB_PARAMETERS.get(indicator.split("__")[0], (0, 250, 250)),
+            template=1 if number is not None else None,
+            number=number,
+            shape=(
+                int(round((north - south) / self.resolution)) + 1,
+                int(round((east - west) / self.resolution)) + 1,
+            ),
+            origin=(north, west),
+            increment=self.resolution,
+            run=run,
+            step=horizon,
+        )
+        return _Response(200, grib, "application/wmo-grib")
+
+    def _departement_stations(self, departement: str) -> list[dict[str, Any]]:
+        """(Protected)
+        Return the stations of a departement.
+        """
+        code = int(re.sub(r"\D", "", departement) or 0)
+        return [
+            {
+                "id": f"{code:02d}{index + 1:06d}",
+                "nom": f"STATION {code:02d}-{index + 1}",
+                "posteOuvert": index % 4 != 3,
+                "typePoste": index % 5,
+                "lon": round(-4.5 + code % 20 * 0.9 + index * 0.05, 4),
+                "lat": round(42.5 + code // 20 * 1.8 + index * 0.05, 4),
+                "alt": 100 + 10 * index,
+                "postePublic": True,
+            }
+            for index in range(self.stations_per_departement)
+        ]
+
+    def _stations(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer the list of the stations of a departement.
+        """
+        if match["endpoint"] not in OBSERVATION_STEPS:
+            return _Response.text(404, f"Unknown frequency {match['endpoint']}")
+        return _Response.json(200, self._departement_stations(query.get("id-departement", ["75"])[0]))
+
+    def _station(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer the information of a station.
+        """
+        station_id = query.get("id-station", [""])[0]
+        for station in self._departement_stations(station_id[:2]):
+            if station["id"] == station_id:
+                # The API returns the id as a number
+                return _Response.json(200, [{**station, "id": int(station_id)}])
+        return _Response.text(400, f"Unknown station {station_id}")
+
+    def _order(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer an order of observations with its id.
+        """
+        try:
+            order = _Order(
+                station_id=query["id-station"][0],
+                endpoint=match["endpoint"],
+                start=dt.datetime.fromisoformat(query["date-deb-periode"][0]),
+                end=dt.datetime.fromisoformat(query["date-fin-periode"][0]),
+            )
+        except (KeyError, ValueError) as exc:
+            return _Response.text(400, f"Invalid order: {exc}")
+        if order.endpoint not in OBSERVATION_STEPS or order.end < order.start:
+            return _Response.text(400, "Invalid order")
+
+        with self._lock:
+            order_id = str(len(self._orders) + 1)
+            self._orders[order_id] = order
+        return _Response.json(202, {"elaboreProduitAvecDemandeResponse": {"return": order_id}})
+
+    def _file(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer the file of an order of observations, once it is ready.
+        """
+        with self._lock:
+            order = self._orders.get(query.get("id-cmde", [""])[0])
+            if order is None:
+                return _Response.text(404, "Unknown order")
+            order.polls += 1
+            if order.polls <= self.order_polls:
+                return _Response(204)
+
+        step = OBSERVATION_STEPS[order.endpoint]
+        date_format = (
+            "%Y%m%d%H%M" if step < dt.timedelta(hours=1) else "%Y%m%d%H" if step < dt.timedelta(days=1) else "%Y%m%d"
+        )
+        lines = ["POSTE;DATE;RR1;T;U"]
+        date = order.start
+        while date <= order.end and len(lines) <= MAX_OBSERVATIONS:
+            index = len(lines) - 1
+            lines.append(
+                f"{order.station_id};{date.strftime(date_format)};{index % 3 * 0.2:.1f};{10 + index % 24 * 0.5:.1f};"
+                f"{60 + index % 30}".replace(".", ",")
+            )
+            date += step
+        return _Response.text(201, "\n".join(lines) + "\n", "text/csv")
+
+    def _bulletin(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer the vigilance bulletin.
+        """
+        return _Response.json(
+            200,
+            {
+                "product": {
+                    "text_bloc_items": [
+                        {"domain_id": "FRA", "bloc_title": "Situation générale", "text_items": ["Pas de vigilance"]}
+                    ]
+                }
+            },
+        )
+
+    def _map(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer the vigilance map.
+        """
+        periods = [
+            {
+                "echeance": echeance,
+                "per_phenomenon_items": [
+                    {
+                        "phenomenon_id": str(phenomenon_id),
+                        "any_color_count": 1,
+                        "phenomenon_counts": [{"color_id": 2, "color_name": "Jaune", "count": 1}],
+                    }
+                    for phenomenon_id in (1, 2)
+                ],
+                "timelaps.domain_ids": [{"domain_id": "75", "max_color_id": 2}],
+            }
+            for echeance in ("J", "J1")
+        ]
+        return _Response.json(200, {"product": {"periods": periods}})
+
+    def _vignette(self, match: re.Match[str], query: dict[str, list[str]]) -> _Response:
+        """(Protected)
+        Answer the vignette of the vigilance.
+        """
+        response = _Response(200, make_png(), "image/png")
+        response.headers["content-disposition"] = 'attachment; filename="vignette.png"'
+        return response
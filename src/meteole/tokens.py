@@ -0,0 +1,131 @@
+"""Persistent storage of the API tokens"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, ContextManager
+
+from meteole._storage import atomic_write, default_cache_dir, file_lock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Token:
+    """A token of the Meteo-France API.
+
+    Attributes:
+        access_token: The JWT.
+        expires_at: Expiry time, as a UNIX timestamp (None if unknown).
+    """
+
+    access_token: str
+    expires_at: float | None = None
+
+    @classmethod
+    def from_response(cls, payload: dict[str, Any]) -> Token:
+        """Build a token from the response of the token endpoint.
+
+        The expiry is read from `expires_in` if present, otherwise from the `exp` claim of the JWT.
+        """
+        access_token: str = payload["access_token"]
+        expires_in = payload.get("expires_in")
+        expires_at = time.time() + float(expires_in) if expires_in is not None else jwt_expiry(access_token)
+        return cls(access_token=access_token, expires_at=expires_at)
+
+    def expires_within(self, seconds: float) -> bool:
+        """Whether the token expires in less than `seconds` (False if the expiry is unknown)."""
+        return self.expires_at is not None and self.expires_at - time.time() <= seconds
+
+
+def jwt_expiry(token: str) -> float | None:
+    """Read the expiry (`exp` claim) of a JWT, without checking its signature.
+
+    Args:
+        token: The JWT.
+
+    Returns:
+        The expiry time as a UNIX timestamp, or None if the token isn't a JWT with an `exp` claim.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class FileTokenStore:
+    """A token cache in a JSON file, shared by all the processes of the machine.
+
+    Since requesting a token invalidates the previous one, the processes (e.g. the workers of a pipeline) should
+    share a single token rather than request one each. The store is locked while a token is refreshed, so that
+    the other processes wait for it instead of requesting another one.
+
+    Example:
+        >>> client = MeteoFranceClient(application_id="...", token_store=FileTokenStore())
+
+    Attributes:
+        path: Path of the JSON file.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Initialize attributes.
+
+        Args:
+            path: Path of the JSON file. Defaults to `tokens.json` in the meteole cache directory
+                ($XDG_CACHE_HOME/meteole or ~/.cache/meteole).
+        """
+        self.path = Path(path) if path is not None else default_cache_dir() / "tokens.json"
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+
+    @staticmethod
+    def key(application_id: str) -> str:
+        """Return the key of the tokens of an application (a hash, so that the application ID isn't stored)."""
+        return hashlib.sha256(application_id.encode()).hexdigest()[:32]
+
+    def lock(self) -> ContextManager[None]:
+        """Return a context manager holding the lock of the store, across threads and processes."""
+        return file_lock(self._lock_path)
+
+    def load(self, key: str) -> Token | None:
+        """Return the token stored for a key, if any (None if its entry is corrupted)."""
+        entry = self._read().get(key)
+        if entry is None:
+            return None
+        try:
+            token = Token(**entry)
+            if not isinstance(token.access_token, str):
+                raise TypeError(f"access_token is a {type(token.access_token).__name__}")
+            if token.expires_at is not None:
+                float(token.expires_at)
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning(f"Ignoring the corrupted token entry '{key}' of {self.path}: {exc}")
+            return None
+        return token
+
+    def save(self, key: str, token: Token) -> None:
+        """Store the token of a key. The lock should be held, so that concurrent saves aren't lost."""
+        entries = self._read()
+        entries[key] = asdict(token)
+        atomic_write(self.path, json.dumps(entries).encode())
+
+    def _read(self) -> dict[str, Any]:
+        """(Protected)
+        Read the content of the store (empty if missing or corrupted).
+        """
+        try:
+            with open(self.path, "rb") as file:
+                entries = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"Ignoring the corrupted token store {self.path}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
@@ -0,0 +1,253 @@
+"""Opt-in tracing of the stages of the requests of the forecasts"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# The innermost span of the active trace, if any
+_current: ContextVar[Span | None] = ContextVar("meteole_span", default=None)
+# Guards the children of the spans, appended to from several threads
+_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    """A timed stage, and the stages it is made of.
+
+    Attributes:
+        name: The name of the stage ("GetCoverage", "decode", ...).
+        attributes: Details of the stage: parameters of the sub-request, size of the payload, ...
+        start: Start of the stage (`time.perf_counter()`).
+        end: End of the stage (`time.perf_counter()`), None while it runs.
+        thread: The name of the thread the stage ran in.
+        children: The stages nested in this one, in their order of start.
+    """
+
+    name: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start: float = 0.0
+    end: float | None = None
+    thread: str = ""
+    children: list[Span] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Duration of the stage in seconds, so far if it still runs."""
+        return (time.perf_counter() if self.end is None else self.end) - self.start
+
+    def set(self, **attributes: Any) -> None:
+        """Add details to the stage."""
+        self.attributes.update(attributes)
+
+    def walk(self) -> Iterator[Span]:
+        """Iterate over this span and all its descendants, depth first."""
+        yield self
+        with _lock:
+            children = list(self.children)
+        for child in children:
+            yield from child.walk()
+
+    def to_dict(self, origin: float | None = None) -> dict[str, Any]:
+        """Return the span and its descendants as nested dictionaries.
+
+        Args:
+            origin: The time the offsets are relative to. Defaults to the start of this span.
+
+        Returns:
+            A dictionary with the `name`, `attributes`, `thread`, `offset` (start since `origin`) and `duration` of
+            the stage in seconds, and its `children`.
+        """
+        origin = self.start if origin is None else origin
+        with _lock:
+            children = list(self.children)
+        return {
+            "name": self.name,
+            "attributes": dict(self.attributes),
+            "thread": self.thread,
+            "offset": self.start - origin,
+            "duration": self.duration,
+            "children": [child.to_dict(origin) for child in children],
+        }
+
+
+class _NullSpan(Span):
+    """(Protected)
+    The span given when no trace is active: its details are dropped.
+    """
+
+    def set(self, **attributes: Any) -> None:
+        """Drop the details."""
+
+
+_NULL_SPAN = _NullSpan("null")
+
+
+class SpanExporter:
+    """Receives the root span of every trace it is given to (`Trace(exporters=[...])`), once it ended.
+
+    Subclass it to send the spans elsewhere (OpenTelemetry, a file, ...). See `LoggingExporter`.
+    """
+
+    def export(self, span: Span) -> None:
+        """Receive the root span of a trace.
+
+        Args:
+            span: The root span, holding the whole tree of stages.
+        """
+
+
+class LoggingExporter(SpanExporter):
+    """Log the stages of the traces, one indented line per span."""
+
+    def __init__(self, level: int = logging.INFO) -> None:
+        """Initialize attributes.
+
+        Args:
+            level: The logging level of the lines.
+        """
+        self.level = level
+
+    def export(self, span: Span, depth: int = 0) -> None:
+        """Log the span and its descendants."""
+        details = " ".join(f"{key}={value}" for key, value in span.attributes.items())
+        logger.log(self.level, f"{'  ' * depth}{span.name}: {span.duration * 1000:.1f} ms {details}".rstrip())
+        for child in span.children:
+            self.export(child, depth + 1)
+
+
+class Trace:
+    """Record the stages of the calls made in its context, in the calling thread and in the threads and tasks it
+    starts.
+
+    Tracing is off unless a trace is active: the stages then cost a lookup of a context variable.
+
+    Example:
+        >>> with Trace("temperature") as trace:
+        ...     df = arome.get_coverage("TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND", max_workers=4)
+        >>> trace.report()
+        {'name': 'temperature', 'duration': 1.92, 'children': [{'name': 'get_coverage', ...}]}
+        >>> trace.summary()
+        {'GetCoverage': {'count': 4, 'total': 5.1, 'max': 1.6}, 'decode': {...}, ...}
+
+    Attributes:
+        root: The span of the whole trace.
+        exporters: Receive the root span once the trace ended.
+    """
+
+    def __init__(self, name: str = "trace", *, exporters: Sequence[SpanExporter] = ()) -> None:
+        """Initialize attributes.
+
+        Args:
+            name: The name of the root span.
+            exporters: Receive the root span once the trace ended.
+        """
+        self.root = Span(name)
+        self.exporters = list(exporters)
+        self._token: Any = None
+
+    def __enter__(self) -> Trace:
+        """Start the trace."""
+        self.root.start = time.perf_counter()
+        self.root.thread = threading.current_thread().name
+        self._token = _current.set(self.root)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """End the trace, and export it."""
+        self.root.end = time.perf_counter()
+        _current.reset(self._token)
+        for exporter in self.exporters:
+            try:
+                exporter.export(self.root)
+            except Exception as exc:
+                logger.error(f"Error exporting the trace {self.root.name}: {exc}")
+
+    def report(self) -> dict[str, Any]:
+        """Return the timing report: the stages as nested dictionaries, see `Span.to_dict`."""
+        return self.root.to_dict()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return the count, total and maximum duration (in seconds) of the stages, per name."""
+        summary: dict[str, dict[str, float]] = {}
+        for span in self.root.walk():
+            if span is self.root:
+                continue
+            stats = summary.setdefault(span.name, {"count": 0, "total": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["total"] += span.duration
+            stats["max"] = max(stats["max"], span.duration)
+        return summary
+
+
+def current_span() -> Span:
+    """Return the innermost span of the active trace, a span dropping its details if no trace is active."""
+    return _current.get() or _NULL_SPAN
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Record a stage in the active trace, if any, nested in the current stage.
+
+    Args:
+        name: The name of the stage.
+        **attributes: Details of the stage.
+
+    Yields:
+        The span of the stage, to add details to.
+    """
+    parent = _current.get()
+    if parent is None:
+        yield _NULL_SPAN
+        return
+
+    child = Span(name, attributes, start=time.perf_counter(), thread=threading.current_thread().name)
+    with _lock:
+        parent.children.append(child)
+    token = _current.set(child)
+    try:
+        yield child
+    except BaseException as exc:
+        child.set(error=type(exc).__name__)
+        raise
+    finally:
+        child.end = time.perf_counter()
+        _current.reset(token)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Record the calls of a function (or coroutine function) as stages of the active trace, see `span`.
+
+    Args:
+        name: The name of the stage.
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,252 @@
+import asyncio
+import datetime as dt
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("httpx")
+
+from meteole._arome import AromeForecast
+from meteole.clients import AsyncMeteoFranceClient
+from meteole.errors import GenericMeteofranceApiError, MissingDataError
+
+CAPABILITIES = """
+<wcs:Capabilities>
+    <wcs:Contents>
+        <wcs:CoverageSummary>
+            <wcs:CoverageId>TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T18.00.00Z</wcs:CoverageId>
+            <ows:Title>Temperature</ows:Title>
+            <wcs:CoverageSubtype>ReferenceableGridCoverage</wcs:CoverageSubtype>
+        </wcs:CoverageSummary>
+        <wcs:CoverageSummary>
+            <wcs:CoverageId>RELATIVE_HUMIDITY__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T18.00.00Z</wcs:CoverageId>
+            <ows:Title>Relative humidity</ows:Title>
+            <wcs:CoverageSubtype>ReferenceableGridCoverage</wcs:CoverageSubtype>
+        </wcs:CoverageSummary>
+    </wcs:Contents>
+</wcs:Capabilities>
+"""
+
+DESCRIPTION = """
+<wcs:CoverageDescriptions>
+    <wcs:CoverageDescription>
+        <gml:boundedBy>
+            <gml:EnvelopeWithTimePeriod axisLabels="lat long time">
+                <gml:lowerCorner>37.5 -12 0</gml:lowerCorner>
+                <gml:upperCorner>55.4 16 1</gml:upperCorner>
+            </gml:EnvelopeWithTimePeriod>
+        </gml:boundedBy>
+        <gml:domainSet>
+            <gmlrgrid:ReferenceableGridByVectors>
+                <gmlrgrid:generalGridAxis>
+                    <gmlrgrid:GeneralGridAxis>
+                        <gmlrgrid:coefficients>0 3600 7200</gmlrgrid:coefficients>
+                        <gmlrgrid:gridAxesSpanned>time</gmlrgrid:gridAxesSpanned>
+                    </gmlrgrid:GeneralGridAxis>
+                </gmlrgrid:generalGridAxis>
+                <gmlrgrid:generalGridAxis>
+                    <gmlrgrid:GeneralGridAxis>
+                        <gmlrgrid:coefficients>2</gmlrgrid:coefficients>
+                        <gmlrgrid:gridAxesSpanned>height</gmlrgrid:gridAxesSpanned>
+                    </gmlrgrid:GeneralGridAxis>
+                </gmlrgrid:generalGridAxis>
+            </gmlrgrid:ReferenceableGridByVectors>
+        </gml:domainSet>
+    </wcs:CoverageDescription>
+</wcs:CoverageDescriptions>
+"""
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in of the Meteo-France API"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/xml"):
+        body = body.encode() if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        state = self.server.state
+        with state["lock"]:
+            state["token_requests"] += 1
+            state["valid_token"] = f"token-{state['token_requests']}"
+        self._send(200, json.dumps({"access_token": state["valid_token"]}), "application/json")
+
+    def do_GET(self):
+        state = self.server.state
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        state["paths"].append(url.path)
+
+        if self.headers.get("Authorization") not in (None, f"Bearer {state['valid_token']}"):
+            self._send(401, json.dumps({"code": "900901"}), "application/json")
+        elif url.path.endswith("/flaky") and state["paths"].count(url.path) == 1:
+            self._send(502, "Bad Gateway", "text/plain")
+        elif url.path.endswith("/missing"):
+            self._send(404, "Not Found", "text/plain")
+        elif url.path.endswith("/GetCapabilities"):
+            self._send(200, CAPABILITIES)
+        elif url.path.endswith("/DescribeCoverage"):
+            self._send(200, DESCRIPTION)
+        elif url.path.endswith("/GetCoverage"):
+            # the body echoes the requested coverage and time
+            time = [subset for subset in query["subset"] if subset.startswith("time")][0]
+            self._send(200, f"{query['coverageid'][0]}|{time}", "application/wmo-grib")
+        else:
+            self._send(200, json.dumps({"path": url.path}), "application/json")
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.state = {"lock": threading.Lock(), "token_requests": 0, "valid_token": "token-0", "paths": []}
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, **kwargs):
+    client = AsyncMeteoFranceClient(api_base_url=f"http://127.0.0.1:{server.server_port}/", **kwargs)
+    client.TOKEN_URL = f"http://127.0.0.1:{server.server_port}/token"
+    client.RETRY_DELAY_SEC = 0
+    return client
+
+
+def _fake_grib_bytes_to_df(grib_str, temp_dir=None):
+    coverage_id, time = grib_str.decode().split("|")
+    seconds = int(time[len("time(") : -1])
+    return pd.DataFrame(
+        {
+            "latitude": [45.0, 46.0],
+            "longitude": [2.0, 3.0],
+            "time": [coverage_id.split("___")[1]] * 2,
+            "step": [dt.timedelta(seconds=seconds)] * 2,
+            "heightAboveGround": [2, 2],
+            coverage_id.split("__")[0].lower(): [1.0, 2.0],
+        }
+    )
+
+
+def test_async_client_get(stub_server):
+    async def scenario():
+        async with _client(stub_server, api_key="dummy_api_key") as client:
+            resp = await client.get("some/path")
+            assert resp.status_code == 200
+            assert resp.json() == {"path": "/some/path"}
+
+            # retried after a 502
+            resp = await client.get("some/flaky")
+            assert resp.status_code == 200
+
+            with pytest.raises(MissingDataError):
+                await client.get("some/missing")
+
+            with pytest.raises(GenericMeteofranceApiError):
+                await client.get("other/flaky", max_retries=1)
+
+    asyncio.run(scenario())
+
+
+def test_async_client_token_refresh(stub_server):
+    async def scenario():
+        async with _client(stub_server, token="expired", application_id="dummy_app_id") as client:
+            responses = await asyncio.gather(*(client.get(f"path/{i}") for i in range(20)))
+            assert all(resp.status_code == 200 for resp in responses)
+            assert client._token == "token-1"
+
+    asyncio.run(scenario())
+    # concurrent refreshes of the same expired token are collapsed
+    assert stub_server.state["token_requests"] == 1
+
+
+def test_async_client_token_from_application_id(stub_server):
+    async def scenario():
+        async with _client(stub_server, application_id="dummy_app_id") as client:
+            resp = await client.get("some/path")
+            assert resp.status_code == 200
+
+    asyncio.run(scenario())
+    assert stub_server.state["token_requests"] == 1
+
+
+def test_async_client_no_credentials():
+    with pytest.raises(ValueError):
+        AsyncMeteoFranceClient()
+
+
+@patch("meteole._arome.AromeForecast._grib_bytes_to_df", side_effect=_fake_grib_bytes_to_df)
+def test_aget_coverage(mock_grib_bytes_to_df, stub_server):
+    async def scenario():
+        async with _client(stub_server, api_key="dummy_api_key") as client:
+            forecast = AromeForecast(client)
+
+            capabilities = await forecast.aget_capabilities()
+            assert len(capabilities) == 2
+
+            description = await forecast.aget_coverage_description(
+                "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T18.00.00Z"
+            )
+            assert description["heights"] == [2]
+            assert description["forecast_horizons"][-1] == dt.timedelta(hours=2)
+
+            return await forecast.aget_coverage(
+                indicator="TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+                forecast_horizons=[dt.timedelta(hours=h) for h in range(3)],
+                lat=(45.0, 46.0),
+                long=(2.0, 3.0),
+                max_concurrency=2,
+            )
+
+    df = asyncio.run(scenario())
+
+    assert list(df.columns) == ["latitude", "longitude", "run", "forecast_horizon", "temperature_2m"]
+    assert list(df["forecast_horizon"]) == [dt.timedelta(hours=h) for h in range(3) for _ in range(2)]
+    assert stub_server.state["paths"].count("/arome/1.0/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS/GetCoverage") == 3
+
+
+@patch("meteole._arome.AromeForecast._grib_bytes_to_df", side_effect=_fake_grib_bytes_to_df)
+def test_aget_combined_coverage(mock_grib_bytes_to_df, stub_server):
+    async def scenario():
+        async with _client(stub_server, api_key="dummy_api_key") as client:
+            forecast = AromeForecast(client)
+            return await forecast.aget_combined_coverage(
+                indicator_names=[
+                    "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+                    "RELATIVE_HUMIDITY__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+                ],
+                heights=[2, 2],
+                lat=(45.0, 46.0),
+                long=(2.0, 3.0),
+                forecast_horizons=[dt.timedelta(hours=1)],
+            )
+
+    df = asyncio.run(scenario())
+
+    assert list(df.columns) == [
+        "latitude",
+        "longitude",
+        "run",
+        "forecast_horizon",
+        "temperature_2m",
+        "relative_humidity_2m",
+    ]
+    assert len(df) == 2
+
+
+def test_sync_methods_need_a_sync_client(stub_server):
+    forecast = AromeForecast(_client(stub_server, api_key="dummy_api_key"))
+    with pytest.raises(TypeError):
+        forecast.get_capabilities()
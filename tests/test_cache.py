@@ -0,0 +1,424 @@
+import datetime as dt
+import os
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from meteole._arome import AromeForecast
+from meteole.cache import (
+    CacheInfo,
+    GribStore,
+    GribStoreInfo,
+    LRUCache,
+    MetadataCache,
+    MissingDataCache,
+    run_of_coverage,
+)
+from meteole.clients import MeteoFranceClient
+from meteole.errors import MissingDataError
+from meteole.testing import make_grib
+
+COVERAGE_ID = "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T18.00.00Z"
+
+CAPABILITIES = f"""
+<wcs:Capabilities>
+    <wcs:Contents>
+        <wcs:CoverageSummary>
+            <wcs:CoverageId>{COVERAGE_ID}</wcs:CoverageId>
+            <ows:Title>Temperature</ows:Title>
+            <wcs:CoverageSubtype>ReferenceableGridCoverage</wcs:CoverageSubtype>
+        </wcs:CoverageSummary>
+        <wcs:CoverageSummary>
+            <wcs:CoverageId>TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE___2024-11-01T18.00.00Z_PT1H</wcs:CoverageId>
+            <ows:Title>Total precipitation</ows:Title>
+            <wcs:CoverageSubtype>ReferenceableGridCoverage</wcs:CoverageSubtype>
+        </wcs:CoverageSummary>
+    </wcs:Contents>
+</wcs:Capabilities>
+"""
+
+DESCRIPTION = """
+<wcs:CoverageDescriptions>
+    <wcs:CoverageDescription>
+        <gml:boundedBy>
+            <gml:EnvelopeWithTimePeriod axisLabels="lat long time">
+                <gml:lowerCorner>37.5 -12 0</gml:lowerCorner>
+                <gml:upperCorner>55.4 16 1</gml:upperCorner>
+            </gml:EnvelopeWithTimePeriod>
+        </gml:boundedBy>
+        <gml:domainSet>
+            <gmlrgrid:ReferenceableGridByVectors>
+                <gmlrgrid:generalGridAxis>
+                    <gmlrgrid:GeneralGridAxis>
+                        <gmlrgrid:coefficients>0 3600 7200</gmlrgrid:coefficients>
+                        <gmlrgrid:gridAxesSpanned>time</gmlrgrid:gridAxesSpanned>
+                    </gmlrgrid:GeneralGridAxis>
+                </gmlrgrid:generalGridAxis>
+                <gmlrgrid:generalGridAxis>
+                    <gmlrgrid:GeneralGridAxis>
+                        <gmlrgrid:coefficients>2</gmlrgrid:coefficients>
+                        <gmlrgrid:gridAxesSpanned>height</gmlrgrid:gridAxesSpanned>
+                    </gmlrgrid:GeneralGridAxis>
+                </gmlrgrid:generalGridAxis>
+            </gmlrgrid:ReferenceableGridByVectors>
+        </gml:domainSet>
+    </wcs:CoverageDescription>
+</wcs:CoverageDescriptions>
+"""
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_set(tmp_path):
+    clock = Clock(1000.0)
+    cache = MetadataCache(tmp_path, clock=clock)
+    key = "arome/1.0/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS/DescribeCoverage/" + COVERAGE_ID
+
+    assert cache.get(key) is None
+    cache.set(key, {"a": [1, 2]}, ttl=60)
+    assert cache.get(key) == {"a": [1, 2]}
+    # Shared with other instances (and processes)
+    assert MetadataCache(tmp_path, clock=clock).get(key) == {"a": [1, 2]}
+    # One file per key, no temporary file left behind
+    assert [path.name for path in tmp_path.rglob("*") if path.is_file()] == [f"{COVERAGE_ID}.json"]
+
+    clock.now += 60
+    assert cache.get(key) is None
+
+    cache.set(key, "fresh", ttl=60)
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_corrupted_entry(tmp_path):
+    cache = MetadataCache(tmp_path)
+    cache.set("model/capabilities", [1], ttl=60)
+    (tmp_path / "model" / "capabilities.json").write_text('{"expires_at": ')
+
+    assert cache.get("model/capabilities") is None
+
+
+@pytest.mark.parametrize("content", ["[1, 2]", "null", '{"data": [1]}', '{"expires_at": "soon", "data": [1]}', "{}"])
+def test_malformed_entry(tmp_path, content):
+    cache = MetadataCache(tmp_path)
+    cache.set("model/capabilities", [1], ttl=60)
+    (tmp_path / "model" / "capabilities.json").write_text(content)
+
+    assert cache.get("model/capabilities") is None
+
+
+def test_capabilities_ttl(tmp_path):
+    run = dt.datetime(2024, 11, 1, 18, tzinfo=dt.timezone.utc)
+    clock = Clock(run.timestamp() + 3600)
+    cache = MetadataCache(tmp_path, capabilities_ttl=600, run_interval=3 * 3600, clock=clock)
+    coverage_ids = [COVERAGE_ID, COVERAGE_ID.replace("18.00.00Z", "15.00.00Z")]
+
+    # The next run is due in 2 hours
+    assert cache.capabilities_ttl_for(coverage_ids) == 2 * 3600
+    clock.now += 2 * 3600 - 60
+    assert cache.capabilities_ttl_for(coverage_ids) == 600
+    # The next run is late
+    clock.now += 3600
+    assert cache.capabilities_ttl_for(coverage_ids) == 600
+    assert cache.capabilities_ttl_for([]) == 600
+    assert cache.capabilities_ttl_for(["not a coverage id"]) == 600
+
+
+def test_description_ttl(tmp_path):
+    run = dt.datetime(2024, 11, 1, 18, tzinfo=dt.timezone.utc)
+    assert run_of_coverage(COVERAGE_ID) == run
+    assert run_of_coverage("TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE___2024-11-01T18.00.00Z_PT1H") == run
+    assert run_of_coverage("not a coverage id") is None
+
+    clock = Clock(run.timestamp() + 3600)
+    cache = MetadataCache(
+        tmp_path, recent_run_ttl=300, published_run_ttl=86400, publication_window=6 * 3600, clock=clock
+    )
+    # The run is being published
+    assert cache.description_ttl(COVERAGE_ID) == 300
+    clock.now += 6 * 3600
+    assert cache.description_ttl(COVERAGE_ID) == 86400
+    assert cache.description_ttl("not a coverage id") == 300
+
+
+class TestForecastMetadataCache:
+    def setup_method(self):
+        self.client = MeteoFranceClient(api_key="fake_api_key")
+
+    @staticmethod
+    def response(text):
+        response = MagicMock()
+        response.text = text
+        return response
+
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_capabilities(self, mock_get, tmp_path):
+        mock_get.return_value = self.response(CAPABILITIES)
+        cache = MetadataCache(tmp_path)
+
+        first = AromeForecast(self.client, metadata_cache=cache).capabilities
+        second = AromeForecast(self.client, metadata_cache=cache).capabilities
+
+        assert mock_get.call_count == 1
+        assert list(second["id"]) == list(first["id"])
+        assert list(second["interval"]) == ["", "PT1H"]
+
+        # Keyed by territory and precision
+        AromeForecast(self.client, precision=0.025, metadata_cache=cache).get_capabilities()
+        assert mock_get.call_count == 2
+
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_coverage_description(self, mock_get, tmp_path):
+        mock_get.return_value = self.response(DESCRIPTION)
+        cache = MetadataCache(tmp_path)
+
+        first = AromeForecast(self.client, metadata_cache=cache).get_coverage_description(COVERAGE_ID)
+        second = AromeForecast(self.client, metadata_cache=cache).get_coverage_description(COVERAGE_ID)
+
+        assert mock_get.call_count == 1
+        assert second == first
+        assert second["forecast_horizons"] == [dt.timedelta(hours=h) for h in range(3)]
+
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_no_cache(self, mock_get):
+        mock_get.return_value = self.response(DESCRIPTION)
+        forecast = AromeForecast(self.client, description_cache_size=0)
+
+        forecast.get_coverage_description(COVERAGE_ID)
+        forecast.get_coverage_description(COVERAGE_ID)
+
+        assert mock_get.call_count == 2
+
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_description_memoized(self, mock_get):
+        mock_get.side_effect = lambda path, **kwargs: self.response(
+            CAPABILITIES if path.endswith("GetCapabilities") else DESCRIPTION
+        )
+        forecast = AromeForecast(self.client)
+
+        first = forecast.get_coverage_description(COVERAGE_ID)
+        first["heights"].append(10)
+        second = forecast.get_coverage_description(COVERAGE_ID)
+
+        assert mock_get.call_count == 1
+        # Copies are returned
+        assert second["heights"] == [2]
+        assert forecast.coverage_description_cache_info() == CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+
+        # Forgotten when the capabilities are refreshed
+        forecast.refresh_capabilities()
+        forecast.get_coverage_description(COVERAGE_ID)
+        assert mock_get.call_count == 3
+        assert forecast.coverage_description_cache_info() == CacheInfo(hits=1, misses=2, maxsize=128, currsize=1)
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    # "b" is the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info() == CacheInfo(hits=3, misses=1, maxsize=2, currsize=2)
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=3, misses=1, maxsize=2, currsize=0)
+
+    disabled = LRUCache(maxsize=0)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+
+
+@pytest.mark.parametrize("key", ["../outside", "a/./b/../c"])
+def test_keys_stay_in_cache(key, tmp_path):
+    cache = MetadataCache(tmp_path / "cache")
+    cache.set(key, 1, ttl=60)
+
+    assert cache.get(key) == 1
+    assert all(tmp_path / "cache" in path.parents for path in tmp_path.rglob("*.json"))
+
+
+class TestGribStore:
+    def test_key(self):
+        params = {"coverageid": COVERAGE_ID, "subset": ["time(3600)", "lat(40,50)", "long(0,5)"]}
+        key = GribStore.key("arome/1.0/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS/GetCoverage", params)
+
+        # The order of the subsets doesn't matter
+        assert key == GribStore.key(
+            "arome/1.0/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS/GetCoverage",
+            {"subset": ["long(0,5)", "time(3600)", "lat(40,50)"], "coverageid": COVERAGE_ID},
+        )
+        assert key != GribStore.key("arome/1.0/wcs/MF-NWP-HIGHRES-AROME-0025-FRANCE-WCS/GetCoverage", params)
+        assert key != GribStore.key(
+            "arome/1.0/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS/GetCoverage", {**params, "subset": ["time(0)"]}
+        )
+
+    def test_get_put(self, tmp_path):
+        store = GribStore(tmp_path)
+
+        assert store.get("a" * 64) is None
+        store.put("a" * 64, b"GRIB-a-7777")
+        assert store.get("a" * 64) == b"GRIB-a-7777"
+        # Shared with other instances (and processes)
+        assert GribStore(tmp_path).get("a" * 64) == b"GRIB-a-7777"
+
+        source = tmp_path / "source.grib"
+        source.write_bytes(b"GRIB-b-7777")
+        store.put_file("b" * 64, source)
+        assert store.copy_to("b" * 64, tmp_path / "copy.grib")
+        assert (tmp_path / "copy.grib").read_bytes() == b"GRIB-b-7777"
+        assert not store.copy_to("c" * 64, tmp_path / "missing.grib")
+
+        assert store.info() == GribStoreInfo(hits=2, misses=2, max_bytes=GribStore.MAX_BYTES, currbytes=22, files=2)
+        # No temporary file left behind
+        assert len(list(tmp_path.rglob("*.tmp"))) == 0
+
+        store.clear()
+        assert store.get("a" * 64) is None
+
+    def test_eviction(self, tmp_path):
+        store = GribStore(tmp_path, max_bytes=25)
+        for index, key in enumerate(["a" * 64, "b" * 64]):
+            store.put(key, b"0123456789")
+            os.utime(store._file_path(key), (1000 + index, 1000 + index))
+        # "a" is now the most recently used
+        store.get("a" * 64)
+
+        store.put("c" * 64, b"0123456789")
+
+        assert store.get("b" * 64) is None
+        assert store.get("a" * 64) is not None
+        assert store.get("c" * 64) is not None
+        assert store.info().currbytes == 20
+
+        with pytest.raises(ValueError):
+            GribStore(tmp_path, max_bytes=-1)
+
+    def test_eviction_scans(self, tmp_path):
+        store = GribStore(tmp_path, max_bytes=100)
+        scans = MagicMock(side_effect=store._files)
+        store._files = scans
+
+        for index in range(9):
+            store.put(f"{index:064d}", b"0123456789")
+        # Scanned on the first write only, the size of the store is estimated afterwards
+        assert scans.call_count == 1
+
+        store.put(f"{9:064d}", b"0123456789")
+        store.put(f"{10:064d}", b"0123456789")
+        assert scans.call_count == 2
+        # Evicted down to the low-water mark, so that the next write doesn't scan the store again
+        store.put(f"{11:064d}", b"0123456789")
+        assert scans.call_count == 2
+        assert store.info().currbytes == 100
+
+        # Rescanned periodically, for the files written by the other processes
+        store = GribStore(tmp_path / "other", max_bytes=10**9)
+        store._files = scans
+        scans.reset_mock()
+        for index in range(GribStore.RESCAN_PUTS + 1):
+            store.put(f"{index:064d}", b"0")
+        assert scans.call_count == 2
+
+
+class TestForecastGribStore:
+    def setup_method(self):
+        self.client = MeteoFranceClient(api_key="fake_api_key")
+        self.request = {
+            "coverage_id": COVERAGE_ID,
+            "height": 2,
+            "pressure": None,
+            "ensemble_number": None,
+            "forecast_horizon": dt.timedelta(hours=1),
+            "lat": (37.5, 55.4),
+            "long": (-12, 16),
+        }
+
+    @pytest.mark.parametrize("stream_downloads", [False, True])
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_get_data_single_forecast(self, mock_get, stream_downloads, tmp_path):
+        grib = make_grib()
+        mock_get.return_value.content = grib
+        mock_get.return_value.iter_content.side_effect = lambda chunk_size: iter([grib])
+        store = GribStore(tmp_path)
+
+        first = AromeForecast(self.client, grib_store=store, stream_downloads=stream_downloads)
+        expected = first._get_data_single_forecast(**self.request)
+        second = AromeForecast(self.client, grib_store=store, stream_downloads=not stream_downloads)
+        df = second._get_data_single_forecast(**self.request)
+
+        assert mock_get.call_count == 1
+        pd.testing.assert_frame_equal(df, expected)
+        assert store.info().hits == 1
+
+        # Another horizon is another request
+        second._get_data_single_forecast(**{**self.request, "forecast_horizon": dt.timedelta(hours=2)})
+        assert mock_get.call_count == 2
+
+
+def test_missing_data_cache():
+    run = dt.datetime(2024, 11, 1, 18, tzinfo=dt.timezone.utc)
+    clock = Clock(run.timestamp() + 3600)
+    cache = MissingDataCache(recent_run_ttl=30, published_run_ttl=600, publication_window=6 * 3600, clock=clock)
+    error = MissingDataError("No data for this horizon")
+
+    assert cache.ttl(COVERAGE_ID) == 30
+    cache.set("key", error, ttl=cache.ttl(COVERAGE_ID))
+    remembered = cache.get("key")
+    # A copy of the original error
+    assert isinstance(remembered, MissingDataError)
+    assert remembered is not error
+    assert str(remembered) == str(error)
+
+    clock.now += 30
+    assert cache.get("key") is None
+
+    clock.now += 6 * 3600
+    assert cache.ttl(COVERAGE_ID) == 600
+    cache.set("key", error, ttl=600)
+    cache.clear()
+    assert cache.get("key") is None
+
+
+@pytest.mark.parametrize("stream_downloads", [False, True])
+@patch("meteole.clients.MeteoFranceClient.get")
+def test_forecast_missing_data_cache(mock_get, stream_downloads):
+    mock_get.side_effect = MissingDataError("No data for this horizon")
+    forecast = AromeForecast(
+        MeteoFranceClient(api_key="fake_api_key"),
+        stream_downloads=stream_downloads,
+        missing_data_cache=MissingDataCache(),
+    )
+    request = {
+        "coverage_id": COVERAGE_ID,
+        "height": 2,
+        "pressure": None,
+        "ensemble_number": None,
+        "forecast_horizon": dt.timedelta(hours=1),
+        "lat": (37.5, 55.4),
+        "long": (-12, 16),
+    }
+
+    for _ in range(3):
+        with pytest.raises(MissingDataError, match="No data for this horizon"):
+            forecast._get_data_single_forecast(**request)
+    assert mock_get.call_count == 1
+
+    # Other requests are still made
+    with pytest.raises(MissingDataError):
+        forecast._get_data_single_forecast(**{**request, "forecast_horizon": dt.timedelta(hours=2)})
+    assert mock_get.call_count == 2
@@ -0,0 +1,189 @@
+import datetime as dt
+from unittest.mock import MagicMock, patch
+from xml.parsers.expat import ExpatError
+
+import pandas as pd
+import pytest
+
+from meteole._arome import AromeForecast
+from meteole._capabilities import CapabilitiesIndex, parse_capabilities, split_coverage_ids
+from meteole.cache import MetadataCache
+from meteole.clients import MeteoFranceClient
+
+COVERAGE_IDS = [
+    "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T18.00.00Z",
+    "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE___2024-11-01T18.00.00Z_PT1H",
+    "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE___2024-11-01T18.00.00Z_PT3H",
+    "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-02T00.00.00Z",
+    "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-01T12.00.00Z",
+    "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE___2024-11-02T00.00.00Z_PT1H",
+]
+
+
+def make_document(coverage_ids):
+    summaries = "".join(
+        f"""
+        <wcs:CoverageSummary>
+            <wcs:CoverageId>{coverage_id}</wcs:CoverageId>
+            <ows:Title>Title of {coverage_id.split("___")[0].lower()} &amp; co</ows:Title>
+            <ows:WGS84BoundingBox>
+                <ows:LowerCorner>-12 37.5</ows:LowerCorner>
+                <ows:UpperCorner>16 55.4</ows:UpperCorner>
+            </ows:WGS84BoundingBox>
+            <wcs:CoverageSubtype>ReferenceableGridCoverage</wcs:CoverageSubtype>
+        </wcs:CoverageSummary>"""
+        for coverage_id in coverage_ids
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<wcs:Capabilities xmlns:wcs="http://www.opengis.net/wcs/2.0" xmlns:ows="http://www.opengis.net/ows/2.0">
+    <ows:ServiceIdentification><ows:Title>Not a coverage</ows:Title></ows:ServiceIdentification>
+    <wcs:Contents>{summaries}
+    </wcs:Contents>
+</wcs:Capabilities>
+"""
+
+
+def make_capabilities(coverage_ids):
+    return pd.DataFrame(
+        {
+            "id": coverage_ids,
+            "indicator": [coverage_id.split("___")[0] for coverage_id in coverage_ids],
+            "run": [coverage_id.split("___")[1].split("Z")[0] + "Z" for coverage_id in coverage_ids],
+            "interval": [coverage_id.split("___")[1].split("Z")[1].strip("_") for coverage_id in coverage_ids],
+        }
+    )
+
+
+def test_capabilities_index():
+    index = CapabilitiesIndex(make_capabilities(COVERAGE_IDS))
+
+    assert index.indicators == [
+        "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+        "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE",
+    ]
+    assert index.instant_indicator_set == {"TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"}
+
+    # Sorted by date, whatever the order of the capabilities
+    assert index.runs("TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND") == [
+        "2024-11-01T12.00.00Z",
+        "2024-11-01T18.00.00Z",
+        "2024-11-02T00.00.00Z",
+    ]
+    assert index.latest_run("TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE") == "2024-11-02T00.00.00Z"
+    assert index.run_time("2024-11-02T00.00.00Z") == dt.datetime(2024, 11, 2, tzinfo=dt.timezone.utc)
+
+    assert index.has_run("TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE", "2024-11-01T18.00.00Z")
+    assert not index.has_run("TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE", "2024-11-01T12.00.00Z")
+    assert not index.has_run("UNKNOWN", "2024-11-01T12.00.00Z")
+
+    assert index.intervals("TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE") == ["PT1H", "PT3H"]
+    assert index.intervals("TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE", "2024-11-02T00.00.00Z") == ["PT1H"]
+    assert index.intervals("TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND") == [""]
+
+    with pytest.raises(KeyError):
+        index.latest_run("UNKNOWN")
+
+
+class TestCoverageId:
+    def setup_method(self):
+        self.forecast = AromeForecast(MeteoFranceClient(api_key="fake_api_key"))
+        self.forecast._capabilities = make_capabilities(COVERAGE_IDS)
+
+    def test_get_coverage_id(self):
+        assert (
+            self.forecast._get_coverage_id("TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND")
+            == "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2024-11-02T00.00.00Z"
+        )
+        assert (
+            self.forecast._get_coverage_id("TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE", "2024-11-01T18.00.00Z")
+            == "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE___2024-11-01T18.00.00Z_PT1H"
+        )
+        assert (
+            self.forecast._get_coverage_id(
+                "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE", "2024-11-01T18.00.00Z", "PT3H"
+            )
+            == "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE___2024-11-01T18.00.00Z_PT3H"
+        )
+
+        for args in [
+            ("UNKNOWN",),
+            ("TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND", "2024-11-01"),
+            ("TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND", "2024-10-01T18.00.00Z"),
+            ("TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND", None, "PT1H"),
+            ("TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE", None, "P1D"),
+        ]:
+            with pytest.raises(ValueError):
+                self.forecast._get_coverage_id(*args)
+
+    def test_index_follows_capabilities(self):
+        assert self.forecast.indicators == [
+            "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+            "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE",
+        ]
+        assert self.forecast.instant_indicators == ["TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"]
+        index = self.forecast.capabilities_index
+        assert self.forecast.capabilities_index is index
+
+        self.forecast._capabilities = make_capabilities(COVERAGE_IDS[:1])
+        assert self.forecast.indicators == ["TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"]
+        assert self.forecast.capabilities_index is not index
+
+
+def test_parse_capabilities():
+    document = make_document(COVERAGE_IDS)
+
+    capabilities = parse_capabilities(document)
+
+    assert list(capabilities.columns) == ["id", "title", "subtype", "indicator", "run", "interval"]
+    pd.testing.assert_frame_equal(
+        capabilities[["indicator", "run", "interval"]],
+        make_capabilities(COVERAGE_IDS)[["indicator", "run", "interval"]],
+    )
+    assert list(capabilities["id"]) == COVERAGE_IDS
+    assert capabilities["title"][0] == "Title of temperature__specific_height_level_above_ground & co"
+    assert set(capabilities["subtype"]) == {"ReferenceableGridCoverage"}
+
+    # In chunks (split within elements)
+    encoded = document.encode()
+    chunks = [encoded[i : i + 7] for i in range(0, len(encoded), 7)]
+    pd.testing.assert_frame_equal(parse_capabilities(chunks), capabilities)
+
+    with pytest.raises(ExpatError):
+        parse_capabilities(document[:-30])
+
+
+def test_parse_capabilities_filter():
+    capabilities = parse_capabilities(
+        make_document(COVERAGE_IDS), indicators={"TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE"}
+    )
+
+    assert list(capabilities["id"]) == [coverage_id for coverage_id in COVERAGE_IDS if "PRECIPITATION" in coverage_id]
+    assert list(capabilities.index) == [0, 1, 2]
+    assert parse_capabilities(make_document(COVERAGE_IDS), indicators=set()).empty
+
+
+def test_split_coverage_ids():
+    split = split_coverage_ids(pd.Series(["A___2024-11-01T18.00.00Z_PT1H", "B___2024-11-01T18.00.00Z", "C"]))
+
+    assert split.to_dict(orient="list") == {
+        "indicator": ["A", "B", "C"],
+        "run": ["2024-11-01T18.00.00Z", "2024-11-01T18.00.00Z", "Z"],
+        "interval": ["PT1H", "", ""],
+    }
+    assert split_coverage_ids(pd.Series([], dtype=object)).empty
+
+
+@patch("meteole.clients.MeteoFranceClient.get")
+def test_capabilities_filter(mock_get, tmp_path):
+    mock_get.return_value = MagicMock(text=make_document(COVERAGE_IDS))
+    client = MeteoFranceClient(api_key="fake_api_key")
+    cache = MetadataCache(tmp_path)
+
+    filtered = AromeForecast(
+        client, capabilities_filter=["TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"], metadata_cache=cache
+    )
+    assert filtered.indicators == ["TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"]
+
+    # Not mixed up in the metadata cache
+    assert len(AromeForecast(client, metadata_cache=cache).capabilities) == len(COVERAGE_IDS)
+    assert mock_get.call_count == 2
@@ -0,0 +1,138 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from meteole.circuitbreaker import CircuitBreaker, CircuitState
+from meteole.clients import MeteoFranceClient
+from meteole.errors import CircuitOpenError, MissingDataError
+
+API = "https://public-api.meteofrance.fr/public/"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(recovery_time=0)
+
+
+def test_transitions():
+    clock = FakeClock()
+    transitions = []
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        recovery_time=30,
+        on_state_change=lambda key, old, new: transitions.append((key, old, new)),
+        clock=clock,
+    )
+
+    breaker.record_failure(API)
+    breaker.before_request(API)
+    breaker.record_failure(API)
+    assert breaker.state(API) is CircuitState.OPEN
+    # Circuits are kept per base URL
+    assert breaker.state("https://other/") is CircuitState.CLOSED
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_request(API)
+    assert exc_info.value.retry_after == 30
+
+    # A single probe once the recovery time elapsed
+    clock.now = 30
+    breaker.check(API)
+    breaker.before_request(API)
+    assert breaker.state(API) is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(API)
+
+    # The probe failed
+    breaker.record_failure(API)
+    assert breaker.state(API) is CircuitState.OPEN
+
+    clock.now = 60
+    breaker.before_request(API)
+    breaker.record_success(API)
+    assert breaker.state(API) is CircuitState.CLOSED
+    breaker.before_request(API)
+
+    assert [(old, new) for _, old, new in transitions] == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+
+
+def test_lost_probe_is_replaced():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=30, clock=clock)
+    breaker.record_failure(API)
+
+    clock.now = 30
+    breaker.before_request(API)
+    clock.now = 59
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(API)
+    clock.now = 60
+    breaker.before_request(API)
+
+
+def test_failing_listener():
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    def listener(key, old, new):
+        raise RuntimeError("bug in the listener")
+
+    breaker.add_listener(listener)
+    breaker.record_failure(API)
+
+    assert breaker.state(API) is CircuitState.OPEN
+
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_client_fails_fast(mock_get, mock_sleep):
+    breaker = CircuitBreaker(failure_threshold=3)
+    api = MeteoFranceClient(api_key="dummy_api_key", circuit_breaker=breaker)
+    unavailable = MagicMock()
+    unavailable.status_code = 503
+    mock_get.side_effect = [unavailable, requests.exceptions.ConnectionError("reset"), unavailable]
+
+    with pytest.raises(CircuitOpenError):
+        api.get("DUMMY_PATH", max_retries=5)
+    # Opened after the 3rd failure, without waiting to retry
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_count == 2
+
+    # Other callers fail fast too
+    with pytest.raises(CircuitOpenError):
+        api.get("DUMMY_PATH")
+    assert mock_get.call_count == 3
+
+
+@patch("requests.Session.get")
+def test_client_errors_close_the_circuit(mock_get):
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure(API)
+    api = MeteoFranceClient(api_key="dummy_api_key", circuit_breaker=breaker)
+    not_found = MagicMock()
+    not_found.status_code = 404
+    not_found.text = "not found"
+    mock_get.return_value = not_found
+
+    # The API answered: it is up
+    with pytest.raises(MissingDataError):
+        api.get("DUMMY_PATH")
+    breaker.record_failure(API)
+
+    assert breaker.state(API) is CircuitState.CLOSED
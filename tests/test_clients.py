@@ -1,8 +1,15 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from meteole.clients import MeteoFranceClient
+from meteole.deadline import Deadline
+from meteole.errors import DeadlineExceededError
+from meteole.ratelimit import RateLimiter
 
 
 def test_init_with_api_key():
@@ -122,3 +129,261 @@ def test_get_request_specific_error(mock_get_token, mock_get):
     assert response.status_code == 200
     assert response.json() == {"data": "some data"}
     assert mock_get.call_count == 2
+
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_get_request_too_many_requests(mock_get, mock_sleep):
+    api = MeteoFranceClient(api_key="dummy_api_key")
+
+    mock_response_429 = MagicMock()
+    mock_response_429.status_code = 429
+    mock_response_429.headers = {"Retry-After": "7"}
+    mock_response_200 = MagicMock()
+    mock_response_200.status_code = 200
+    mock_get.side_effect = [mock_response_429, mock_response_200]
+
+    response = api.get("arome/DUMMY_PATH")
+
+    assert response.status_code == 200
+    mock_sleep.assert_called_once_with(7.0)
+
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_get_request_too_many_requests_rate_limiter(mock_get, mock_sleep):
+    limiter = MagicMock(spec=RateLimiter)
+    api = MeteoFranceClient(api_key="dummy_api_key", rate_limiter=limiter)
+
+    mock_response_429 = MagicMock()
+    mock_response_429.status_code = 429
+    mock_response_429.headers = {"Retry-After": "7"}
+    mock_response_200 = MagicMock()
+    mock_response_200.status_code = 200
+    mock_get.side_effect = [mock_response_429, mock_response_200]
+
+    response = api.get("arome/DUMMY_PATH")
+
+    assert response.status_code == 200
+    # The rate limiter makes the callers wait, not the retry loop
+    limiter.penalize.assert_called_once_with("arome", 7.0)
+    assert limiter.acquire.call_count == 2
+    mock_sleep.assert_called_once_with(0.0)
+
+
+@patch("requests.Session.get")
+def test_get_request_timeouts(mock_get):
+    api = MeteoFranceClient(api_key="dummy_api_key", connect_timeout=3, read_timeout=30)
+    mock_get.return_value.status_code = 200
+
+    api.get("DUMMY_PATH")
+    assert mock_get.call_args.kwargs["timeout"] == (3, 30)
+
+    # Capped by the remaining time
+    api.get("DUMMY_PATH", deadline=Deadline(5))
+    assert mock_get.call_args.kwargs["timeout"] == (3, pytest.approx(5, abs=0.5))
+
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_get_request_read_timeout(mock_get, mock_sleep):
+    api = MeteoFranceClient(api_key="dummy_api_key")
+    api.RETRY_DELAY_SEC = 0
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_get.side_effect = [requests.exceptions.ReadTimeout(), mock_response]
+
+    assert api.get("DUMMY_PATH").status_code == 200
+    assert mock_get.call_count == 2
+
+
+def test_get_waiting_time_full_jitter():
+    api = MeteoFranceClient(api_key="dummy_api_key")
+
+    waiting_times = [api._get_waiting_time(attempt, "arome", None) for attempt in range(1, 10)]
+    for attempt, waiting_time in enumerate(waiting_times, start=1):
+        assert 0 <= waiting_time <= min(api.MAX_RETRY_DELAY_SEC, api.RETRY_DELAY_SEC * 2 ** (attempt - 1))
+
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_get_request_deadline_exceeded(mock_get, mock_sleep):
+    api = MeteoFranceClient(api_key="dummy_api_key")
+    mock_get.return_value.status_code = 502
+
+    # The deadline expires before the next attempt: no sleeping through the retries
+    with patch.object(MeteoFranceClient, "_get_waiting_time", return_value=20):
+        with pytest.raises(DeadlineExceededError):
+            api.get("DUMMY_PATH", deadline=Deadline(10))
+
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+    # Already expired
+    with pytest.raises(DeadlineExceededError):
+        api.get("DUMMY_PATH", deadline=Deadline(0))
+    assert mock_get.call_count == 1
+
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_get_request_max_total_time(mock_get, mock_sleep):
+    api = MeteoFranceClient(api_key="dummy_api_key", max_total_time=10)
+    mock_get.return_value.status_code = 502
+
+    with patch.object(MeteoFranceClient, "_get_waiting_time", return_value=20):
+        with pytest.raises(DeadlineExceededError):
+            api.get("DUMMY_PATH")
+
+    assert mock_get.call_count == 1
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.server.client_ports.add(self.client_address[1])
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def keep_alive_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.client_ports = set()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_init_invalid_pool_size():
+    with pytest.raises(ValueError):
+        MeteoFranceClient(api_key="dummy_api_key", pool_maxsize=0)
+
+
+def test_pool_stats(keep_alive_server):
+    base_url = f"http://127.0.0.1:{keep_alive_server.server_port}/"
+    with MeteoFranceClient(api_key="dummy_api_key", api_base_url=base_url, pool_maxsize=4) as api:
+        assert api.pool_stats() == {}
+
+        for _ in range(5):
+            api.get("DUMMY_PATH")
+
+        assert api.pool_stats() == {
+            f"http://127.0.0.1:{keep_alive_server.server_port}": {
+                "connections": 1,
+                "requests": 5,
+                "in_use": 0,
+                "idle": 1,
+                "maxsize": 4,
+            }
+        }
+    assert len(keep_alive_server.client_ports) == 1
+
+
+def test_no_keep_alive(keep_alive_server):
+    base_url = f"http://127.0.0.1:{keep_alive_server.server_port}/"
+    with MeteoFranceClient(api_key="dummy_api_key", api_base_url=base_url, keep_alive=False) as api:
+        for _ in range(3):
+            api.get("DUMMY_PATH")
+
+        (stats,) = api.pool_stats().values()
+        assert stats["requests"] == 3
+    assert len(keep_alive_server.client_ports) == 3
+
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_get_request_stream(mock_get, mock_sleep):
+    api = MeteoFranceClient(api_key="dummy_api_key")
+
+    error_response = MagicMock()
+    error_response.status_code = 502
+    valid_response = MagicMock()
+    valid_response.status_code = 200
+    mock_get.side_effect = [error_response, valid_response]
+
+    response = api.get("DUMMY_PATH", stream=True)
+
+    assert response is valid_response
+    assert mock_get.call_args.kwargs["stream"] is True
+    # The connection of the failed attempt is released, the successful response is left open for the caller
+    error_response.close.assert_called_once()
+    valid_response.close.assert_not_called()
+
+
+@patch("requests.Session.get")
+def test_get_request_coalesced(mock_get):
+    api = MeteoFranceClient(api_key="dummy_api_key", coalesce_requests=True)
+    started, release = threading.Event(), threading.Event()
+    valid_response = MagicMock()
+    valid_response.status_code = 200
+
+    def get(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return valid_response
+
+    mock_get.side_effect = get
+    responses = []
+    threads = [
+        threading.Thread(
+            target=lambda subset: responses.append(api.get("DUMMY_PATH", params={"subset": subset})),
+            args=(subset,),
+        )
+        for subset in (["time(0)", "lat(1,2)"], ["lat(1,2)", "time(0)"], ["lat(1,2)", "time(0)"])
+    ]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    while api.coalesced_requests < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert mock_get.call_count == 1
+    assert responses == [valid_response] * 3
+
+    # Streamed requests are never coalesced
+    api.get("DUMMY_PATH", stream=True)
+    assert mock_get.call_count == 2
+
+
+@patch("requests.Session.get")
+def test_get_request_coalesced_deadline(mock_get):
+    api = MeteoFranceClient(api_key="dummy_api_key", coalesce_requests=True)
+    started, release = threading.Event(), threading.Event()
+
+    def get(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+    mock_get.side_effect = get
+    thread = threading.Thread(target=api.get, args=("DUMMY_PATH",))
+    thread.start()
+    assert started.wait(5)
+
+    # A waiter gives up at its own deadline
+    with pytest.raises(DeadlineExceededError):
+        api.get("DUMMY_PATH", deadline=Deadline(0.01))
+    release.set()
+    thread.join()
+
+    # Requests aren't coalesced by default
+    no_coalescing = MeteoFranceClient(api_key="dummy_api_key")
+    no_coalescing.get("DUMMY_PATH")
+    assert no_coalescing.coalesced_requests == 0
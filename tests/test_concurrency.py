@@ -0,0 +1,241 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from meteole._concurrency import AsyncSingleFlight, SingleFlight, run_pipeline
+
+
+def test_run_pipeline_order():
+    calls = [{"value": value} for value in range(8)]
+
+    def fetch(value):
+        # the first calls answer last
+        time.sleep(0.002 * (len(calls) - value))
+        return value
+
+    results, errors = run_pipeline(
+        fetch, lambda payload, call: payload * 10, calls, fetch_workers=4, decode_workers=2, queue_size=2
+    )
+
+    assert results == [value * 10 for value in range(8)]
+    assert errors == []
+
+
+def test_run_pipeline_backpressure():
+    calls = [{"value": value} for value in range(10)]
+    lock = threading.Lock()
+    fetched, decoded, max_pending = [], [], [0]
+
+    def fetch(value):
+        with lock:
+            fetched.append(value)
+            max_pending[0] = max(max_pending[0], len(fetched) - len(decoded))
+        return value
+
+    def decode(payload, call):
+        time.sleep(0.01)
+        with lock:
+            decoded.append(payload)
+        return payload
+
+    results, _ = run_pipeline(fetch, decode, calls, fetch_workers=2, decode_workers=1, queue_size=2)
+
+    assert results == list(range(10))
+    # 2 payloads in the queue, 1 being decoded, 1 blocked in each fetcher
+    assert max_pending[0] <= 2 + 1 + 2
+
+
+def test_run_pipeline_errors():
+    calls = [{"value": value} for value in range(6)]
+
+    def fetch(value):
+        if value == 1:
+            raise KeyError(value)
+        return value
+
+    def decode(payload, call):
+        if payload == 3:
+            raise ValueError(payload)
+        return payload
+
+    results, errors = run_pipeline(fetch, decode, calls, fetch_workers=2, on_error="collect")
+    assert results == [0, None, 2, None, 4, 5]
+    assert [(index, type(error)) for index, error in errors] == [(1, KeyError), (3, ValueError)]
+
+    with pytest.raises(ValueError):
+        run_pipeline(fetch, decode, calls, queue_size=0)
+    with pytest.raises(ValueError):
+        run_pipeline(fetch, decode, calls, decode_workers=0)
+
+
+def test_run_pipeline_fail_fast():
+    calls = [{"value": value} for value in range(6)]
+    decoding, failing = threading.Event(), threading.Event()
+    fetched, released = [], []
+
+    def fetch(value):
+        fetched.append(value)
+        if value == 2:
+            decoding.wait(1)
+            failing.set()
+            raise KeyError(value)
+        return value
+
+    def decode(payload, call):
+        # Still decoding the first payload when the error occurs
+        decoding.set()
+        failing.wait(1)
+        time.sleep(0.05)
+        return payload
+
+    with pytest.raises(KeyError):
+        run_pipeline(fetch, decode, calls, queue_size=2, release=released.append)
+
+    # No fetch after the error, and the payload waiting in the queue is dropped
+    assert fetched == [0, 1, 2]
+    assert released == [1]
+
+
+def test_run_pipeline_release_error():
+    calls = [{"value": value} for value in range(6)]
+    errors = []
+
+    def fetch(value):
+        if value == 0:
+            # Fails while the other payloads fill the queue
+            time.sleep(0.05)
+            raise KeyError(value)
+        return value
+
+    def decode(payload, call):
+        time.sleep(0.1)
+        return payload
+
+    def release(payload):
+        raise OSError("file in use")
+
+    def run():
+        try:
+            run_pipeline(fetch, decode, calls, fetch_workers=4, release=release)
+        except KeyError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(2)
+
+    # The fetchers blocked on the full queue when the error occurred finish
+    assert not thread.is_alive()
+    assert len(errors) == 1
+
+
+def test_run_pipeline_executor():
+    calls = [{"value": value} for value in range(4)]
+    started = threading.Barrier(4, timeout=1)
+
+    def fetch(value):
+        # Passes only if the 4 fetches run concurrently
+        started.wait()
+        return value
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results, _ = run_pipeline(fetch, lambda payload, call: payload, calls, executor=executor)
+
+    assert results == [0, 1, 2, 3]
+
+
+def test_single_flight():
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(single_flight.do("key", call))) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    while single_flight.coalesced < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    # Calls made after are not coalesced
+    assert single_flight.do("key", lambda: "again") == "again"
+    assert single_flight.coalesced == 3
+
+
+def test_single_flight_error_and_timeout():
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def call():
+        started.set()
+        release.wait(5)
+        raise ValueError("failed")
+
+    errors = []
+
+    def leader():
+        try:
+            single_flight.do("key", call)
+        except ValueError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    assert started.wait(5)
+    with pytest.raises(concurrent.futures.TimeoutError):
+        single_flight.do("key", call, timeout=0.01)
+    waiter = threading.Thread(target=leader)
+    waiter.start()
+    while single_flight.coalesced < 2:
+        time.sleep(0.001)
+    release.set()
+    thread.join()
+    waiter.join()
+
+    # The same error is raised to every caller
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+
+
+def test_async_single_flight():
+    async def main():
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        leader = asyncio.ensure_future(single_flight.do("key", call))
+        await asyncio.sleep(0)
+        results = await asyncio.gather(*(single_flight.do("key", call) for _ in range(3)))
+
+        # Cancelling a caller doesn't cancel the call for the others
+        waiter = asyncio.ensure_future(single_flight.do("other", call))
+        other = asyncio.ensure_future(single_flight.do("other", call))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        return await leader, results, await other, calls, single_flight.coalesced
+
+    leader, results, other, calls, coalesced = asyncio.run(main())
+
+    assert leader == other == "result"
+    assert results == ["result"] * 3
+    assert len(calls) == 2
+    assert coalesced == 4
@@ -0,0 +1,88 @@
+import asyncio
+import datetime as dt
+import time
+
+import pytest
+
+from meteole._arome import AromeForecast
+from meteole.deadline import Deadline
+from meteole.errors import DeadlineExceededError
+from meteole.testing import StandInPortal
+
+RUN = dt.datetime(2024, 11, 1, 18)
+TEMPERATURE = "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"
+COVERAGE_ID = f"{TEMPERATURE}___2024-11-01T18.00.00Z"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_remaining():
+    clock = FakeClock()
+    deadline = Deadline(10, clock=clock)
+
+    assert deadline.remaining() == 10
+    assert not deadline.expired
+
+    clock.now = 4
+    assert deadline.remaining() == 6
+
+    clock.now = 12
+    assert deadline.remaining() == 0
+    assert deadline.expired
+
+
+def test_earliest():
+    clock = FakeClock()
+    deadline = Deadline(10, clock=clock)
+
+    assert deadline.earliest(None) is deadline
+    assert deadline.earliest(20) is deadline
+    assert deadline.earliest(5).remaining() == 5
+
+
+@pytest.fixture
+def slow_portal():
+    with StandInPortal(runs=[RUN], latency=0.5) as portal:
+        yield portal
+
+
+def test_description_within_the_deadline(slow_portal):
+    forecast = AromeForecast(slow_portal.client())
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        forecast.get_coverage(coverage_id=COVERAGE_ID, lat=45, long=2, deadline=Deadline(0.2))
+
+    # Abandoned before the first GetCoverage, without waiting for the slow DescribeCoverage
+    assert time.monotonic() - start < 0.5
+    assert slow_portal.count("GetCoverage") == 0
+
+
+def test_capabilities_within_the_deadline(slow_portal):
+    forecast = AromeForecast(slow_portal.client())
+
+    with pytest.raises(DeadlineExceededError):
+        forecast.get_combined_coverage([TEMPERATURE], heights=[2], lat=45, long=2, deadline=Deadline(0.2))
+
+    assert slow_portal.count("DescribeCoverage") == 0
+
+
+def test_async_description_within_the_deadline(slow_portal):
+    pytest.importorskip("httpx")
+
+    async def scenario():
+        async with slow_portal.async_client() as client:
+            await AromeForecast(client).aget_coverage(coverage_id=COVERAGE_ID, lat=45, long=2, deadline=Deadline(0.2))
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(scenario())
+
+    assert time.monotonic() - start < 0.5
+    assert slow_portal.count("GetCoverage") == 0
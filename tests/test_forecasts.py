@@ -1,4 +1,6 @@
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest import expectedFailure
 from unittest.mock import MagicMock, patch
 import datetime as dt
@@ -8,6 +10,7 @@ import pytest
 from meteole._arpege import ArpegeForecast
 from meteole._arome import AromeForecast
 from meteole.clients import MeteoFranceClient
+from meteole.errors import MissingDataError, PartialCoverageError
 
 
 class TestAromeForecast(unittest.TestCase):
@@ -205,6 +208,43 @@ class TestAromeForecast(unittest.TestCase):
 
         self.assertTrue("data_2m" in df.columns)
 
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_get_data_single_forecast_stream_downloads(self, mock_get):
+        chunks = [b"GRIB", b"-" * 10, b"7777"]
+        mock_get.return_value.iter_content.return_value = iter(chunks)
+
+        forecast = AromeForecast(
+            self.client,
+            precision=self.precision,
+            territory=self.territory,
+            stream_downloads=True,
+        )
+
+        paths = []
+
+        def grib_file_to_df(path):
+            paths.append(path)
+            self.assertEqual(path.read_bytes(), b"".join(chunks))
+            return pd.DataFrame({"data": [1, 2, 3]})
+
+        with patch.object(AromeForecast, "_grib_file_to_df", side_effect=grib_file_to_df):
+            df = forecast._get_data_single_forecast(
+                coverage_id="coverage_1",
+                height=None,
+                pressure=None,
+                ensemble_number=None,
+                forecast_horizon=dt.timedelta(hours=0),
+                lat=(37.5, 55.4),
+                long=(-12, 16),
+            )
+
+        self.assertTrue("data" in df.columns)
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        mock_get.return_value.iter_content.assert_called_once_with(chunk_size=forecast.DOWNLOAD_CHUNK_SIZE)
+        mock_get.return_value.close.assert_called_once()
+        # The temporary file is removed
+        self.assertFalse(paths[0].exists())
+
     def test_compute_closest_grid_points(self):
         forecast = AromeForecast(
             self.client,
@@ -273,6 +313,7 @@ class TestAromeForecast(unittest.TestCase):
             lat=(37.5, 55.4),
             long=(-12, 16),
             temp_dir=None,
+            deadline=None,
         )
 
     @patch("meteole._arome.AromeForecast.get_coverage_description")
@@ -320,12 +361,140 @@ class TestAromeForecast(unittest.TestCase):
                     lat=expected_lat,
                     long=expected_long,
                     temp_dir=None,
+                    deadline=None,
                 )
                 mock_get_data_single_forecast.reset_mock()
 
+    @patch("meteole._arome.AromeForecast.get_coverage_description")
+    @patch("meteole._arome.AromeForecast.get_capabilities")
+    @patch("meteole._arome.AromeForecast._get_data_single_forecast")
+    def test_get_coverage_max_workers(
+        self, mock_get_data_single_forecast, mock_get_capabilities, mock_get_coverage_description
+    ):
+        """Concurrent requests must give the same rows, in the same order, as sequential ones"""
+        horizons = [dt.timedelta(hours=h) for h in range(6)]
+
+        def side_effect(forecast_horizon, **kwargs):
+            # the first horizons answer last
+            time.sleep(0.01 * (len(horizons) - forecast_horizon.seconds // 3600))
+            return pd.DataFrame({"forecast_horizon": [forecast_horizon], "pressure": [kwargs["pressure"]]})
+
+        mock_get_data_single_forecast.side_effect = side_effect
+        mock_get_coverage_description.return_value = {
+            "heights": [],
+            "forecast_horizons": horizons,
+            "pressures": [500, 850],
+            "min_latitude": -90,
+            "max_latitude": 90,
+            "min_longitude": -90,
+            "max_longitude": 90,
+        }
+
+        forecast = AromeForecast(self.client, precision=self.precision, territory=self.territory)
+
+        sequential = forecast.get_coverage(coverage_id="toto", pressures=[500, 850], forecast_horizons=horizons)
+        concurrent = forecast.get_coverage(
+            coverage_id="toto", pressures=[500, 850], forecast_horizons=horizons, max_workers=4
+        )
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            injected = forecast.get_coverage(
+                coverage_id="toto", pressures=[500, 850], forecast_horizons=horizons, executor=executor
+            )
+
+        self.assertEqual(len(sequential), 12)
+        pd.testing.assert_frame_equal(sequential, concurrent)
+        pd.testing.assert_frame_equal(sequential, injected)
+
+    @patch("meteole._arome.AromeForecast.get_coverage_description")
+    @patch("meteole._arome.AromeForecast.get_capabilities")
+    @patch("meteole._arome.AromeForecast._format_single_forecast")
+    @patch("meteole._arome.AromeForecast._grib_bytes_to_df")
+    @patch("meteole._arome.AromeForecast._get_coverage_file")
+    def test_get_coverage_queue_size(
+        self,
+        mock_get_coverage_file,
+        mock_grib_bytes_to_df,
+        mock_format_single_forecast,
+        mock_get_capabilities,
+        mock_get_coverage_description,
+    ):
+        """The download/decode pipeline must give the same rows, in the same order, as sequential requests"""
+        horizons = [dt.timedelta(hours=h) for h in range(6)]
+
+        def get_coverage_file(forecast_horizon_in_seconds, **kwargs):
+            # the first horizons answer last
+            time.sleep(0.01 * (len(horizons) - forecast_horizon_in_seconds // 3600))
+            return str(forecast_horizon_in_seconds).encode()
+
+        mock_get_coverage_file.side_effect = get_coverage_file
+        mock_grib_bytes_to_df.side_effect = lambda grib, temp_dir: pd.DataFrame(
+            {"forecast_horizon": [dt.timedelta(seconds=int(grib))]}
+        )
+        mock_format_single_forecast.side_effect = lambda df, *args: df
+        mock_get_coverage_description.return_value = {
+            "heights": [],
+            "forecast_horizons": horizons,
+            "pressures": [],
+            "min_latitude": -90,
+            "max_latitude": 90,
+            "min_longitude": -90,
+            "max_longitude": 90,
+        }
+
+        forecast = AromeForecast(self.client, precision=self.precision, territory=self.territory)
+
+        sequential = forecast.get_coverage(coverage_id="toto", forecast_horizons=horizons)
+        pipelined = forecast.get_coverage(coverage_id="toto", forecast_horizons=horizons, max_workers=3, queue_size=2)
+
+        self.assertEqual(list(sequential["forecast_horizon"]), horizons)
+        pd.testing.assert_frame_equal(sequential, pipelined)
+
+    @patch("meteole._arome.AromeForecast.get_coverage_description")
+    @patch("meteole._arome.AromeForecast.get_capabilities")
+    @patch("meteole._arome.AromeForecast._get_data_single_forecast")
+    def test_get_coverage_on_error(self, mock_get_data_single_forecast, mock_get_capabilities, mock_get_coverage_description):
+        horizons = [dt.timedelta(hours=h) for h in range(4)]
+
+        def side_effect(forecast_horizon, **kwargs):
+            if forecast_horizon == dt.timedelta(hours=2):
+                raise MissingDataError("not yet published")
+            return pd.DataFrame({"forecast_horizon": [forecast_horizon]})
+
+        mock_get_data_single_forecast.side_effect = side_effect
+        mock_get_coverage_description.return_value = {
+            "heights": [],
+            "forecast_horizons": horizons,
+            "pressures": [],
+            "min_latitude": -90,
+            "max_latitude": 90,
+            "min_longitude": -90,
+            "max_longitude": 90,
+        }
+
+        forecast = AromeForecast(self.client, precision=self.precision, territory=self.territory)
+
+        for max_workers in (None, 2):
+            with self.assertRaises(MissingDataError):
+                forecast.get_coverage(coverage_id="toto", forecast_horizons=horizons, max_workers=max_workers)
+
+            with self.assertRaises(PartialCoverageError) as ctx:
+                forecast.get_coverage(
+                    coverage_id="toto", forecast_horizons=horizons, max_workers=max_workers, on_error="collect"
+                )
+            self.assertEqual(len(ctx.exception.errors), 1)
+            self.assertEqual(ctx.exception.errors[0][0]["forecast_horizon"], dt.timedelta(hours=2))
+            self.assertIsInstance(ctx.exception.errors[0][1], MissingDataError)
+            self.assertEqual(
+                list(ctx.exception.partial_result["forecast_horizon"]),
+                [dt.timedelta(hours=0), dt.timedelta(hours=1), dt.timedelta(hours=3)],
+            )
+
+        with self.assertRaises(ValueError):
+            forecast.get_coverage(coverage_id="toto", forecast_horizons=horizons, on_error="ignore")
+
     @patch("meteole._arome.AromeForecast.get_coverage_description")
     def test_get_forecast_horizons(self, mock_get_coverage_description):
-        def side_effect(coverage_id):
+        def side_effect(coverage_id, deadline=None):
             if coverage_id == "id1":
                 return {
                     "forecast_horizons": [dt.timedelta(hours=0), dt.timedelta(hours=1), dt.timedelta(hours=2)],
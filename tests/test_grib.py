@@ -0,0 +1,166 @@
+import datetime as dt
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+import xarray as xr
+
+from meteole._arome import AromeForecast
+from meteole._grib import GribColumns, grib_to_df
+from meteole.clients import MeteoFranceClient
+from meteole.forecast import _decode_grib
+from meteole.testing import make_grib
+
+
+def cfgrib_to_df(grib, tmp_path):
+    path = tmp_path / "coverage.grib"
+    path.write_bytes(grib)
+    with xr.open_dataset(path, engine="cfgrib", indexpath="") as ds:
+        return ds.to_dataframe().reset_index()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"level": (1, None), "param": (0, 1, 8)},
+        {"level": (100, 85000)},
+        {"template": 1, "number": 5},
+        {"missing": True},
+        {"north_first": False},
+        {"param": (0, 250, 250)},
+    ],
+    ids=["height", "surface", "pressure", "ensemble", "missing", "south_first", "unknown_parameter"],
+)
+def test_grib_to_df_same_as_cfgrib(kwargs, tmp_path):
+    grib = make_grib(**kwargs)
+    expected = cfgrib_to_df(grib, tmp_path)
+
+    pd.testing.assert_frame_equal(grib_to_df(grib), expected)
+    pd.testing.assert_frame_equal(grib_to_df(tmp_path / "coverage.grib"), expected)
+
+
+def test_grib_to_df_unsupported(tmp_path):
+    grib = make_grib() + make_grib(level=(100, 85000))
+    assert grib_to_df(grib) is None
+
+    path = tmp_path / "coverage.grib"
+    path.write_bytes(grib)
+    assert grib_to_df(path) is None
+
+    assert grib_to_df(b"") is None
+    assert grib_to_df(b"<xml>not a GRIB file</xml>") is None
+
+
+def test_grib_to_df_truncated(tmp_path):
+    # Truncated, with the length of the message and the end marker fixed up, so that only eccodes can tell
+    grib = make_grib()
+    truncated = bytearray(grib[:-64] + b"7777")
+    truncated[8:16] = len(truncated).to_bytes(8, "big")
+    assert grib_to_df(bytes(truncated)) is None
+
+    path = tmp_path / "coverage.grib"
+    path.write_bytes(truncated)
+    assert grib_to_df(path) is None
+
+    path.write_bytes(grib + grib[: len(grib) // 2])
+    assert grib_to_df(path) is None
+
+
+class TestGribBytesToDf:
+    def setup_method(self):
+        self.forecast = AromeForecast(MeteoFranceClient(api_key="fake_api_key"))
+
+    def test_in_memory(self, tmp_path):
+        grib = make_grib()
+
+        with patch("tempfile.mkdtemp") as mock_mkdtemp:
+            df = self.forecast._grib_bytes_to_df(grib)
+
+        mock_mkdtemp.assert_not_called()
+        pd.testing.assert_frame_equal(df, cfgrib_to_df(grib, tmp_path))
+
+    def test_cfgrib_fallback(self, tmp_path):
+        grib = make_grib(param=(0, 1, 8)) + make_grib(level=(100, 85000))
+        assert grib_to_df(grib) is None
+        temp_dir = tmp_path / "temp"
+
+        df = self.forecast._grib_bytes_to_df(grib, temp_dir=str(temp_dir))
+
+        assert {"heightAboveGround", "isobaricInhPa"}.issubset(df.columns)
+        assert len(df) == 12
+        # No file (nor index file) is left behind
+        assert not temp_dir.exists()
+
+
+def test_decode_grib(tmp_path):
+    grib = make_grib(template=1, number=4)
+    path = tmp_path / "coverage.grib"
+    path.write_bytes(grib)
+
+    for source in (grib, path):
+        columns = _decode_grib(source)
+        assert isinstance(columns, GribColumns)
+        pd.testing.assert_frame_equal(columns.to_df(), cfgrib_to_df(grib, tmp_path))
+
+    # Decoded with cfgrib
+    df = _decode_grib(make_grib(param=(0, 1, 8)) + make_grib(level=(100, 85000)), temp_dir=str(tmp_path / "temp"))
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) == 12
+
+
+class TestDecodeWorkers:
+    def setup_method(self):
+        self.forecast = AromeForecast(MeteoFranceClient(api_key="fake_api_key"))
+
+    @patch("meteole._arome.AromeForecast._get_coverage_file")
+    @patch("meteole._arome.AromeForecast.get_coverage_description")
+    @patch("meteole._arome.AromeForecast.get_capabilities")
+    def test_get_coverage(self, mock_get_capabilities, mock_get_coverage_description, mock_get_coverage_file):
+        mock_get_coverage_description.return_value = {
+            "heights": [2],
+            "forecast_horizons": [dt.timedelta(hours=3), dt.timedelta(hours=4)],
+            "pressures": [],
+            "min_latitude": -90,
+            "max_latitude": 90,
+            "min_longitude": -90,
+            "max_longitude": 90,
+        }
+        mock_get_coverage_file.side_effect = [make_grib(), make_grib(param=(0, 1, 8)) + make_grib()] * 2
+        kwargs = {
+            "coverage_id": "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2026-01-01T06.00.00Z",
+            "heights": [2],
+            "forecast_horizons": [dt.timedelta(hours=3), dt.timedelta(hours=4)],
+            "max_workers": 2,
+        }
+
+        expected = self.forecast.get_coverage(**kwargs)
+        df = self.forecast.get_coverage(**kwargs, decode_workers=2)
+
+        pd.testing.assert_frame_equal(df, expected)
+        assert len(df) == 24
+
+    @patch("meteole._arome.AromeForecast._get_coverage_file")
+    def test_decode_executor(self, mock_get_coverage_file):
+        mock_get_coverage_file.return_value = make_grib()
+        kwargs = {
+            "coverage_id": "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND___2026-01-01T06.00.00Z",
+            "height": 2,
+            "pressure": None,
+            "ensemble_number": None,
+            "forecast_horizon": dt.timedelta(hours=3),
+            "lat": (37.5, 55.4),
+            "long": (-12, 16),
+        }
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            df = self.forecast._get_data_single_forecast(**kwargs, decode_executor=pool)
+            # The executor is left open
+            assert pool.submit(abs, -1).result() == 1
+
+        pd.testing.assert_frame_equal(df, self.forecast._get_data_single_forecast(**kwargs))
+
+    def test_invalid_decode_workers(self):
+        with pytest.raises(ValueError), self.forecast._decode_pool(0, None):
+            pass
@@ -0,0 +1,148 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from meteole.clients import MeteoFranceClient
+from meteole.hedging import HedgingPolicy, HedgingStats
+from meteole.ratelimit import RateLimiter
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=0)
+    with pytest.raises(ValueError):
+        HedgingPolicy(max_extra_ratio=-1)
+    with pytest.raises(ValueError):
+        HedgingPolicy(window=0)
+
+
+def test_delay():
+    policy = HedgingPolicy(percentile=90, min_delay=0.05, window=10, min_samples=5)
+
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        policy.record(latency)
+    # Not enough latencies
+    assert policy.delay() is None
+
+    for latency in (0.5, 0.6, 0.7, 0.8, 0.9, 1.0):
+        policy.record(latency)
+    assert policy.delay() == pytest.approx(0.9)
+
+    # Only the recent latencies count
+    for _ in range(10):
+        policy.record(0.01)
+    assert policy.delay() == 0.05
+
+
+def test_cap():
+    policy = HedgingPolicy(max_extra_ratio=0.1)
+
+    for _ in range(19):
+        policy.delay()
+    assert policy.acquire()
+    assert not policy.acquire()
+    policy.delay()
+    assert policy.acquire()
+
+    assert policy.stats() == HedgingStats(requests=20, hedges=2, hedge_wins=0)
+
+
+@patch("requests.Session.get")
+def test_client_hedges_slow_requests(mock_get):
+    policy = HedgingPolicy(percentile=50, max_extra_ratio=1, min_delay=0.01, min_samples=1)
+    policy.record(0.01)
+    api = MeteoFranceClient(api_key="dummy_api_key", hedging=policy)
+    release = threading.Event()
+    slow_response, fast_response = MagicMock(status_code=200), MagicMock(status_code=200)
+
+    def get(*args, **kwargs):
+        if mock_get.call_count == 1:
+            release.wait(5)
+            return slow_response
+        return fast_response
+
+    mock_get.side_effect = get
+    try:
+        response = api.get("DUMMY_PATH")
+    finally:
+        release.set()
+
+    assert response is fast_response
+    assert mock_get.call_count == 2
+    assert policy.stats() == HedgingStats(requests=1, hedges=1, hedge_wins=1)
+    api.close()
+
+
+@patch("requests.Session.get")
+def test_client_hedges_within_the_cap(mock_get):
+    policy = HedgingPolicy(max_extra_ratio=0, min_delay=0, min_samples=1)
+    policy.record(0.0)
+    api = MeteoFranceClient(api_key="dummy_api_key", hedging=policy)
+    mock_get.return_value = MagicMock(status_code=200)
+
+    api.get("DUMMY_PATH")
+    # Streamed requests are never hedged
+    api.get("DUMMY_PATH", stream=True)
+
+    assert mock_get.call_count == 2
+    assert policy.stats() == HedgingStats(requests=1, hedges=0, hedge_wins=0)
+    api.close()
+
+
+@pytest.mark.parametrize("burst, hedges", [(1, 0), (2, 1)])
+@patch("requests.Session.get")
+def test_client_hedges_within_the_rate_limit(mock_get, burst, hedges):
+    policy = HedgingPolicy(percentile=50, max_extra_ratio=1, min_delay=0.01, min_samples=1)
+    policy.record(0.01)
+    # A token for the request, and with a burst of 2 one for the hedge
+    limiter = RateLimiter(1, burst=burst)
+    api = MeteoFranceClient(api_key="dummy_api_key", hedging=policy, rate_limiter=limiter)
+
+    def get(*args, **kwargs):
+        time.sleep(0.05)
+        return MagicMock(status_code=200)
+
+    mock_get.side_effect = get
+    api.get("DUMMY_PATH")
+
+    assert mock_get.call_count == 1 + hedges
+    assert policy.stats().hedges == hedges
+    api.close()
+
+
+@patch("requests.Session.get")
+def test_hedging_keeps_the_concurrency(mock_get):
+    # Armed, but never slow enough to hedge
+    policy = HedgingPolicy(min_delay=10, min_samples=1)
+    policy.record(0.0)
+    api = MeteoFranceClient(api_key="dummy_api_key", hedging=policy, pool_maxsize=16)
+    # The requests only return once 16 of them are in flight
+    barrier = threading.Barrier(16, timeout=5)
+    lock = threading.Lock()
+    in_flight, peak, threads = 0, 0, set()
+
+    def get(*args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            threads.add(threading.current_thread())
+        barrier.wait()
+        with lock:
+            in_flight -= 1
+        return MagicMock(status_code=200)
+
+    mock_get.side_effect = get
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        list(executor.map(lambda index: api.get("DUMMY_PATH", params={"index": index}), range(32)))
+
+    # At least as many requests in flight as pooled connections, at most one per thread of the pool
+    assert mock_get.call_count == 32
+    assert 16 <= peak <= 16 + MeteoFranceClient.MAX_CONCURRENT_HEDGES
+    # Sent from the threads of the pool, not from a new thread per request
+    assert len(threads) <= 16 + MeteoFranceClient.MAX_CONCURRENT_HEDGES
+    assert policy.stats() == HedgingStats(requests=32, hedges=0, hedge_wins=0)
+    api.close()
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+import meteole
+
+
+def loaded_modules(statement):
+    """Run an import statement in a new interpreter, and return the heavy dependencies it loaded."""
+    code = (
+        f"import sys\n{statement}\n"
+        "print(' '.join(name for name in ('matplotlib', 'xarray', 'eccodes', 'pandas') if name in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        ("import meteole", set()),
+        ("from meteole import Vigilance", {"pandas"}),
+        ("from meteole import DPClim", {"pandas"}),
+        ("from meteole import AromeForecast", {"pandas", "eccodes"}),
+        ("import meteole.cache, meteole.clients, meteole.errors", set()),
+    ],
+)
+def test_import_loads_only_what_is_needed(statement, expected):
+    assert loaded_modules(statement) == expected
+
+
+def test_lazy_attributes():
+    from meteole._vigilance import Vigilance
+
+    assert meteole.Vigilance is Vigilance
+    assert meteole.cache.GribStore is not None
+    assert isinstance(meteole.__version__, str)
+    assert set(meteole.__all__) <= set(dir(meteole))
+    with pytest.raises(AttributeError):
+        meteole.Unknown  # noqa: B018
@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from meteole.clients import MeteoFranceClient
+from meteole.errors import MissingDataError
+from meteole.metrics import Instrumentation, MetricsCollector, RequestMetrics
+
+
+def test_collector():
+    collector = MetricsCollector(buckets=(0.1, 1.0))
+    collector.record_request(RequestMetrics("arome", status=200, latency=0.05, bytes_received=100, attempts=1))
+    collector.record_request(
+        RequestMetrics("arome", status=200, latency=1.0, bytes_received=50, attempts=3, backoff_time=2.5)
+    )
+    collector.record_request(RequestMetrics("DPClim", error="ConnectionError", latency=5.0, attempts=1))
+
+    snapshot = collector.snapshot()
+
+    assert snapshot["arome"]["requests"] == {"200": 2}
+    assert snapshot["arome"]["latency_buckets"] == {0.1: 1, 1.0: 2, float("inf"): 2}
+    assert snapshot["arome"]["bytes_received"] == 150
+    assert snapshot["arome"]["retries"] == 2
+    assert snapshot["arome"]["backoff_time"] == 2.5
+    assert snapshot["DPClim"]["requests"] == {"error": 1}
+    assert snapshot["DPClim"]["latency_buckets"] == {0.1: 0, 1.0: 0, float("inf"): 1}
+
+    with pytest.raises(ValueError):
+        MetricsCollector(buckets=(1.0, 0.1))
+
+
+def test_prometheus_text():
+    collector = MetricsCollector(buckets=(0.1, 1.0))
+    collector.record_request(RequestMetrics("arome", status=200, latency=0.05, bytes_received=100, attempts=2))
+
+    lines = collector.prometheus_text().splitlines()
+
+    assert "# TYPE meteole_requests_total counter" in lines
+    assert 'meteole_requests_total{family="arome",status="200"} 1' in lines
+    assert "# TYPE meteole_request_duration_seconds histogram" in lines
+    assert 'meteole_request_duration_seconds_bucket{family="arome",le="0.1"} 1' in lines
+    assert 'meteole_request_duration_seconds_bucket{family="arome",le="+Inf"} 1' in lines
+    assert 'meteole_request_duration_seconds_count{family="arome"} 1' in lines
+    assert 'meteole_response_bytes_total{family="arome"} 100' in lines
+    assert 'meteole_retries_total{family="arome"} 1' in lines
+
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_client_reports_requests(mock_get, mock_sleep):
+    recorded = []
+
+    class Recorder(Instrumentation):
+        def record_request(self, metrics):
+            recorded.append(metrics)
+
+    api = MeteoFranceClient(api_key="dummy_api_key", instrumentation=Recorder())
+    unavailable = MagicMock(status_code=503)
+    valid_response = MagicMock(status_code=200, content=b"GRIB-7777")
+    not_found = MagicMock(status_code=404, text="not found")
+    mock_get.side_effect = [unavailable, valid_response, not_found]
+
+    api.get("arome/1.0/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS/GetCoverage")
+    with pytest.raises(MissingDataError):
+        api.get("DPClim/v1/commande-station/horaire")
+
+    assert len(recorded) == 2
+    assert recorded[0].family == "arome"
+    assert recorded[0].status == 200
+    assert recorded[0].error is None
+    assert recorded[0].attempts == 2
+    assert recorded[0].retries == 1
+    assert recorded[0].backoff_time == mock_sleep.call_args.args[0]
+    assert recorded[0].bytes_received == 9
+    assert recorded[0].latency >= 0
+    assert (recorded[1].family, recorded[1].status, recorded[1].error) == ("DPClim", 404, "MissingDataError")
+
+
+@patch("requests.Session.get")
+def test_failing_instrumentation(mock_get):
+    class Failing(Instrumentation):
+        def record_request(self, metrics):
+            raise RuntimeError("bug in the instrumentation")
+
+    api = MeteoFranceClient(api_key="dummy_api_key", instrumentation=Failing())
+    mock_get.return_value = MagicMock(status_code=200)
+
+    assert api.get("DUMMY_PATH").status_code == 200
@@ -0,0 +1,112 @@
+import datetime as dt
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from meteole.ratelimit import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_family():
+    assert RateLimiter.family("arome/1.0/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS/GetCoverage") == "arome"
+    assert RateLimiter.family("/DPClim/v1/liste-stations/horaire") == "DPClim"
+
+
+def test_invalid_burst():
+    with pytest.raises(ValueError):
+        RateLimiter(60, burst=0)
+
+
+def test_reserve_spreads_requests():
+    clock = FakeClock()
+    limiter = RateLimiter(60, clock=clock)
+
+    assert limiter._reserve("arome") == 0
+    assert limiter._reserve("arome") == pytest.approx(1)
+    assert limiter._reserve("arome") == pytest.approx(2)
+
+    # Families have their own buckets
+    assert limiter._reserve("arpege") == 0
+
+    clock.now = 10
+    assert limiter._reserve("arome") == 0
+
+
+def test_reserve_burst_and_per_family():
+    clock = FakeClock()
+    limiter = RateLimiter(60, per_family={"DPClim": 30}, burst=3, clock=clock)
+
+    assert [limiter._reserve("arome") for _ in range(4)] == [0, 0, 0, pytest.approx(1)]
+    assert [limiter._reserve("DPClim") for _ in range(4)] == [0, 0, 0, pytest.approx(2)]
+
+
+def test_unlimited():
+    limiter = RateLimiter(clock=FakeClock())
+    assert all(limiter._reserve("arome") == 0 for _ in range(100))
+
+
+def test_penalize():
+    clock = FakeClock()
+    limiter = RateLimiter(60, burst=5, clock=clock)
+
+    limiter.penalize("arome", 30)
+    # Waiting callers are released one by one after the penalty
+    assert limiter._reserve("arome") == pytest.approx(31)
+    assert limiter._reserve("arome") == pytest.approx(32)
+    assert limiter._reserve("arpege") == 0
+
+    clock.now = 40
+    assert limiter._reserve("arome") == 0
+
+
+def test_penalize_unlimited():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+
+    limiter.penalize("arome", 30)
+    assert limiter._reserve("arome") == pytest.approx(30)
+    assert limiter._reserve("arome") == pytest.approx(30)
+
+    clock.now = 30
+    assert limiter._reserve("arome") == 0
+
+
+@patch("meteole.ratelimit.time.sleep")
+def test_acquire(mock_sleep):
+    limiter = RateLimiter(60, clock=FakeClock())
+
+    assert limiter.acquire("arome") == 0
+    assert limiter.acquire("arome") == pytest.approx(1)
+    mock_sleep.assert_called_once_with(pytest.approx(1))
+
+
+@patch("meteole.ratelimit.time.sleep")
+def test_try_acquire(mock_sleep):
+    limiter = RateLimiter(60, clock=FakeClock())
+
+    assert limiter.try_acquire("arome") == 0
+    # No token is taken when the wait is too long
+    assert limiter.try_acquire("arome") is None
+    assert limiter.try_acquire("arome", max_wait=0.5) is None
+    assert limiter.try_acquire("arome", max_wait=1) == pytest.approx(1)
+    mock_sleep.assert_called_once_with(pytest.approx(1))
+    assert limiter._reserve("arome") == pytest.approx(2)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("-1") == 0
+
+    date = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=60)
+    assert parse_retry_after(format_datetime(date, usegmt=True)) == pytest.approx(60, abs=2)
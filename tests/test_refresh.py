@@ -0,0 +1,123 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from meteole._arome import AromeForecast
+from meteole.clients import MeteoFranceClient
+from meteole.refresh import CapabilitiesRefresher
+
+TEMPERATURE = "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"
+PRECIPITATION = "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE"
+
+
+def make_response(coverage_ids):
+    summaries = "".join(
+        f"<wcs:CoverageSummary><wcs:CoverageId>{coverage_id}</wcs:CoverageId></wcs:CoverageSummary>"
+        for coverage_id in coverage_ids
+    )
+    response = MagicMock()
+    response.text = f"<wcs:Capabilities><wcs:Contents>{summaries}</wcs:Contents></wcs:Capabilities>"
+    return response
+
+
+FIRST = make_response([f"{TEMPERATURE}___2024-11-01T18.00.00Z", f"{PRECIPITATION}___2024-11-01T18.00.00Z_PT1H"])
+SECOND = make_response(
+    [
+        f"{TEMPERATURE}___2024-11-01T18.00.00Z",
+        f"{TEMPERATURE}___2024-11-02T00.00.00Z",
+        f"{PRECIPITATION}___2024-11-01T18.00.00Z_PT1H",
+        f"{PRECIPITATION}___2024-11-02T00.00.00Z_PT1H",
+        f"{PRECIPITATION}___2024-11-02T03.00.00Z_PT1H",
+    ]
+)
+
+
+class TestCapabilitiesRefresher:
+    def setup_method(self):
+        self.client = MeteoFranceClient(api_key="fake_api_key")
+
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_refresh(self, mock_get):
+        mock_get.side_effect = [FIRST, SECOND, SECOND]
+        forecast = AromeForecast(self.client)
+        new_runs = []
+        refresher = CapabilitiesRefresher(forecast, on_new_run=lambda run, indicators: new_runs.append((run, indicators)))
+
+        # Baseline
+        assert refresher.refresh() == []
+        assert forecast.capabilities_index.runs(TEMPERATURE) == ["2024-11-01T18.00.00Z"]
+
+        assert refresher.refresh() == ["2024-11-02T00.00.00Z", "2024-11-02T03.00.00Z"]
+        assert new_runs == [
+            ("2024-11-02T00.00.00Z", [TEMPERATURE, PRECIPITATION]),
+            ("2024-11-02T03.00.00Z", [PRECIPITATION]),
+        ]
+        assert forecast.capabilities_index.latest_run(PRECIPITATION) == "2024-11-02T03.00.00Z"
+        assert forecast.capabilities_index.source is forecast.capabilities
+
+        assert refresher.refresh() == []
+
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_loaded_capabilities_are_the_baseline(self, mock_get):
+        mock_get.side_effect = [FIRST, SECOND]
+        forecast = AromeForecast(self.client)
+        forecast.get_capabilities()
+
+        assert CapabilitiesRefresher(forecast).refresh() == ["2024-11-02T00.00.00Z", "2024-11-02T03.00.00Z"]
+
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_failures_keep_the_previous_capabilities(self, mock_get):
+        mock_get.side_effect = [FIRST, ConnectionError("down"), SECOND]
+        forecast = AromeForecast(self.client)
+        refresher = CapabilitiesRefresher(forecast)
+
+        def failing_callback(run, indicators):
+            raise RuntimeError("bug in the callback")
+
+        refresher.add_callback(failing_callback)
+        refresher.refresh()
+        capabilities = forecast.capabilities
+
+        with pytest.raises(ConnectionError):
+            refresher.refresh()
+        assert forecast.capabilities is capabilities
+
+        # The callbacks' errors are ignored
+        assert refresher.refresh() == ["2024-11-02T00.00.00Z", "2024-11-02T03.00.00Z"]
+
+    @patch("meteole.clients.MeteoFranceClient.get")
+    def test_readers_are_not_blocked(self, mock_get):
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def get(path, **kwargs):
+            if mock_get.call_count == 1:
+                return FIRST
+            fetching.set()
+            release.wait(5)
+            return SECOND
+
+        mock_get.side_effect = get
+        forecast = AromeForecast(self.client)
+        forecast.get_capabilities()
+
+        with CapabilitiesRefresher(forecast, interval=3600) as refresher:
+            assert fetching.wait(5)
+            assert refresher.running
+            # The refresh in progress doesn't block the readers, who see the previous capabilities
+            assert forecast.capabilities_index.runs(TEMPERATURE) == ["2024-11-01T18.00.00Z"]
+            assert len(forecast.capabilities) == 2
+            release.set()
+            for _ in range(500):
+                if len(forecast.capabilities) == 5:
+                    break
+                threading.Event().wait(0.01)
+            assert forecast.capabilities_index.latest_run(TEMPERATURE) == "2024-11-02T00.00.00Z"
+
+        assert not refresher.running
+        assert mock_get.call_count == 2
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            CapabilitiesRefresher(AromeForecast(self.client), interval=0)
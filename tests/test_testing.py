@@ -0,0 +1,141 @@
+import asyncio
+import datetime as dt
+from unittest.mock import patch
+
+import pytest
+
+from meteole._arome import AromeForecast
+from meteole._arome_ensemble import AromePEForecast
+from meteole._dpclim import DPClim
+from meteole._vigilance import Vigilance
+from meteole.errors import GenericMeteofranceApiError
+from meteole.testing import Indicator, StandInPortal
+
+RUN = dt.datetime(2024, 11, 1, 18)
+TEMPERATURE = "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND"
+
+
+@pytest.fixture
+def portal():
+    with StandInPortal(runs=[RUN], seed=0) as portal:
+        yield portal
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        StandInPortal(resolution=0)
+    with pytest.raises(ValueError):
+        StandInPortal(error_rate=2)
+
+
+def test_forecast(portal):
+    forecast = AromeForecast(portal.client())
+
+    assert set(forecast.indicators) == set(portal.indicators)
+    assert forecast.get_coverage_description(f"{TEMPERATURE}___2024-11-01T18.00.00Z")["heights"] == [2, 10, 20]
+
+    df = forecast.get_coverage(
+        TEMPERATURE,
+        heights=[2],
+        forecast_horizons=[dt.timedelta(hours=1), dt.timedelta(hours=2)],
+        lat=(44.0, 45.0),
+        long=(2.0, 3.0),
+        max_workers=2,
+    )
+
+    # A 5x5 grid at a resolution of 0.25 degree, for each horizon
+    assert len(df) == 50
+    assert list(df.columns) == ["latitude", "longitude", "run", "forecast_horizon", "t_2m"]
+    assert set(df["forecast_horizon"]) == {dt.timedelta(hours=1), dt.timedelta(hours=2)}
+    assert (df["run"] == RUN).all()
+    assert portal.count("GetCoverage", status=200) == 2
+
+    # Only the horizons given to the portal are available
+    with pytest.raises(ValueError):
+        forecast.get_coverage(TEMPERATURE, heights=[2], forecast_horizons=[dt.timedelta(hours=12)], lat=45, long=2)
+
+
+def test_ensemble_members(portal):
+    forecast = AromePEForecast(portal.client())
+
+    df = forecast.get_coverage(TEMPERATURE, heights=[2], ensemble_numbers=[0, 3], lat=45, long=2)
+
+    assert list(df["ensemble_number"]) == [0, 3]
+
+
+def test_resolution():
+    indicators = {"TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE": Indicator(intervals=("PT1H",))}
+    with StandInPortal(runs=[RUN], indicators=indicators, resolution=0.01) as portal:
+        df = AromeForecast(portal.client()).get_coverage(
+            "TOTAL_PRECIPITATION__GROUND_OR_WATER_SURFACE", lat=(44.0, 45.0), long=(2.0, 3.0)
+        )
+
+    assert len(df) == 101 * 101
+    assert "tp" in df.columns
+
+
+@patch("time.sleep")
+def test_faults(mock_sleep, portal):
+    client = portal.client(application_id="dummy_app_id")
+    forecast = AromeForecast(client)
+    forecast.get_capabilities()
+
+    portal.expire_tokens()
+    portal.fail_next(503)
+    portal.fail_next(429)
+    portal.retry_after = 7
+    forecast.get_coverage(TEMPERATURE, heights=[2], forecast_horizons=[dt.timedelta(hours=1)], lat=45, long=2)
+
+    assert portal.count("token") == 2
+    assert portal.count(status=401) == 1
+    assert portal.count(status=503) == 1
+    assert portal.count(status=429) == 1
+    assert 7 in [call.args[0] for call in mock_sleep.call_args_list]
+
+    portal.throttle_rate = 1
+    with pytest.raises(GenericMeteofranceApiError):
+        client.get("DPVigilance/v1/cartevigilance/encours", max_retries=2)
+
+
+@patch("time.sleep")
+def test_observations(mock_sleep, portal):
+    portal.order_polls = 2
+    observations = DPClim(portal.client())
+
+    stations = observations.get_stations(75, add_neighbours=False)
+    assert len(stations) == 3
+    assert observations.get_station_info(stations[0]["id"])["id"] == stations[0]["id"]
+
+    df = observations.fetch_data(stations[0]["id"], "2024-11-01T00:00:00Z", "2024-11-01T05:00:00Z", wait_for_file=0)
+
+    assert len(df) == 6
+    assert df["T"].dtype == float
+    # The file wasn't ready for the first 2 polls
+    assert portal.count("file", status=204) == 2
+    assert portal.count("file", status=201) == 1
+
+
+def test_vigilance(portal):
+    vigilance = Vigilance(portal.client())
+
+    assert vigilance.get_bulletin()["product"]["text_bloc_items"]
+    df_phenomenon, df_timelaps = vigilance.get_phenomenon()
+    assert list(df_phenomenon["echeance"]) == ["J", "J", "J1", "J1"]
+    assert len(df_timelaps) == 2
+    assert portal.client().get("DPVigilance/v1/vignettenationale-J-et-J1/encours").content.startswith(b"\x89PNG")
+
+
+def test_async_client(portal):
+    pytest.importorskip("httpx")
+
+    async def scenario():
+        async with portal.async_client(application_id="dummy_app_id") as client:
+            forecast = AromeForecast(client)
+            return await forecast.aget_coverage(
+                TEMPERATURE, heights=[2], forecast_horizons=[dt.timedelta(hours=1)], lat=45, long=2
+            )
+
+    df = asyncio.run(scenario())
+
+    assert len(df) == 1
+    assert portal.count("token") == 1
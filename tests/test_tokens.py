@@ -0,0 +1,127 @@
+import base64
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from meteole.clients import MeteoFranceClient
+from meteole.tokens import FileTokenStore, Token, jwt_expiry
+
+
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+def _token_response(access_token, expires_in=3600):
+    response = MagicMock()
+    response.json.return_value = {"access_token": access_token, "expires_in": expires_in}
+    return response
+
+
+def test_jwt_expiry():
+    assert jwt_expiry(_jwt(1700000000)) == 1700000000
+    assert jwt_expiry("not a jwt") is None
+    assert jwt_expiry("a.b.c") is None
+
+
+def test_token_from_response():
+    token = Token.from_response({"access_token": "dummy_token", "expires_in": 3600})
+    assert token.access_token == "dummy_token"
+    assert token.expires_at == pytest.approx(time.time() + 3600, abs=5)
+    assert not token.expires_within(60)
+    assert token.expires_within(4000)
+
+    token = Token.from_response({"access_token": _jwt(1700000000)})
+    assert token.expires_at == 1700000000
+
+    assert not Token("dummy_token").expires_within(60)
+
+
+def test_file_token_store(tmp_path):
+    store = FileTokenStore(tmp_path / "tokens.json")
+    key = store.key("dummy_app_id")
+    assert "dummy_app_id" not in key
+    assert store.load(key) is None
+
+    with store.lock():
+        store.save(key, Token("dummy_token", 1700000000))
+        store.save(store.key("other_app_id"), Token("other_token"))
+
+    assert FileTokenStore(tmp_path / "tokens.json").load(key) == Token("dummy_token", 1700000000)
+
+    (tmp_path / "tokens.json").write_text("{corrupted")
+    assert store.load(key) is None
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        "dummy_token",
+        {"token": "dummy_token"},
+        {"access_token": "dummy_token", "expires_at": 1700000000, "refresh_token": "dummy"},
+        {"access_token": 42},
+        {"access_token": "dummy_token", "expires_at": "soon"},
+    ],
+)
+def test_file_token_store_corrupted_entry(tmp_path, entry):
+    store = FileTokenStore(tmp_path / "tokens.json")
+    key = store.key("dummy_app_id")
+    (tmp_path / "tokens.json").write_text(json.dumps({key: entry}))
+
+    assert store.load(key) is None
+
+
+@patch("requests.post")
+def test_token_store_shared_by_clients(mock_post, tmp_path):
+    mock_post.side_effect = [_token_response("token-1"), _token_response("token-2")]
+    store = FileTokenStore(tmp_path / "tokens.json")
+
+    api_1 = MeteoFranceClient(application_id="dummy_app_id", token_store=store)
+    api_2 = MeteoFranceClient(application_id="dummy_app_id", token_store=store)
+
+    # The second client reuses the token of the first one instead of invalidating it
+    assert api_1._token == api_2._token == "token-1"
+    assert mock_post.call_count == 1
+
+    # A token rejected by the API isn't reused
+    api_2._token_expired = True
+    assert api_2._get_token() == "token-2"
+    assert store.load(store.key("dummy_app_id")).access_token == "token-2"
+
+
+@patch("requests.Session.get")
+@patch("requests.post")
+def test_proactive_token_refresh(mock_post, mock_get):
+    mock_post.side_effect = [_token_response("token-1", expires_in=30), _token_response("token-2")]
+    mock_get.return_value.status_code = 200
+
+    api = MeteoFranceClient(application_id="dummy_app_id")
+    assert api._token == "token-1"
+
+    # The token expires in less than TOKEN_REFRESH_MARGIN_SEC: refreshed before the request
+    api.get("DUMMY_PATH")
+    assert api._token == "token-2"
+    assert api._session.headers["Authorization"] == "Bearer token-2"
+
+    api.get("DUMMY_PATH")
+    assert mock_post.call_count == 2
+
+
+@patch("requests.post")
+def test_concurrent_token_refreshes_are_collapsed(mock_post):
+    mock_post.side_effect = [_token_response("token-1"), _token_response("token-2"), _token_response("token-3")]
+    api = MeteoFranceClient(application_id="dummy_app_id")
+
+    # "token-1" is rejected by the API
+    api._token_expired = True
+    threads = [threading.Thread(target=api._refresh_token, args=("token-1",)) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert api._token == "token-2"
+    assert mock_post.call_count == 2
@@ -0,0 +1,117 @@
+import asyncio
+import datetime as dt
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from meteole._arome import AromeForecast
+from meteole.clients import MeteoFranceClient
+from meteole.testing import make_grib
+from meteole.tracing import LoggingExporter, SpanExporter, Trace, current_span, span, traced
+from tests.test_cache import COVERAGE_ID, DESCRIPTION
+
+
+def test_spans():
+    exported = []
+
+    class Recorder(SpanExporter):
+        def export(self, span):
+            exported.append(span)
+
+    with Trace("test", exporters=[Recorder()]) as trace:
+        with span("fetch", url="DUMMY_PATH") as stage:
+            stage.set(bytes=10)
+            with span("parse"):
+                pass
+        with pytest.raises(RuntimeError), span("fetch"):
+            raise RuntimeError("failed")
+
+    report = trace.report()
+    assert report["name"] == "test"
+    assert [child["name"] for child in report["children"]] == ["fetch", "fetch"]
+    first, second = report["children"]
+    assert first["attributes"] == {"url": "DUMMY_PATH", "bytes": 10}
+    assert [child["name"] for child in first["children"]] == ["parse"]
+    assert second["attributes"] == {"error": "RuntimeError"}
+    assert 0 <= first["offset"] <= second["offset"] <= report["duration"]
+
+    summary = trace.summary()
+    assert summary["fetch"]["count"] == 2
+    assert summary["parse"]["count"] == 1
+    assert exported == [trace.root]
+
+
+def test_no_active_trace():
+    @traced("noop")
+    def func():
+        current_span().set(ignored=True)
+        return 1
+
+    with span("noop") as stage:
+        stage.set(ignored=True)
+        assert func() == 1
+    assert stage.attributes == {}
+
+
+def test_logging_exporter(caplog):
+    with caplog.at_level(logging.INFO, logger="meteole.tracing"):
+        with Trace("test", exporters=[LoggingExporter()]), span("fetch", bytes=10):
+            pass
+
+    assert caplog.messages[0].startswith("test: ")
+    assert caplog.messages[1].startswith("  fetch: ")
+    assert caplog.messages[1].endswith(" ms bytes=10")
+
+
+def get(path, **kwargs):
+    response = MagicMock()
+    response.text = DESCRIPTION
+    response.content = make_grib()
+    return response
+
+
+@patch("meteole.clients.MeteoFranceClient.get", side_effect=get)
+def test_get_coverage(mock_get):
+    forecast = AromeForecast(MeteoFranceClient(api_key="fake_api_key"))
+
+    with Trace() as trace:
+        forecast.get_coverage(
+            coverage_id=COVERAGE_ID,
+            forecast_horizons=[dt.timedelta(hours=1), dt.timedelta(hours=2)],
+            lat=(44.98, 45.0),
+            long=(2.0, 2.03),
+            max_workers=2,
+        )
+
+    (coverage,) = trace.report()["children"]
+    assert coverage["name"] == "get_coverage"
+    assert coverage["attributes"] == {"coverage_id": COVERAGE_ID, "requests": 2}
+    stages = [child["name"] for child in coverage["children"]]
+    assert stages[0] == "DescribeCoverage"
+    # Recorded in the threads making the requests
+    assert sorted(stages[1:]) == ["GetCoverage", "GetCoverage", "concat", "decode", "decode", "format", "format"]
+    downloads = [child for child in coverage["children"] if child["name"] == "GetCoverage"]
+    assert {download["attributes"]["forecast_horizon"] for download in downloads} == {
+        dt.timedelta(hours=1),
+        dt.timedelta(hours=2),
+    }
+    assert all(download["attributes"]["bytes"] == len(make_grib()) for download in downloads)
+    assert all(download["thread"].startswith("meteole") for download in downloads)
+
+
+def test_aget_coverage():
+    forecast = AromeForecast(MeteoFranceClient(api_key="fake_api_key"))
+
+    async def aget(path, params=None, deadline=None):
+        return get(path)
+
+    async def main():
+        with Trace() as trace:
+            await forecast.aget_coverage(coverage_id=COVERAGE_ID, lat=(44.98, 45.0), long=(2.0, 2.03))
+        return trace
+
+    with patch.object(forecast, "_aget", side_effect=aget):
+        trace = asyncio.run(main())
+
+    assert set(trace.summary()) == {"get_coverage", "DescribeCoverage", "GetCoverage", "decode", "format", "concat"}